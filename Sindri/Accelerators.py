@@ -0,0 +1,105 @@
+import numpy as np
+
+acceleration_options = ["none", "GDEM", "Anderson"]
+
+
+class Accelerator:
+    """
+    Acceleration of a fixed-point iteration x <- g(x), usually on ln(K).
+
+    The solvers call update(x, gx) once per iteration with the current iterate and
+    g(x), and continue from the returned value. This base class is plain successive
+    substitution.
+    """
+
+    def __init__(self):
+        self.accelerated_steps = 0
+
+    def update(self, x, gx):
+        return gx
+
+
+class GDEMAccelerator(Accelerator):
+    """
+    Dominant eigenvalue method (Crowe and Nishio, 1975), as used by Michelsen for the
+    successive substitution of ln(K).
+
+    Every `period` iterations the last two steps estimate the dominant eigenvalue
+    lambda of the iteration, and the step is extrapolated by lambda / (1 - lambda).
+    """
+
+    def __init__(self, period: int = 5, max_factor: float = 50.0):
+        super().__init__()
+        self.period = period
+        self.max_factor = max_factor
+        self.count = 0
+        self.last_step = None
+
+    def update(self, x, gx):
+        step = gx - x
+        last_step, self.last_step = self.last_step, step
+        self.count += 1
+        if last_step is None or self.count % self.period != 0:
+            return gx
+
+        den = np.dot(step, last_step)
+        if den == 0.0:
+            return gx
+        lam = np.dot(step, step) / den
+        if not 0.0 < lam < 1.0:
+            return gx
+        self.accelerated_steps += 1
+        # the extrapolated step isn't a substitution step, so it's not used for the
+        # next estimate
+        self.last_step = None
+        return gx + step * min(lam / (1.0 - lam), self.max_factor)
+
+
+class AndersonAccelerator(Accelerator):
+    """
+    Anderson mixing, mixing the last `depth` iterates by the least-squares
+    combination of their residuals g(x) - x.
+    """
+
+    def __init__(self, depth: int = 5):
+        super().__init__()
+        self.depth = depth
+        self.last_x = None
+        self.last_gx = None
+        self.dx = []
+        self.df = []
+
+    def update(self, x, gx):
+        f = gx - x
+        if self.last_x is not None:
+            self.dx.append(gx - self.last_gx)
+            self.df.append(f - (self.last_gx - self.last_x))
+            if len(self.dx) > self.depth:
+                self.dx.pop(0)
+                self.df.pop(0)
+        self.last_x, self.last_gx = x, gx
+        if not self.dx:
+            return gx
+
+        try:
+            coefs = np.linalg.lstsq(np.array(self.df).T, f, rcond=None)[0]
+        except np.linalg.LinAlgError:
+            coefs = None
+        if coefs is None or not np.all(np.isfinite(coefs)):
+            # restart from plain substitution
+            self.dx.clear()
+            self.df.clear()
+            return gx
+        ret = gx - np.array(self.dx).T @ coefs
+        self.accelerated_steps += 1
+        return ret
+
+
+def createAccelerator(method: str) -> Accelerator:
+    if method == "none":
+        return Accelerator()
+    elif method == "GDEM":
+        return GDEMAccelerator()
+    elif method == "Anderson":
+        return AndersonAccelerator()
+    raise ValueError("Unknown acceleration method: {}".format(method))
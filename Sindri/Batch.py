@@ -0,0 +1,301 @@
+"""
+Batch calculations on a mixture system file (.sndr), without the graphical interface.
+
+The cases come from a csv file with a "job" column and any of the columns "P" (Pa),
+"T" (K) and "z_1" to "z_n" (molar fractions, the ones of the system file by
+default). The jobs are:
+
+- "state": properties of the liquid and vapor roots at P and T, as in the mixture
+  calculations window (reference state given by Pref and Tref).
+- "flash": P-T-z flash.
+- "bubbleP", "dewP": saturation pressure at T; "bubbleT", "dewT": saturation
+  temperature at P.
+
+    python Batch.py system.sndr cases.csv --output results.csv
+"""
+import argparse
+import csv
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import Models.LiquidModel as LiquidModel
+import db
+from Factories.EOSMixFactory import createEOSMix, getEOSMixOptions
+from SystemFile import readSystemFile
+from compounds import SubstanceProp
+
+batch_jobs = ["state", "flash", "bubbleP", "dewP", "bubbleT", "dewT"]
+
+# inputs each job needs besides the composition
+_job_inputs = {
+    "state": ("P", "T"),
+    "flash": ("P", "T"),
+    "bubbleP": ("T",),
+    "dewP": ("T",),
+    "bubbleT": ("P",),
+    "dewT": ("P",),
+}
+
+# compositions whose sum is off by more than this are rejected, the others normalized
+z_tolerance = 1e-3
+
+_state_props = ["Z", "V", "rho", "H", "S", "G", "U", "A", "Cp", "Cv", "w", "mu_JT"]
+
+# equation of state of a worker process, set by _initWorker
+_worker = {}
+
+
+def readCases(filename: str, y) -> list:
+    """
+    Reads the cases of a csv file as (job, P, T, z) tuples. P or T not needed by the
+    job may be missing (nan), and a missing composition is y. Compositions are
+    normalized to sum exactly 1, as the solvers require.
+
+    Raises ValueError on a line with an unknown job, without the P or T its job
+    needs, or with a composition that doesn't sum 1 within z_tolerance.
+    """
+    n = len(y)
+    cases = []
+    with open(filename, "r", newline="") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            row = {key.strip(): value.strip() for key, value in row.items()}
+            job = row["job"]
+            if job not in batch_jobs:
+                raise ValueError(
+                    "Line {}: unknown batch job: {}".format(reader.line_num, job)
+                )
+            P = float(row.get("P") or np.nan)
+            T = float(row.get("T") or np.nan)
+            for name, value in (("P", P), ("T", T)):
+                if name in _job_inputs[job] and not np.isfinite(value):
+                    raise ValueError(
+                        "Line {}: {} needs {}".format(reader.line_num, job, name)
+                    )
+            if row.get("z_1"):
+                z = np.array([float(row["z_{}".format(i + 1)]) for i in range(n)])
+            else:
+                z = np.array(y, dtype=np.float64)
+            try:
+                z = normalizeComposition(z)
+            except ValueError as e:
+                raise ValueError("Line {}: {}".format(reader.line_num, e))
+            cases.append((job, P, T, z))
+    return cases
+
+
+def normalizeComposition(z) -> np.ndarray:
+    """
+    z scaled to sum exactly 1.0, the residue of the rounding going to one of its
+    largest fractions. Raises ValueError if z has negative or non-finite fractions
+    or if its sum is off by more than z_tolerance.
+    """
+    z = np.array(z, dtype=np.float64)
+    if not np.all(np.isfinite(z)) or np.any(z < 0):
+        raise ValueError("invalid composition {}".format(z))
+    if abs(np.sum(z) - 1.0) > z_tolerance:
+        raise ValueError("composition sums {}, not 1".format(np.sum(z)))
+    z /= np.sum(z)
+    if np.sum(z) == 1.0:
+        return z
+    # the residue may be lost when added to some fractions, so try the next ones
+    for i in np.argsort(-z):
+        w = z.copy()
+        for _ in range(3):
+            residue = 1.0 - np.sum(w)
+            if residue == 0.0:
+                return w
+            w[i] += residue
+    raise ValueError("composition {} can't be normalized".format(z))
+
+
+def getColumns(n: int) -> list:
+    """
+    Columns of the results of a system of n components. x and y are the liquid and
+    vapor compositions, v is the vapor fraction.
+    """
+    columns = ["case", "job", "P", "T"]
+    columns += ["z_{}".format(i + 1) for i in range(n)]
+    columns += ["v"]
+    columns += ["x_{}".format(i + 1) for i in range(n)]
+    columns += ["y_{}".format(i + 1) for i in range(n)]
+    columns += ["iterations"]
+    for phase in ("liq", "vap"):
+        columns += ["{}_{}".format(prop, phase) for prop in _state_props]
+    columns += ["error"]
+    return columns
+
+
+def runBatch(
+    substances,
+    k,
+    eosname: str,
+    cases: list,
+    vle_method: str = "phi-phi",
+    Pref: float = 1e5,
+    Tref: float = 300.0,
+    processes: int = None,
+    chunksize: int = 16,
+):
+    """
+    Runs the cases (see readCases) in a pool of processes, each one with its own
+    mixture, built once from the substances, k and the UNIFAC tables of this
+    process. With processes=1 everything runs in this process.
+
+    Yields the result of each case, in order, as a dict with the keys of getColumns.
+    A case that fails has its message in "error" and nan in the results.
+    """
+    if eosname not in getEOSMixOptions():
+        raise ValueError("Unknown equation of state: {}".format(eosname))
+
+    initargs = (
+        substances,
+        k,
+        eosname,
+        vle_method,
+        Pref,
+        Tref,
+        LiquidModel.get_unifac_tables(),
+    )
+    indexed = [(i,) + tuple(case) for i, case in enumerate(cases)]
+    if processes == 1:
+        _initWorker(*initargs)
+        yield from map(_runCase, indexed)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=processes, initializer=_initWorker, initargs=initargs
+        ) as pool:
+            yield from pool.map(_runCase, indexed, chunksize=chunksize)
+
+
+def writeResults(results, filename: str, n: int) -> int:
+    """
+    Writes the results of runBatch to a csv file as they come, or to a npz file
+    (one array per column) at the end. Returns the number of cases that failed.
+    """
+    columns = getColumns(n)
+    failures = 0
+    if filename.endswith(".npz"):
+        table = {key: [] for key in columns}
+        for result in results:
+            failures += bool(result["error"])
+            for key in columns:
+                table[key].append(result[key])
+        np.savez(filename, **{key: np.array(v) for key, v in table.items()})
+        return failures
+
+    with open(filename, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        for result in results:
+            failures += bool(result["error"])
+            writer.writerow(result)
+    return failures
+
+
+def _initWorker(substances, k, eosname, vle_method, Pref, Tref, unifac_tables):
+    LiquidModel._unifac_tables = unifac_tables
+    eos = createEOSMix(substances, eosname, k)
+    eos.setVLEmethod(vle_method)
+    _worker["eos"] = eos
+    _worker["ref"] = (Pref, Tref)
+
+
+def _runCase(case) -> dict:
+    i, job, P, T, z = case
+    eos = _worker["eos"]
+    n = eos.n
+    result = dict.fromkeys(getColumns(n), np.nan)
+    result.update(case=i, job=job, P=P, T=T, error="")
+    for j in range(n):
+        result["z_{}".format(j + 1)] = z[j]
+
+    try:
+        if job == "state":
+            _state(eos, result, z, P, T)
+        elif job == "flash":
+            x, y, v, phivap, philiq, kvec, ite = eos.getFlash(z, P, T)
+            _setPhases(result, x, y, v, ite)
+        elif job == "bubbleP":
+            y, result["P"], phivap, philiq, kvec, ite = eos.getBubblePointPressure(z, T)
+            _setPhases(result, z, y, 0.0, ite)
+        elif job == "dewP":
+            x, result["P"], phivap, philiq, kvec, ite = eos.getDewPointPressure(z, T)
+            _setPhases(result, x, z, 1.0, ite)
+        elif job == "bubbleT":
+            y, result["T"], phivap, philiq, kvec, ite = eos.getBubblePointTemperature(
+                z, P
+            )
+            _setPhases(result, z, y, 0.0, ite)
+        else:
+            x, result["T"], phivap, philiq, kvec, ite = eos.getDewPointTemperature(z, P)
+            _setPhases(result, x, z, 1.0, ite)
+    except Exception as e:
+        # some failures (assertions) have no message
+        result["error"] = str(e) or type(e).__name__
+    return result
+
+
+def _setPhases(result: dict, x, y, v: float, ite: int):
+    result["v"] = v
+    result["iterations"] = ite
+    for j in range(len(x)):
+        result["x_{}".format(j + 1)] = x[j]
+        result["y_{}".format(j + 1)] = y[j]
+
+
+def _state(eos, result: dict, z, P: float, T: float):
+    Pref, Tref = _worker["ref"]
+    propsliq, propsvap = eos.getAllProps(z, Tref, T, Pref, P)
+    for phase, props in (("liq", propsliq), ("vap", propsvap)):
+        values = {"Z": props.Z, "V": props.V, "rho": props.rho}
+        # missing Cp parameters leave the enthalpy-like properties as 0
+        if props.Props != 0:
+            delta = props.Props
+            values.update(H=delta.H, S=delta.S, G=delta.G, U=delta.U, A=delta.A)
+        if props.DerivativeProps != 0:
+            der = props.DerivativeProps
+            values.update(
+                Cp=der.Cp, Cv=der.Cv, w=der.SoundSpeed, mu_JT=der.JouleThomson
+            )
+        for prop, value in values.items():
+            result["{}_{}".format(prop, phase)] = value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Batch calculations on a mixture system file."
+    )
+    parser.add_argument("system", help="mixture system file (.sndr)")
+    parser.add_argument("cases", help="csv file with the cases")
+    parser.add_argument("--output", required=True, help="csv or npz file")
+    parser.add_argument("--eos", default="Peng and Robinson (1976)")
+    parser.add_argument("--vle-method", default="phi-phi")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--Pref", type=float, default=1e5, help="Pa")
+    parser.add_argument("--Tref", type=float, default=300.0, help="K")
+    args = parser.parse_args(argv)
+
+    db.init()
+    names, formulas, y, k = readSystemFile(args.system)
+    substances = [SubstanceProp(*subs) for subs in zip(names, formulas)]
+    cases = readCases(args.cases, y)
+    results = runBatch(
+        substances,
+        k,
+        args.eos,
+        cases,
+        vle_method=args.vle_method,
+        Pref=args.Pref,
+        Tref=args.Tref,
+        processes=args.processes,
+    )
+    failures = writeResults(results, args.output, len(names))
+    if failures:
+        print("{} of {} cases failed".format(failures, len(cases)), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,6 @@
 from Views.AddAliasView import AddAliasView
 import db
+from compounds import clear_substance_registry
 
 
 class AddAliasController:
@@ -17,6 +18,7 @@ class AddAliasController:
         if alias != "":
             query = """INSERT INTO substance_name_aliases VALUES(?,?)"""
             db.cursor.execute(query, (self.substance_id, alias))
+            clear_substance_registry()
             self.edit_db.loadAliases()
             self.edit_db.changes_made = True
         self.view.close()
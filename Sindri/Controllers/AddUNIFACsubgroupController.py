@@ -1,5 +1,5 @@
 from Views.AddUNIFACsubgroupView import AddUNIFACsubgroupView
-from Models.LiquidModel import get_all_id_and_subgroups_formulas
+from Models.LiquidModel import clear_unifac_cache, get_all_id_and_subgroups_formulas
 import db
 
 
@@ -30,6 +30,7 @@ class AddUNIFACsubgroupController:
         query = """INSERT INTO substance_unifac_subgroups (substance_id, subgroup_id,frequency) VALUES (?,?,?)"""
         db.cursor.execute(query, (self.substance_id, self.subgroup_id, self.frequency))
         # db.db.commit()
+        clear_unifac_cache()
         self.edit_db.loadUNIFACsubgroups()
         self.edit_db.changes_made = True
         self.addSubgroupView.close()
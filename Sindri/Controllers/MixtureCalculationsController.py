@@ -8,6 +8,7 @@ from Controllers.EditBinaryInteractionParametersController import (
 )
 from Controllers.UnitsOptionsController import UnitsOptionsController
 from Models.MixtureModel import MixtureModel
+from SystemFile import readSystemFile, writeSystemFile
 from Views.MixtureCalculationsView import MixtureCalculationsView
 from compounds import SubstanceProp
 from units import conv_unit
@@ -291,48 +292,15 @@ class MixtureCalculationsController:
             if not txt_file_name:
                 return 0
             try:
-                import datetime
-
-                now = datetime.datetime.now()
-                dateandtime = now.strftime("%H:%M %d-%m-%Y")
-
-                file_content = ""
-                # Header (two lines)
-                file_content += _devinfo.__SOFTWARE_NAME__ + " MIXTURE SYSTEM\n"
-                file_content += dateandtime + "\n"
-                file_content += "\n"
-
-                # number of components
-                file_content += str(n) + "\n"
-                file_content += "\n"
-
                 y = self.getMolarFractionsFromTable(
                     self.mixtureCalcView.tableWidget_MixtureSystem, 2
                 )
                 k = self.model.getBinaryInteractionsParameters()
+                table = self.mixtureCalcView.tableWidget_MixtureSystem
+                names = [table.item(i, 0).text() for i in range(n)]
+                formulas = [table.item(i, 1).text() for i in range(n)]
 
-                # Name, formula and molar fraction
-                for i in range(n):
-                    name = self.mixtureCalcView.tableWidget_MixtureSystem.item(
-                        i, 0
-                    ).text()
-                    formula = self.mixtureCalcView.tableWidget_MixtureSystem.item(
-                        i, 1
-                    ).text()
-                    file_content += '"{0:s}"\t"{1:s}"\t{2:0.17f}\n'.format(
-                        name, formula, y[i]
-                    )
-
-                file_content += "\n"
-
-                # binary interaction parameters
-                for i in range(n):
-                    for j in range(n - 1):
-                        file_content += "{0:0.17f}\t".format(k[i][j])
-                    file_content += "{0:0.17f}\n".format(k[i][n - 1])
-
-                with open(txt_file_name, "w") as f:
-                    f.write(file_content)
+                writeSystemFile(txt_file_name, names, formulas, y, k)
                 til = "Successful"
                 msg = "The system has been successfully saved."
             except Exception as e:
@@ -348,7 +316,6 @@ class MixtureCalculationsController:
 
     def loadSystemClicked(self):
         import _devinfo
-        import shlex
 
         _file_extension = _devinfo.__MIXTURESYSTEM_FILE_EXTENSION__
         filename = QtWidgets.QFileDialog.getOpenFileName(
@@ -362,41 +329,21 @@ class MixtureCalculationsController:
             return 0
 
         try:
-            with open(filename, "r") as file:
-                skiplines = 3
-                for i in range(skiplines):
-                    file.readline()
-                content = [line.rstrip("\n") for line in file if line != "\n"]
-
-            n = int(content[0])
-            y = np.empty(n, dtype=np.float64)
-            k = np.empty([n, n], dtype=np.float64)
+            names, formulas, y, k = readSystemFile(filename)
+            n = len(names)
             self.mixtureCalcView.tableWidget_MixtureSystem.setRowCount(n)
 
-            index = 1
-            # substances : List[SubstanceProp] = []
             self.model.clearSubstancesInSystem()
             for i in range(n):
-                subs = shlex.split(content[index + i])
-                name = QtWidgets.QTableWidgetItem(subs[0])
-                formula = QtWidgets.QTableWidgetItem(subs[1])
-                molar_fraction = QtWidgets.QTableWidgetItem(subs[2])
-                y[i] = float(subs[2])
+                name = QtWidgets.QTableWidgetItem(names[i])
+                formula = QtWidgets.QTableWidgetItem(formulas[i])
+                molar_fraction = QtWidgets.QTableWidgetItem(str(y[i]))
                 self.mixtureCalcView.tableWidget_MixtureSystem.setItem(i, 0, name)
                 self.mixtureCalcView.tableWidget_MixtureSystem.setItem(i, 1, formula)
                 self.mixtureCalcView.tableWidget_MixtureSystem.setItem(
                     i, 2, molar_fraction
                 )
-                self.model.addSubstanceToSystem(
-                    SubstanceProp(name.text(), formula.text())
-                )
-                # substances.append(SubstanceProp(n, f))
-
-            index += n
-            for i in range(n):
-                for j in range(n):
-                    ks = shlex.split(content[index + i])
-                    k[i][j] = float(ks[j])
+                self.model.addSubstanceToSystem(SubstanceProp(names[i], formulas[i]))
 
             self.model.setBinaryInteractionsParameters(k)
 
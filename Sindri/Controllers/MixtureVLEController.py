@@ -441,6 +441,8 @@ class MixtureVLEController:
             QtWidgets.QMessageBox.about(self.vleView, title, msg)
             return -1
 
+        reported = self._reportGenDataFailures()
+
         # populate table
         n = len(x)
         self.vleView.tableWidget_DataResult.setRowCount(n)
@@ -498,6 +500,21 @@ class MixtureVLEController:
             QtWidgets.QMessageBox.about(self.vleView, title, msg)
             return -1
 
+        # the plot computes the diagram again, its failures are usually the same
+        self._reportGenDataFailures(reported)
+
+    def _reportGenDataFailures(self, reported=None):
+        """
+        Shows the points left out of the last diagram, unless they're the ones
+        already reported. Returns them.
+        """
+        failures = list(self.model.system.genDataFailures)
+        if failures and failures != reported:
+            title = "Some points were left out"
+            msg = "\n".join("x1 = {:.4f}: {}".format(xf, m) for xf, m in failures)
+            QtWidgets.QMessageBox.about(self.vleView, title, msg)
+        return failures
+
     def _isGenDataVarValid(self):
         try:
             v = float(self.vleView.le_varValue.text()) * 1.0 + 1.0
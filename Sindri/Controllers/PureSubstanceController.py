@@ -1,6 +1,5 @@
 from PySide2 import QtWidgets
 
-import diagrams
 import units
 from Controllers.UnitsOptionsController import UnitsOptionsController
 from Models.PureSubstanceModel import PureSubstanceModel
@@ -191,6 +190,9 @@ class PureSubstanceController:
 
         from time import time
 
+        # matplotlib is only loaded for the first diagram
+        import diagrams
+
         try:
             s1 = time()
             self.rl, self.rv, self.cp, isotherm_data = diagrams.gen_data(
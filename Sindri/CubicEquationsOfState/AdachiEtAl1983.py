@@ -1,6 +1,17 @@
 import numpy as np
 
 from EOSMixture import EOSMixture
+from EOSParametersBehavior.ParametersBehaviorInterface import (
+    constantBVector,
+    getComponentConstant,
+    getCriticalConstants,
+    getTemperatureArray,
+)
+from EOSParametersBehavior.alphaFunctions import (
+    soave_alpha_vector,
+    soave_dalpha_dT_vector,
+    soave_d2alpha_dT2_vector,
+)
 from MixtureRules.ClassicMixtureRule import ClassicMixtureRule
 from MixtureRules.MixtureRulesInterface import (
     BiBehavior,
@@ -18,6 +29,9 @@ class biAdachi1983(BiBehavior):
         B1 = 0.08974 + w * (-0.03452 + w * 0.0033)
         return B1 * R_IG * substances[i].Tc / substances[i].Pc
 
+    def getBVector(self, T, substances):
+        return constantBVector(self, T, substances)
+
 
 class thetaiAdachi1983(ThetaiBehavior):
     def a(self, i: int, T: float, substances):
@@ -37,6 +51,51 @@ class thetaiAdachi1983(ThetaiBehavior):
         _alpha = self.alpha(i, T, substances)
         return _alpha * self.a(i, T, substances)
 
+    def alphaVector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        m = getComponentConstant(
+            self, "m", lambda i: self.m(i, T[0], substances), substances
+        )
+        return soave_alpha_vector(T, Tc, m)
+
+    def dalphadTVector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        m = getComponentConstant(
+            self, "m", lambda i: self.m(i, T[0], substances), substances
+        )
+        return soave_dalpha_dT_vector(T, Tc, m)
+
+    def d2alphadT2Vector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        m = getComponentConstant(
+            self, "m", lambda i: self.m(i, T[0], substances), substances
+        )
+        return soave_d2alpha_dT2_vector(T, Tc, m)
+
+    def getThetaVector(self, T, substances):
+        T = getTemperatureArray(T)
+        a = getComponentConstant(
+            self, "a", lambda i: self.a(i, T[0], substances), substances
+        )
+        return a * self.alphaVector(T, substances)
+
+    def getdThetadTVector(self, T, substances):
+        T = getTemperatureArray(T)
+        a = getComponentConstant(
+            self, "a", lambda i: self.a(i, T[0], substances), substances
+        )
+        return a * self.dalphadTVector(T, substances)
+
+    def getd2ThetadT2Vector(self, T, substances):
+        T = getTemperatureArray(T)
+        a = getComponentConstant(
+            self, "a", lambda i: self.a(i, T[0], substances), substances
+        )
+        return a * self.d2alphadT2Vector(T, substances)
+
 
 def _calcB2(i: int, T: float, substances):
     w = substances[i].omega
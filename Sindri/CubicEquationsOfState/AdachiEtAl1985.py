@@ -1,6 +1,17 @@
 import numpy as np
 
 from EOSMixture import EOSMixture
+from EOSParametersBehavior.ParametersBehaviorInterface import (
+    constantBVector,
+    getComponentConstant,
+    getCriticalConstants,
+    getTemperatureArray,
+)
+from EOSParametersBehavior.alphaFunctions import (
+    soave_alpha_vector,
+    soave_dalpha_dT_vector,
+    soave_d2alpha_dT2_vector,
+)
 from MixtureRules.ClassicMixtureRule import ClassicMixtureRule, ClassicBMixture
 from MixtureRules.MixtureRulesInterface import (
     BiBehavior,
@@ -18,6 +29,9 @@ class biAdachi1985(BiBehavior):
         omega_b = 0.08779 + w * (-0.02181 + w * (-0.06708 + 0.10617 * w))
         return omega_b / (substances[i].Pc / (R_IG * substances[i].Tc))
 
+    def getBVector(self, T, substances):
+        return constantBVector(self, T, substances)
+
 
 class thetaiAdachi1985(ThetaiBehavior):
     def a(self, i: int, T: float, substances):
@@ -36,6 +50,51 @@ class thetaiAdachi1985(ThetaiBehavior):
     def getThetai(self, i: int, T: float, substances) -> float:
         return self.alpha(i, T, substances) * self.a(i, T, substances)
 
+    def alphaVector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        m = getComponentConstant(
+            self, "m", lambda i: self.m(i, T[0], substances), substances
+        )
+        return soave_alpha_vector(T, Tc, m)
+
+    def dalphadTVector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        m = getComponentConstant(
+            self, "m", lambda i: self.m(i, T[0], substances), substances
+        )
+        return soave_dalpha_dT_vector(T, Tc, m)
+
+    def d2alphadT2Vector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        m = getComponentConstant(
+            self, "m", lambda i: self.m(i, T[0], substances), substances
+        )
+        return soave_d2alpha_dT2_vector(T, Tc, m)
+
+    def getThetaVector(self, T, substances):
+        T = getTemperatureArray(T)
+        a = getComponentConstant(
+            self, "a", lambda i: self.a(i, T[0], substances), substances
+        )
+        return a * self.alphaVector(T, substances)
+
+    def getdThetadTVector(self, T, substances):
+        T = getTemperatureArray(T)
+        a = getComponentConstant(
+            self, "a", lambda i: self.a(i, T[0], substances), substances
+        )
+        return a * self.dalphadTVector(T, substances)
+
+    def getd2ThetadT2Vector(self, T, substances):
+        T = getTemperatureArray(T)
+        a = getComponentConstant(
+            self, "a", lambda i: self.a(i, T[0], substances), substances
+        )
+        return a * self.d2alphadT2Vector(T, substances)
+
 
 class ciAdachi1985(BiBehavior):
     def getBi(self, i: int, T: float, substances) -> float:
@@ -43,6 +102,9 @@ class ciAdachi1985(BiBehavior):
         omega_c = 0.0506 + w * (0.04184 + w * (0.16413 - w * 0.03975))
         return omega_c / (substances[i].Pc / (R_IG * substances[i].Tc))
 
+    def getBVector(self, T, substances):
+        return constantBVector(self, T, substances)
+
 
 class cmAdachi1985:
     def __init__(self):
@@ -52,6 +114,9 @@ class cmAdachi1985:
     def cm(self, y, T: float, substances) -> float:
         return self.cmBehavior.bm(y, T, self.ciBehavior, substances)
 
+    def cmBatch(self, Y, T, substances):
+        return self.cmBehavior.bmBatch(Y, T, self.ciBehavior, substances)
+
     def diffCm(self, i: int, y, T: float, substances) -> float:
         return self.ciBehavior.getBi(i, T, substances)
 
@@ -65,6 +130,9 @@ class deltaMixAdachi1985(DeltaMixtureRuleBehavior):
     ) -> float:
         return 2.0 * self.cm.cm(y, T, substances)
 
+    def deltamBatch(self, Y, T, bib: BiBehavior, bmb: MixtureRuleBehavior, substances):
+        return 2.0 * self.cm.cmBatch(Y, T, substances)
+
     def diffDeltam(
         self, i: int, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
     ) -> float:
@@ -80,6 +148,11 @@ class epsilonMixAdachi1985(EpsilonMixtureRuleBehavior):
     ) -> float:
         return -(self.cm.cm(y, T, substances)) ** 2
 
+    def epsilonmBatch(
+        self, Y, T, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ):
+        return -(self.cm.cmBatch(Y, T, substances)) ** 2
+
     def diffEpsilonm(
         self, i: int, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
     ) -> float:
@@ -6,7 +6,12 @@ from constants import R_IG
 from typing import List
 
 from CubicEquationsOfState.PengAndRobinson1976 import PR1976, biPR1976, thetaiPR1976
-from EOSParametersBehavior.ParametersBehaviorInterface import BiBehavior
+from EOSParametersBehavior.ParametersBehaviorInterface import (
+    BiBehavior,
+    getComponentConstant,
+    getCriticalConstants,
+    getTemperatureArray,
+)
 from MixtureRules.ClassicMixtureRule import ClassicBMixture, ClassicMixtureRule
 from MixtureRules.MixtureRulesInterface import (
     DeltaMixtureRuleBehavior,
@@ -48,6 +53,48 @@ class ciAG2001(BiBehavior):
     def getCi(self, i: int, T: float, substances: List[SubstanceProp]) -> float:
         return self.cc(i, substances) * self.beta(i, T, substances)
 
+    def getBVector(self, T, substances: List[SubstanceProp]):
+        T = getTemperatureArray(T)
+        cc, gamma, g, dgdT, d2gdT2 = self._getBetaTerms(T, substances)
+        return cc * 0.35 / (0.35 + g)
+
+    def getdBdTVector(self, T, substances: List[SubstanceProp]):
+        T = getTemperatureArray(T)
+        cc, gamma, g, dgdT, d2gdT2 = self._getBetaTerms(T, substances)
+        beta = 0.35 / (0.35 + g)
+        return -cc * beta ** 2 * dgdT / 0.35
+
+    def getd2BdT2Vector(self, T, substances: List[SubstanceProp]):
+        T = getTemperatureArray(T)
+        cc, gamma, g, dgdT, d2gdT2 = self._getBetaTerms(T, substances)
+        beta = 0.35 / (0.35 + g)
+        dbetadT = -(beta ** 2) * dgdT / 0.35
+        return -cc * (2.0 * beta * dbetadT * dgdT + beta ** 2 * d2gdT2) / 0.35
+
+    def _getBetaTerms(self, T, substances: List[SubstanceProp]):
+        # beta = 0.35 / (0.35 + g), with g = (eta |x|)^gamma and x = Tr - alpha
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        gamma = getComponentConstant(
+            self, "gamma", lambda i: self.gamma(i, substances), substances
+        )
+        eta = getComponentConstant(
+            self, "eta", lambda i: self.eta(i, substances), substances
+        )
+        cc = getComponentConstant(
+            self, "cc", lambda i: self.cc(i, substances), substances
+        )
+        x = T[:, np.newaxis] / Tc - self.theta.alphaVector(T, substances)
+        dxdT = 1.0 / Tc - self.theta.dalphadTVector(T, substances)
+        d2xdT2 = -self.theta.d2alphadT2Vector(T, substances)
+        g = (eta * np.abs(x)) ** gamma
+        # d(ln g)/dT = gamma x'/x, g and its derivatives vanish with x
+        nonzero = x != 0.0
+        dxdT_x = np.divide(dxdT, x, out=np.zeros_like(x), where=nonzero)
+        d2xdT2_x = np.divide(d2xdT2, x, out=np.zeros_like(x), where=nonzero)
+        dgdT = gamma * g * dxdT_x
+        d2gdT2 = gamma * (dgdT * dxdT_x + g * (d2xdT2_x - dxdT_x ** 2))
+        return cc, gamma, g, dgdT, d2gdT2
+
 
 class cmAG2001:
     def __init__(self):
@@ -57,9 +104,21 @@ class cmAG2001:
     def cm(self, y, T: float, substances) -> float:
         return self.cmBehavior.bm(y, T, self.ciBehavior, substances)
 
+    def cmBatch(self, Y, T, substances):
+        return self.cmBehavior.bmBatch(Y, T, self.ciBehavior, substances)
+
     def diffCm(self, i: int, y, T: float, substances) -> float:
         return self.ciBehavior.getBi(i, T, substances)
 
+    def cmdT(self, y, T: float, substances) -> float:
+        return self.cmBehavior.diffBmdT(y, T, self.ciBehavior, substances)
+
+    def cmd2T(self, y, T: float, substances) -> float:
+        return self.cmBehavior.diffBmd2T(y, T, self.ciBehavior, substances)
+
+    def diffCmVectordT(self, y, T: float, substances):
+        return self.cmBehavior.diffBmVectordT(y, T, self.ciBehavior, substances)
+
 
 class BMixtureRuleBehaviorVolumeTranslated(ClassicBMixture):
     def __init__(self):
@@ -71,9 +130,27 @@ class BMixtureRuleBehaviorVolumeTranslated(ClassicBMixture):
             s1 += y[i] * bib.getBi(i, T, substances)
         return s1 - self.cm.cm(y, T, substances)
 
+    def bmBatch(self, Y, T, bib: BiBehavior, substances):
+        return super().bmBatch(Y, T, bib, substances) - self.cm.cmBatch(
+            Y, T, substances
+        )
+
     def diffBm(self, i: int, y, T: float, bib: BiBehavior, substances) -> float:
         return bib.getBi(i, T, substances) - self.cm.ciBehavior.getCi(i, T, substances)
 
+    def diffBmdT(self, y, T: float, bib: BiBehavior, substances) -> float:
+        return super().diffBmdT(y, T, bib, substances) - self.cm.cmdT(y, T, substances)
+
+    def diffBmd2T(self, y, T: float, bib: BiBehavior, substances) -> float:
+        return super().diffBmd2T(y, T, bib, substances) - self.cm.cmd2T(
+            y, T, substances
+        )
+
+    def diffBmVectordT(self, y, T: float, bib: BiBehavior, substances):
+        return super().diffBmVectordT(y, T, bib, substances) - self.cm.diffCmVectordT(
+            y, T, substances
+        )
+
 
 class ClassicMixtureRuleVolumeTranslated(ClassicMixtureRule):
     def __init__(self):
@@ -90,6 +167,11 @@ class deltaMixAG2001(DeltaMixtureRuleBehavior):
     ) -> float:
         return 2.0 * bmb.bm(y, T, bib, substances) + 4.0 * self.cm.cm(y, T, substances)
 
+    def deltamBatch(self, Y, T, bib: BiBehavior, bmb: MixtureRuleBehavior, substances):
+        return 2.0 * bmb.bmBatch(Y, T, bib, substances) + 4.0 * self.cm.cmBatch(
+            Y, T, substances
+        )
+
     def diffDeltam(
         self, i: int, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
     ) -> float:
@@ -97,6 +179,27 @@ class deltaMixAG2001(DeltaMixtureRuleBehavior):
             i, y, T, substances
         )
 
+    def diffDeltamdT(
+        self, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ) -> float:
+        return 2.0 * bmb.diffBmdT(y, T, bib, substances) + 4.0 * self.cm.cmdT(
+            y, T, substances
+        )
+
+    def diffDeltamd2T(
+        self, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ) -> float:
+        return 2.0 * bmb.diffBmd2T(y, T, bib, substances) + 4.0 * self.cm.cmd2T(
+            y, T, substances
+        )
+
+    def diffDeltamVectordT(
+        self, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ):
+        return 2.0 * bmb.diffBmVectordT(
+            y, T, bib, substances
+        ) + 4.0 * self.cm.diffCmVectordT(y, T, substances)
+
 
 class epsilonMixAG2001(EpsilonMixtureRuleBehavior):
     def __init__(self):
@@ -110,6 +213,14 @@ class epsilonMixAG2001(EpsilonMixtureRuleBehavior):
             + 2.0 * (self.cm.cm(y, T, substances)) ** 2
         )
 
+    def epsilonmBatch(
+        self, Y, T, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ):
+        return (
+            -(bmb.bmBatch(Y, T, bib, substances)) ** 2
+            + 2.0 * (self.cm.cmBatch(Y, T, substances)) ** 2
+        )
+
     def diffEpsilonm(
         self, i: int, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
     ) -> float:
@@ -117,6 +228,33 @@ class epsilonMixAG2001(EpsilonMixtureRuleBehavior):
             i, y, T, bib, substances
         ) + 4.0 * self.cm.cm(y, T, substances) * self.cm.diffCm(i, y, T, substances)
 
+    def diffEpsilonmdT(
+        self, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ) -> float:
+        bm, dbmdT = bmb.bm(y, T, bib, substances), bmb.diffBmdT(y, T, bib, substances)
+        cm, dcmdT = self.cm.cm(y, T, substances), self.cm.cmdT(y, T, substances)
+        return -2.0 * bm * dbmdT + 4.0 * cm * dcmdT
+
+    def diffEpsilonmd2T(
+        self, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ) -> float:
+        bm, dbmdT = bmb.bm(y, T, bib, substances), bmb.diffBmdT(y, T, bib, substances)
+        cm, dcmdT = self.cm.cm(y, T, substances), self.cm.cmdT(y, T, substances)
+        d2bmdT2 = bmb.diffBmd2T(y, T, bib, substances)
+        d2cmdT2 = self.cm.cmd2T(y, T, substances)
+        return -2.0 * (dbmdT ** 2 + bm * d2bmdT2) + 4.0 * (dcmdT ** 2 + cm * d2cmdT2)
+
+    def diffEpsilonmVectordT(
+        self, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ):
+        bm, dbmdT = bmb.bm(y, T, bib, substances), bmb.diffBmdT(y, T, bib, substances)
+        cm, dcmdT = self.cm.cm(y, T, substances), self.cm.cmdT(y, T, substances)
+        diffbm = bmb.diffBmVector(y, T, bib, substances)
+        diffbmdT = bmb.diffBmVectordT(y, T, bib, substances)
+        ci = self.cm.ciBehavior.getBVector(T, substances)[0]
+        dcidT = self.cm.diffCmVectordT(y, T, substances)
+        return -2.0 * (dbmdT * diffbm + bm * diffbmdT) + 4.0 * (dcmdT * ci + cm * dcidT)
+
 
 class AG2001(PR1976):
     def __init__(self, _subs, _k):
@@ -1,6 +1,16 @@
 from CubicEquationsOfState.PengAndRobinson1976 import PR1976, thetaiPR1976
 import numpy as np
 
+from EOSParametersBehavior.ParametersBehaviorInterface import (
+    getCriticalConstants,
+    getTemperatureArray,
+)
+from EOSParametersBehavior.alphaFunctions import (
+    gasem_alpha_vector,
+    gasem_dalpha_dT_vector,
+    gasem_d2alpha_dT2_vector,
+)
+
 
 class thetaiGasem2001(thetaiPR1976):
     def alpha(self, i: int, T: float, substances):
@@ -13,6 +23,21 @@ class thetaiGasem2001(thetaiPR1976):
         E = -0.0467
         return np.exp((A + B * tr) * (1.0 - tr ** (C + D * w + E * w * w)))
 
+    def alphaVector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        return gasem_alpha_vector(T, Tc, omega)
+
+    def dalphadTVector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        return gasem_dalpha_dT_vector(T, Tc, omega)
+
+    def d2alphadT2Vector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        return gasem_d2alpha_dT2_vector(T, Tc, omega)
+
 
 class Gasem2001(PR1976):
     def __init__(self, _subs, _k):
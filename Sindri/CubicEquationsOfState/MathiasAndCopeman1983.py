@@ -1,6 +1,16 @@
 from CubicEquationsOfState.PengAndRobinson1976 import PR1976, thetaiPR1976
 import numpy as np
 from typing import List
+from EOSParametersBehavior.ParametersBehaviorInterface import (
+    getComponentConstant,
+    getCriticalConstants,
+    getTemperatureArray,
+)
+from EOSParametersBehavior.alphaFunctions import (
+    mathias_copeman_alpha_vector,
+    mathias_copeman_dalpha_dT_vector,
+    mathias_copeman_d2alpha_dT2_vector,
+)
 from compounds import SubstanceProp
 
 
@@ -46,6 +56,48 @@ class thetaiMathiasCopeman1983(thetaiPR1976):
             * (1 + c2 * (1 - tr ** 0.5) ** 2 + c3 * (1 - tr ** 0.5) ** 3) ** 2
         )
 
+    def alphaVector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        c1 = getComponentConstant(
+            self, "c1", lambda i: self.c1(i, substances), substances
+        )
+        c2 = getComponentConstant(
+            self, "c2", lambda i: self.c2(i, substances), substances
+        )
+        c3 = getComponentConstant(
+            self, "c3", lambda i: self.c3(i, substances), substances
+        )
+        return mathias_copeman_alpha_vector(T, Tc, c1, c2, c3)
+
+    def dalphadTVector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        c1 = getComponentConstant(
+            self, "c1", lambda i: self.c1(i, substances), substances
+        )
+        c2 = getComponentConstant(
+            self, "c2", lambda i: self.c2(i, substances), substances
+        )
+        c3 = getComponentConstant(
+            self, "c3", lambda i: self.c3(i, substances), substances
+        )
+        return mathias_copeman_dalpha_dT_vector(T, Tc, c1, c2, c3)
+
+    def d2alphadT2Vector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        c1 = getComponentConstant(
+            self, "c1", lambda i: self.c1(i, substances), substances
+        )
+        c2 = getComponentConstant(
+            self, "c2", lambda i: self.c2(i, substances), substances
+        )
+        c3 = getComponentConstant(
+            self, "c3", lambda i: self.c3(i, substances), substances
+        )
+        return mathias_copeman_d2alpha_dT2_vector(T, Tc, c1, c2, c3)
+
 
 class MathiasCopeman1983(PR1976):
     def __init__(self, _subs, _k):
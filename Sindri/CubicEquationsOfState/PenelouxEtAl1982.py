@@ -1,3 +1,5 @@
+import numpy as np
+
 from CubicEquationsOfState.Soave1972 import Soave1972
 from MixtureRules.ClassicMixtureRule import ClassicMixtureRule, ClassicBMixture
 from MixtureRules.MixtureRulesInterface import (
@@ -30,6 +32,14 @@ class CMixBehavior:
             s += y[i] * self.ci.getCi(i, T, substances)
         return s
 
+    def cmBatch(self, Y, T, substances):
+        # c_i doesn't depend on temperature
+        c = np.array(
+            [self.ci.getCi(i, T[0], substances) for i in range(len(substances))],
+            dtype=np.float64,
+        )
+        return Y @ c
+
 
 class BMixtureRuleBehaviorVolumeTranslated(ClassicBMixture):
     def __init__(self):
@@ -41,6 +51,11 @@ class BMixtureRuleBehaviorVolumeTranslated(ClassicBMixture):
             s1 += y[i] * bib.getBi(i, T, substances)
         return s1 - self.cm.cm(y, T, substances)
 
+    def bmBatch(self, Y, T, bib: BiBehavior, substances):
+        return super().bmBatch(Y, T, bib, substances) - self.cm.cmBatch(
+            Y, T, substances
+        )
+
     def diffBm(self, i: int, y, T: float, bib: BiBehavior, substances) -> float:
         return bib.getBi(i, T, substances) - self.cm.ci.getCi(i, T, substances)
 
@@ -62,6 +77,11 @@ class deltaMixPeneloux1982(DeltaMixtureRuleBehavior):
         c = self.cm.cm(y, T, substances)
         return b + 3.0 * c
 
+    def deltamBatch(self, Y, T, bib: BiBehavior, bmb: MixtureRuleBehavior, substances):
+        b = bmb.bmBatch(Y, T, bib, substances)
+        c = self.cm.cmBatch(Y, T, substances)
+        return b + 3.0 * c
+
     def diffDeltam(
         self, i: int, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
     ) -> float:
@@ -82,6 +102,13 @@ class epsilonMixPeneloux1982(EpsilonMixtureRuleBehavior):
         c = self.cm.cm(y, T, substances)
         return b * c + 2.0 * c * c
 
+    def epsilonmBatch(
+        self, Y, T, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ):
+        b = bmb.bmBatch(Y, T, bib, substances)
+        c = self.cm.cmBatch(Y, T, substances)
+        return b * c + 2.0 * c * c
+
     def diffEpsilonm(
         self,
         i: int,
@@ -1,6 +1,17 @@
 import numpy as np
 
 from EOSMixture import EOSMixture
+from EOSParametersBehavior.ParametersBehaviorInterface import (
+    constantBVector,
+    getComponentConstant,
+    getCriticalConstants,
+    getTemperatureArray,
+)
+from EOSParametersBehavior.alphaFunctions import (
+    soave_alpha_vector,
+    soave_dalpha_dT_vector,
+    soave_d2alpha_dT2_vector,
+)
 from MixtureRules.ClassicMixtureRule import ClassicMixtureRule
 from MixtureRules.MixtureRulesInterface import (
     BiBehavior,
@@ -16,6 +27,16 @@ class biPR1976(BiBehavior):
     def getBi(self, i: int, T: float, substances) -> float:
         return 0.07780 / (substances[i].Pc / (R_IG * substances[i].Tc))
 
+    def getBVector(self, T, substances):
+        return constantBVector(self, T, substances)
+
+    def getdBdTVector(self, T, substances):
+        # b_i doesn't depend on temperature
+        return np.zeros_like(self.getBVector(T, substances))
+
+    def getd2BdT2Vector(self, T, substances):
+        return np.zeros_like(self.getBVector(T, substances))
+
 
 class thetaiPR1976(ThetaiBehavior):
     def a(self, i: int, T: float, substances):
@@ -32,6 +53,51 @@ class thetaiPR1976(ThetaiBehavior):
     def getThetai(self, i: int, T: float, substances) -> float:
         return self.alpha(i, T, substances) * self.a(i, T, substances)
 
+    def alphaVector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        m = getComponentConstant(
+            self, "m", lambda i: self.m(i, T[0], substances), substances
+        )
+        return soave_alpha_vector(T, Tc, m)
+
+    def dalphadTVector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        m = getComponentConstant(
+            self, "m", lambda i: self.m(i, T[0], substances), substances
+        )
+        return soave_dalpha_dT_vector(T, Tc, m)
+
+    def d2alphadT2Vector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        m = getComponentConstant(
+            self, "m", lambda i: self.m(i, T[0], substances), substances
+        )
+        return soave_d2alpha_dT2_vector(T, Tc, m)
+
+    def getThetaVector(self, T, substances):
+        T = getTemperatureArray(T)
+        a = getComponentConstant(
+            self, "a", lambda i: self.a(i, T[0], substances), substances
+        )
+        return a * self.alphaVector(T, substances)
+
+    def getdThetadTVector(self, T, substances):
+        T = getTemperatureArray(T)
+        a = getComponentConstant(
+            self, "a", lambda i: self.a(i, T[0], substances), substances
+        )
+        return a * self.dalphadTVector(T, substances)
+
+    def getd2ThetadT2Vector(self, T, substances):
+        T = getTemperatureArray(T)
+        a = getComponentConstant(
+            self, "a", lambda i: self.a(i, T[0], substances), substances
+        )
+        return a * self.d2alphadT2Vector(T, substances)
+
 
 class deltaMixPR1976(DeltaMixtureRuleBehavior):
     def deltam(
@@ -39,11 +105,19 @@ class deltaMixPR1976(DeltaMixtureRuleBehavior):
     ) -> float:
         return 2.0 * bmb.bm(y, T, bib, substances)
 
+    def deltamBatch(self, Y, T, bib: BiBehavior, bmb: MixtureRuleBehavior, substances):
+        return 2.0 * bmb.bmBatch(Y, T, bib, substances)
+
     def diffDeltam(
         self, i: int, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
     ) -> float:
         return 2.0 * bmb.diffBm(i, y, T, bib, substances)
 
+    def diffDeltamMatrix(
+        self, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ):
+        return 2.0 * bmb.diffBmMatrix(y, T, bib, substances)
+
 
 class epsilonMixPR1976(EpsilonMixtureRuleBehavior):
     def epsilonm(
@@ -51,6 +125,11 @@ class epsilonMixPR1976(EpsilonMixtureRuleBehavior):
     ) -> float:
         return -(bmb.bm(y, T, bib, substances)) ** 2
 
+    def epsilonmBatch(
+        self, Y, T, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ):
+        return -(bmb.bmBatch(Y, T, bib, substances)) ** 2
+
     def diffEpsilonm(
         self, i: int, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
     ) -> float:
@@ -58,6 +137,15 @@ class epsilonMixPR1976(EpsilonMixtureRuleBehavior):
             -2.0 * bmb.bm(y, T, bib, substances) * bmb.diffBm(i, y, T, bib, substances)
         )
 
+    def diffEpsilonmMatrix(
+        self, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ):
+        # N^2 epsilonm = -(N bm)^2
+        bm = bmb.bm(y, T, bib, substances)
+        diffbm = bmb.diffBmVector(y, T, bib, substances)
+        ddiffbm = bmb.diffBmMatrix(y, T, bib, substances)
+        return -2.0 * np.outer(diffbm, diffbm) - 2.0 * bm * ddiffbm
+
 
 class PR1976(EOSMixture):
     def __init__(self, _subs, _k):
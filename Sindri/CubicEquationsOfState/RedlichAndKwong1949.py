@@ -4,6 +4,15 @@ from EOSMixture import EOSMixture
 from EOSParametersBehavior.ParametersBehaviorInterface import (
     DeltaiBehavior,
     EpsiloniBehavior,
+    constantBVector,
+    getComponentConstant,
+    getCriticalConstants,
+    getTemperatureArray,
+)
+from EOSParametersBehavior.alphaFunctions import (
+    redlich_kwong_alpha_vector,
+    redlich_kwong_dalpha_dT_vector,
+    redlich_kwong_d2alpha_dT2_vector,
 )
 from MixtureRules.ClassicMixtureRule import ClassicMixtureRule
 from MixtureRules.MixtureRulesInterface import (
@@ -20,6 +29,9 @@ class biRK1949(BiBehavior):
     def getBi(self, i: int, T: float, substances) -> float:
         return 0.08664 / (substances[i].Pc / (R_IG * substances[i].Tc))
 
+    def getBVector(self, T, substances):
+        return constantBVector(self, T, substances)
+
 
 class thetaiRK1949(ThetaiBehavior):
     def a(self, i: int, T: float, substances):
@@ -32,6 +44,30 @@ class thetaiRK1949(ThetaiBehavior):
         _alpha = self.alpha(i, T, substances)
         return _alpha * self.a(i, T, substances)
 
+    def getThetaVector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        a = getComponentConstant(
+            self, "a", lambda i: self.a(i, T[0], substances), substances
+        )
+        return a * redlich_kwong_alpha_vector(T, Tc)
+
+    def getdThetadTVector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        a = getComponentConstant(
+            self, "a", lambda i: self.a(i, T[0], substances), substances
+        )
+        return a * redlich_kwong_dalpha_dT_vector(T, Tc)
+
+    def getd2ThetadT2Vector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        a = getComponentConstant(
+            self, "a", lambda i: self.a(i, T[0], substances), substances
+        )
+        return a * redlich_kwong_d2alpha_dT2_vector(T, Tc)
+
 
 class epsiloniRK1949(EpsiloniBehavior):
     def getEpsiloni(self, b: float) -> float:
@@ -49,6 +85,9 @@ class deltaMixRK1949(DeltaMixtureRuleBehavior):
     ) -> float:
         return bmb.bm(y, T, bib, substances)
 
+    def deltamBatch(self, Y, T, bib: BiBehavior, bmb: BMixtureRuleBehavior, substances):
+        return bmb.bmBatch(Y, T, bib, substances)
+
     def diffDeltam(
         self,
         i: int,
@@ -60,6 +99,11 @@ class deltaMixRK1949(DeltaMixtureRuleBehavior):
     ) -> float:
         return bmb.diffBm(i, y, T, bib, substances)
 
+    def diffDeltamMatrix(
+        self, y, T: float, bib: BiBehavior, bmb: BMixtureRuleBehavior, substances
+    ):
+        return bmb.diffBmMatrix(y, T, bib, substances)
+
 
 class epsilonMixRK1949(EpsilonMixtureRuleBehavior):
     def epsilonm(
@@ -67,6 +111,11 @@ class epsilonMixRK1949(EpsilonMixtureRuleBehavior):
     ) -> float:
         return 0.0
 
+    def epsilonmBatch(
+        self, Y, T, bib: BiBehavior, bmb: BMixtureRuleBehavior, substances
+    ):
+        return np.zeros(len(Y))
+
     def diffEpsilonm(
         self,
         i: int,
@@ -78,6 +127,11 @@ class epsilonMixRK1949(EpsilonMixtureRuleBehavior):
     ) -> float:
         return 0.0
 
+    def diffEpsilonmMatrix(
+        self, y, T: float, bib: BiBehavior, bmb: BMixtureRuleBehavior, substances
+    ):
+        return np.zeros((len(y), len(y)), dtype=np.float64)
+
 
 class RedlichAndKwong1949(EOSMixture):
     def __init__(self, _subs, _k):
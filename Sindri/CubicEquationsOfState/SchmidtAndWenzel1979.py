@@ -9,6 +9,17 @@ from MixtureRules.MixtureRulesInterface import (
     EpsilonMixtureRuleBehavior,
     MixtureRuleBehavior,
 )
+from EOSParametersBehavior.ParametersBehaviorInterface import (
+    constantBVector,
+    getComponentConstant,
+    getCriticalConstants,
+    getTemperatureArray,
+)
+from EOSParametersBehavior.alphaFunctions import (
+    schmidt_wenzel_alpha_vector,
+    schmidt_wenzel_dalpha_dT_vector,
+    schmidt_wenzel_d2alpha_dT2_vector,
+)
 from constants import R_IG
 from polyEqSolver import solve_cubic
 
@@ -33,12 +44,18 @@ class biSW1979(BiBehavior):
         a, b = _calc_a_and_b(T, substances[i].Tc, substances[i].Pc, substances[i].omega)
         return b
 
+    def getBVector(self, T, substances):
+        return constantBVector(self, T, substances)
+
 
 class thetaiSW1979(ThetaiBehavior):
-    def m(self, i: int, T: float, substances):
+    def k0(self, i: int, substances):
         w = substances[i].omega
+        return 0.465 + w * (1.347 - 0.528 * w)
+
+    def m(self, i: int, T: float, substances):
         tr = T / substances[i].Tc
-        k0 = 0.465 + w * (1.347 - 0.528 * w)
+        k0 = self.k0(i, substances)
         if tr > 1:
             tr = 1.0
         k = k0 + (5.0 * tr - 3.0 * k0 - 1.0) ** 2 / 70.0
@@ -56,6 +73,39 @@ class thetaiSW1979(ThetaiBehavior):
         _alpha = self.alpha(i, T, substances)
         return _alpha * self.a(i, T, substances)
 
+    def getThetaVector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        a = getComponentConstant(
+            self, "a", lambda i: self.a(i, T[0], substances), substances
+        )
+        k0 = getComponentConstant(
+            self, "k0", lambda i: self.k0(i, substances), substances
+        )
+        return a * schmidt_wenzel_alpha_vector(T, Tc, k0)
+
+    def getdThetadTVector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        a = getComponentConstant(
+            self, "a", lambda i: self.a(i, T[0], substances), substances
+        )
+        k0 = getComponentConstant(
+            self, "k0", lambda i: self.k0(i, substances), substances
+        )
+        return a * schmidt_wenzel_dalpha_dT_vector(T, Tc, k0)
+
+    def getd2ThetadT2Vector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        a = getComponentConstant(
+            self, "a", lambda i: self.a(i, T[0], substances), substances
+        )
+        k0 = getComponentConstant(
+            self, "k0", lambda i: self.k0(i, substances), substances
+        )
+        return a * schmidt_wenzel_d2alpha_dT2_vector(T, Tc, k0)
+
 
 def getW(y, substances):
     s = 0.0
@@ -64,6 +114,11 @@ def getW(y, substances):
     return -3.0 * s
 
 
+def getWBatch(Y, substances):
+    omega = np.array([s.omega for s in substances], dtype=np.float64)
+    return -3.0 * (Y @ omega)
+
+
 class deltaMixSW1979(DeltaMixtureRuleBehavior):
     def deltam(
         self, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
@@ -71,6 +126,10 @@ class deltaMixSW1979(DeltaMixtureRuleBehavior):
         u = 1.0 - getW(y, substances)
         return u * bmb.bm(y, T, bib, substances)
 
+    def deltamBatch(self, Y, T, bib: BiBehavior, bmb: MixtureRuleBehavior, substances):
+        u = 1.0 - getWBatch(Y, substances)
+        return u * bmb.bmBatch(Y, T, bib, substances)
+
     def diffDeltam(
         self, i: int, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
     ) -> float:
@@ -88,6 +147,12 @@ class epsilonMixSW1979(EpsilonMixtureRuleBehavior):
         w = getW(y, substances)
         return w * (bmb.bm(y, T, bib, substances)) ** 2
 
+    def epsilonmBatch(
+        self, Y, T, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ):
+        w = getWBatch(Y, substances)
+        return w * (bmb.bmBatch(Y, T, bib, substances)) ** 2
+
     def diffEpsilonm(
         self, i: int, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
     ) -> float:
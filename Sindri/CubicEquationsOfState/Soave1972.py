@@ -1,6 +1,16 @@
 import numpy as np
 
 from CubicEquationsOfState.Wilson1964 import Wilson1964, thetaiWilson1964
+from EOSParametersBehavior.ParametersBehaviorInterface import (
+    getComponentConstant,
+    getCriticalConstants,
+    getTemperatureArray,
+)
+from EOSParametersBehavior.alphaFunctions import (
+    soave_alpha_vector,
+    soave_dalpha_dT_vector,
+    soave_d2alpha_dT2_vector,
+)
 
 
 class thetaiSoave1972(thetaiWilson1964):
@@ -13,6 +23,30 @@ class thetaiSoave1972(thetaiWilson1964):
         m = self.m(i, T, substances)
         return (1.0 + m * (1.0 - np.sqrt(tr))) ** 2
 
+    def alphaVector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        m = getComponentConstant(
+            self, "m", lambda i: self.m(i, T[0], substances), substances
+        )
+        return soave_alpha_vector(T, Tc, m)
+
+    def dalphadTVector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        m = getComponentConstant(
+            self, "m", lambda i: self.m(i, T[0], substances), substances
+        )
+        return soave_dalpha_dT_vector(T, Tc, m)
+
+    def d2alphadT2Vector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        m = getComponentConstant(
+            self, "m", lambda i: self.m(i, T[0], substances), substances
+        )
+        return soave_d2alpha_dT2_vector(T, Tc, m)
+
 
 class Soave1972(Wilson1964):
     def __init__(self, _subs, _k):
@@ -1,11 +1,23 @@
 from CubicEquationsOfState.PengAndRobinson1976 import PR1976, thetaiPR1976
+from EOSParametersBehavior.ParametersBehaviorInterface import (
+    getComponentConstant,
+    getCriticalConstants,
+    getTemperatureArray,
+)
+from EOSParametersBehavior.alphaFunctions import (
+    stryjek_vera_alpha_vector,
+    stryjek_vera_dalpha_dT_vector,
+    stryjek_vera_d2alpha_dT2_vector,
+)
 
 
 class thetaiSV1986(thetaiPR1976):
-    def m(self, i: int, T: float, substances):
+    def k0(self, i: int, substances):
         w = substances[i].omega
+        return 0.378893 + 1.48971530 * w - 0.17131848 * w ** 2 + 0.0196554 * w ** 3
+
+    def k1(self, i: int, substances):
         name = substances[i].Name
-        k0 = 0.378893 + 1.48971530 * w - 0.17131848 * w ** 2 + 0.0196554 * w ** 3
         k1 = 0
 
         if name == "hexadecane":
@@ -18,11 +30,48 @@ class thetaiSV1986(thetaiPR1976):
             k1 = -0.00159
         elif name == "benzene":
             k1 = 0.07019
+        return k1
 
+    def m(self, i: int, T: float, substances):
+        k0 = self.k0(i, substances)
+        k1 = self.k1(i, substances)
         Tr = T / substances[i].Tc
         k = k0 + k1 * (1 + Tr) * (0.7 - Tr)
         return k
 
+    def alphaVector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        k0 = getComponentConstant(
+            self, "k0", lambda i: self.k0(i, substances), substances
+        )
+        k1 = getComponentConstant(
+            self, "k1", lambda i: self.k1(i, substances), substances
+        )
+        return stryjek_vera_alpha_vector(T, Tc, k0, k1)
+
+    def dalphadTVector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        k0 = getComponentConstant(
+            self, "k0", lambda i: self.k0(i, substances), substances
+        )
+        k1 = getComponentConstant(
+            self, "k1", lambda i: self.k1(i, substances), substances
+        )
+        return stryjek_vera_dalpha_dT_vector(T, Tc, k0, k1)
+
+    def d2alphadT2Vector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        k0 = getComponentConstant(
+            self, "k0", lambda i: self.k0(i, substances), substances
+        )
+        k1 = getComponentConstant(
+            self, "k1", lambda i: self.k1(i, substances), substances
+        )
+        return stryjek_vera_d2alpha_dT2_vector(T, Tc, k0, k1)
+
 
 class SV1986(PR1976):
     def __init__(self, _subs, _k):
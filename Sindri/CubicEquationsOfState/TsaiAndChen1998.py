@@ -1,7 +1,20 @@
 from typing import List
 
+import numpy as np
+
 from CubicEquationsOfState.PengAndRobinson1976 import PR1976, biPR1976, thetaiPR1976
-from EOSParametersBehavior.ParametersBehaviorInterface import BiBehavior
+from EOSParametersBehavior.ParametersBehaviorInterface import (
+    BiBehavior,
+    constantBVector,
+    getComponentConstant,
+    getCriticalConstants,
+    getTemperatureArray,
+)
+from EOSParametersBehavior.alphaFunctions import (
+    tsai_chen_alpha_vector,
+    tsai_chen_dalpha_dT_vector,
+    tsai_chen_d2alpha_dT2_vector,
+)
 from MixtureRules.ClassicMixtureRule import ClassicBMixture, ClassicMixtureRule
 from MixtureRules.MixtureRulesInterface import (
     DeltaMixtureRuleBehavior,
@@ -29,6 +42,53 @@ class tiTC1998(BiBehavior):
             + k3 * one_minus_tr_pow_two_thirds ** 2
         )
 
+    def getBVector(self, T, substances: List[SubstanceProp]):
+        return self.getTiVector(T, substances)
+
+    def getdBdTVector(self, T, substances: List[SubstanceProp]):
+        return self.getdTidTVector(T, substances)
+
+    def getd2BdT2Vector(self, T, substances: List[SubstanceProp]):
+        return self.getd2TidT2Vector(T, substances)
+
+    def getTiVector(self, T, substances: List[SubstanceProp]):
+        T = getTemperatureArray(T)
+        vc, k1, k2, k3, tr_pow_two_thirds = self._getTiTerms(T, substances)
+        one_minus_tr_pow_two_thirds = 1.0 - tr_pow_two_thirds
+        return vc * (
+            k1
+            + k2 * one_minus_tr_pow_two_thirds
+            + k3 * one_minus_tr_pow_two_thirds ** 2
+        )
+
+    def getdTidTVector(self, T, substances: List[SubstanceProp]):
+        T = getTemperatureArray(T)
+        vc, k1, k2, k3, tr_pow_two_thirds = self._getTiTerms(T, substances)
+        dudT = -2.0 * tr_pow_two_thirds / (3.0 * T[:, np.newaxis])
+        return vc * (k2 + 2.0 * k3 * (1.0 - tr_pow_two_thirds)) * dudT
+
+    def getd2TidT2Vector(self, T, substances: List[SubstanceProp]):
+        T = getTemperatureArray(T)
+        vc, k1, k2, k3, tr_pow_two_thirds = self._getTiTerms(T, substances)
+        dudT = -2.0 * tr_pow_two_thirds / (3.0 * T[:, np.newaxis])
+        d2udT2 = 2.0 * tr_pow_two_thirds / (9.0 * T[:, np.newaxis] ** 2)
+        return vc * (
+            2.0 * k3 * dudT ** 2 + (k2 + 2.0 * k3 * (1.0 - tr_pow_two_thirds)) * d2udT2
+        )
+
+    def _getTiTerms(self, T, substances: List[SubstanceProp]):
+        # t_i = vc (k1 + k2 u + k3 u^2), with u = 1 - (T / Tc)^(2/3)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        k1 = getComponentConstant(
+            self, "getk1", lambda i: self.getk1(i, T[0], substances), substances
+        )
+        k3 = getComponentConstant(
+            self, "getk3", lambda i: self.getk3(i, substances), substances
+        )
+        k2 = self.getk2(k3)
+        tr_pow_two_thirds = (T[:, np.newaxis] / Tc) ** (2.0 / 3.0)
+        return R_IG * Tc / Pc, k1, k2, k3, tr_pow_two_thirds
+
     def getk1(self, i: int, T: float, substances: List[SubstanceProp]) -> float:
         w = substances[i].omega
         return 0.00185 + w * (0.00438 + w * (0.36322 + w * (-0.90831 + w * 0.55885)))
@@ -56,9 +116,21 @@ class tmTC1998:
     def tm(self, y, T: float, substances) -> float:
         return self.tmBehavior.bm(y, T, self.tiBehavior, substances)
 
+    def tmBatch(self, Y, T, substances):
+        return self.tmBehavior.bmBatch(Y, T, self.tiBehavior, substances)
+
     def diffTm(self, i: int, y, T: float, substances) -> float:
         return self.tiBehavior.getBi(i, T, substances)
 
+    def tmdT(self, y, T: float, substances) -> float:
+        return self.tmBehavior.diffBmdT(y, T, self.tiBehavior, substances)
+
+    def tmd2T(self, y, T: float, substances) -> float:
+        return self.tmBehavior.diffBmd2T(y, T, self.tiBehavior, substances)
+
+    def diffTmVectordT(self, y, T: float, substances):
+        return self.tmBehavior.diffBmVectordT(y, T, self.tiBehavior, substances)
+
 
 class thetaiTC1998(thetaiPR1976):
     def alpha(self, i: int, T: float, substances: List[SubstanceProp]):
@@ -67,6 +139,39 @@ class thetaiTC1998(thetaiPR1976):
         N = self.getN(i, substances)
         return (1.0 + M * (1.0 - tr) + N * (1.0 - tr) * (0.7 - tr)) ** 2
 
+    def alphaVector(self, T, substances: List[SubstanceProp]):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        M = getComponentConstant(
+            self, "getM", lambda i: self.getM(i, substances), substances
+        )
+        N = getComponentConstant(
+            self, "getN", lambda i: self.getN(i, substances), substances
+        )
+        return tsai_chen_alpha_vector(T, Tc, M, N)
+
+    def dalphadTVector(self, T, substances: List[SubstanceProp]):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        M = getComponentConstant(
+            self, "getM", lambda i: self.getM(i, substances), substances
+        )
+        N = getComponentConstant(
+            self, "getN", lambda i: self.getN(i, substances), substances
+        )
+        return tsai_chen_dalpha_dT_vector(T, Tc, M, N)
+
+    def d2alphadT2Vector(self, T, substances: List[SubstanceProp]):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        M = getComponentConstant(
+            self, "getM", lambda i: self.getM(i, substances), substances
+        )
+        N = getComponentConstant(
+            self, "getN", lambda i: self.getN(i, substances), substances
+        )
+        return tsai_chen_d2alpha_dT2_vector(T, Tc, M, N)
+
     def getM(self, i: int, substances: List[SubstanceProp]):
         w = substances[i].omega
         return 0.20473 + w * (0.83548 + w * (-0.1847 + w * (0.16675 - 0.09881 * w)))
@@ -91,6 +196,11 @@ class deltaMixTC1998(DeltaMixtureRuleBehavior):
     ) -> float:
         return 2.0 * bmb.bm(y, T, bib, substances) + 4.0 * self.tm.tm(y, T, substances)
 
+    def deltamBatch(self, Y, T, bib: BiBehavior, bmb: MixtureRuleBehavior, substances):
+        return 2.0 * bmb.bmBatch(Y, T, bib, substances) + 4.0 * self.tm.tmBatch(
+            Y, T, substances
+        )
+
     def diffDeltam(
         self, i: int, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
     ) -> float:
@@ -98,6 +208,27 @@ class deltaMixTC1998(DeltaMixtureRuleBehavior):
             i, y, T, substances
         )
 
+    def diffDeltamdT(
+        self, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ) -> float:
+        return 2.0 * bmb.diffBmdT(y, T, bib, substances) + 4.0 * self.tm.tmdT(
+            y, T, substances
+        )
+
+    def diffDeltamd2T(
+        self, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ) -> float:
+        return 2.0 * bmb.diffBmd2T(y, T, bib, substances) + 4.0 * self.tm.tmd2T(
+            y, T, substances
+        )
+
+    def diffDeltamVectordT(
+        self, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ):
+        return 2.0 * bmb.diffBmVectordT(
+            y, T, bib, substances
+        ) + 4.0 * self.tm.diffTmVectordT(y, T, substances)
+
 
 class epsilonMixTC1998(EpsilonMixtureRuleBehavior):
     def __init__(self):
@@ -111,6 +242,14 @@ class epsilonMixTC1998(EpsilonMixtureRuleBehavior):
             + 2.0 * (self.tm.tm(y, T, substances)) ** 2
         )
 
+    def epsilonmBatch(
+        self, Y, T, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ):
+        return (
+            -(bmb.bmBatch(Y, T, bib, substances)) ** 2
+            + 2.0 * (self.tm.tmBatch(Y, T, substances)) ** 2
+        )
+
     def diffEpsilonm(
         self, i: int, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
     ) -> float:
@@ -118,6 +257,33 @@ class epsilonMixTC1998(EpsilonMixtureRuleBehavior):
             i, y, T, bib, substances
         ) + 4.0 * self.tm.tm(y, T, substances) * self.tm.diffTm(i, y, T, substances)
 
+    def diffEpsilonmdT(
+        self, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ) -> float:
+        bm, dbmdT = bmb.bm(y, T, bib, substances), bmb.diffBmdT(y, T, bib, substances)
+        tm, dtmdT = self.tm.tm(y, T, substances), self.tm.tmdT(y, T, substances)
+        return -2.0 * bm * dbmdT + 4.0 * tm * dtmdT
+
+    def diffEpsilonmd2T(
+        self, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ) -> float:
+        bm, dbmdT = bmb.bm(y, T, bib, substances), bmb.diffBmdT(y, T, bib, substances)
+        tm, dtmdT = self.tm.tm(y, T, substances), self.tm.tmdT(y, T, substances)
+        d2bmdT2 = bmb.diffBmd2T(y, T, bib, substances)
+        d2tmdT2 = self.tm.tmd2T(y, T, substances)
+        return -2.0 * (dbmdT ** 2 + bm * d2bmdT2) + 4.0 * (dtmdT ** 2 + tm * d2tmdT2)
+
+    def diffEpsilonmVectordT(
+        self, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ):
+        bm, dbmdT = bmb.bm(y, T, bib, substances), bmb.diffBmdT(y, T, bib, substances)
+        tm, dtmdT = self.tm.tm(y, T, substances), self.tm.tmdT(y, T, substances)
+        diffbm = bmb.diffBmVector(y, T, bib, substances)
+        diffbmdT = bmb.diffBmVectordT(y, T, bib, substances)
+        ti = self.tm.tiBehavior.getTiVector(T, substances)[0]
+        dtidT = self.tm.diffTmVectordT(y, T, substances)
+        return -2.0 * (dbmdT * diffbm + bm * diffbmdT) + 4.0 * (dtmdT * ti + tm * dtidT)
+
 
 class biTC1998(BiBehavior):
     def __init__(self):
@@ -128,6 +294,9 @@ class biTC1998(BiBehavior):
         # return self.prbi.getBi(i, T, substances) - self.TCti.getBi(i, T, substances)
         return self.prbi.getBi(i, T, substances)
 
+    def getBVector(self, T, substances: List[SubstanceProp]):
+        return constantBVector(self, T, substances)
+
 
 class BMixtureRuleBehaviorVolumeTranslated(ClassicBMixture):
     def __init__(self):
@@ -139,9 +308,27 @@ class BMixtureRuleBehaviorVolumeTranslated(ClassicBMixture):
             s1 += y[i] * bib.getBi(i, T, substances)
         return s1 - self.tm.tm(y, T, substances)
 
+    def bmBatch(self, Y, T, bib: BiBehavior, substances):
+        return super().bmBatch(Y, T, bib, substances) - self.tm.tmBatch(
+            Y, T, substances
+        )
+
     def diffBm(self, i: int, y, T: float, bib: BiBehavior, substances) -> float:
         return bib.getBi(i, T, substances) - self.tm.tiBehavior.getTi(i, T, substances)
 
+    def diffBmdT(self, y, T: float, bib: BiBehavior, substances) -> float:
+        return super().diffBmdT(y, T, bib, substances) - self.tm.tmdT(y, T, substances)
+
+    def diffBmd2T(self, y, T: float, bib: BiBehavior, substances) -> float:
+        return super().diffBmd2T(y, T, bib, substances) - self.tm.tmd2T(
+            y, T, substances
+        )
+
+    def diffBmVectordT(self, y, T: float, bib: BiBehavior, substances):
+        return super().diffBmVectordT(y, T, bib, substances) - self.tm.diffTmVectordT(
+            y, T, substances
+        )
+
 
 class ClassicMixtureRuleVolumeTranslated(ClassicMixtureRule):
     def __init__(self):
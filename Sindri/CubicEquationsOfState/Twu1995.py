@@ -1,6 +1,20 @@
 from CubicEquationsOfState.PengAndRobinson1976 import PR1976, thetaiPR1976
 import numpy as np
 
+from EOSParametersBehavior.ParametersBehaviorInterface import (
+    getCriticalConstants,
+    getTemperatureArray,
+)
+from EOSParametersBehavior.alphaFunctions import (
+    twu_alpha_vector,
+    twu_dalpha_dT_vector,
+    twu_d2alpha_dT2_vector,
+)
+
+_twu_parameters = np.array(
+    [-0.171813, 1.77634, 0.125283, -0.607352, 2.20517, 0.511614], dtype=np.float64
+)
+
 
 class thetaiTwu1995(thetaiPR1976):
     def alpha(self, i: int, T: float, substances):
@@ -15,6 +29,21 @@ class thetaiTwu1995(thetaiPR1976):
         alpha = alpha0 + w * (alpha1 - alpha0)
         return alpha
 
+    def alphaVector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        return twu_alpha_vector(T, Tc, omega, _twu_parameters)
+
+    def dalphadTVector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        return twu_dalpha_dT_vector(T, Tc, omega, _twu_parameters)
+
+    def d2alphadT2Vector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        return twu_d2alpha_dT2_vector(T, Tc, omega, _twu_parameters)
+
 
 class Twu1995(PR1976):
     def __init__(self, _subs, _k):
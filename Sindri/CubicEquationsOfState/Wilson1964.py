@@ -1,7 +1,17 @@
+import numpy as np
+
 from EOSMixture import EOSMixture
 from EOSParametersBehavior.ParametersBehaviorInterface import (
     DeltaiBehavior,
     EpsiloniBehavior,
+    constantBVector,
+    getComponentConstant,
+    getCriticalConstants,
+    getTemperatureArray,
+)
+from EOSParametersBehavior.alphaFunctions import (
+    wilson_alpha_vector,
+    wilson_dalpha_dT_vector,
 )
 from MixtureRules.ClassicMixtureRule import ClassicMixtureRule
 from MixtureRules.MixtureRulesInterface import (
@@ -18,6 +28,9 @@ class biWilson1964(BiBehavior):
     def getBi(self, i: int, T: float, substances) -> float:
         return 0.08664 / (substances[i].Pc / (R_IG * substances[i].Tc))
 
+    def getBVector(self, T, substances):
+        return constantBVector(self, T, substances)
+
 
 class thetaiWilson1964(ThetaiBehavior):
     def a(self, i: int, T: float, substances):
@@ -32,6 +45,41 @@ class thetaiWilson1964(ThetaiBehavior):
         _alpha = self.alpha(i, T, substances)
         return _alpha * self.a(i, T, substances)
 
+    def alphaVector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        return wilson_alpha_vector(T, Tc, omega)
+
+    def dalphadTVector(self, T, substances):
+        T = getTemperatureArray(T)
+        Tc, Pc, omega = getCriticalConstants(self, substances)
+        return wilson_dalpha_dT_vector(T, Tc, omega)
+
+    def d2alphadT2Vector(self, T, substances):
+        T = getTemperatureArray(T)
+        return np.zeros((len(T), len(substances)), dtype=np.float64)
+
+    def getThetaVector(self, T, substances):
+        T = getTemperatureArray(T)
+        a = getComponentConstant(
+            self, "a", lambda i: self.a(i, T[0], substances), substances
+        )
+        return a * self.alphaVector(T, substances)
+
+    def getdThetadTVector(self, T, substances):
+        T = getTemperatureArray(T)
+        a = getComponentConstant(
+            self, "a", lambda i: self.a(i, T[0], substances), substances
+        )
+        return a * self.dalphadTVector(T, substances)
+
+    def getd2ThetadT2Vector(self, T, substances):
+        T = getTemperatureArray(T)
+        a = getComponentConstant(
+            self, "a", lambda i: self.a(i, T[0], substances), substances
+        )
+        return a * self.d2alphadT2Vector(T, substances)
+
 
 class epsiloniWilson1964(EpsiloniBehavior):
     def getEpsiloni(self, b: float) -> float:
@@ -49,6 +97,9 @@ class deltaMixWilson1964(DeltaMixtureRuleBehavior):
     ) -> float:
         return bmb.bm(y, T, bib, substances)
 
+    def deltamBatch(self, Y, T, bib: BiBehavior, bmb: BMixtureRuleBehavior, substances):
+        return bmb.bmBatch(Y, T, bib, substances)
+
     def diffDeltam(
         self,
         i: int,
@@ -60,6 +111,11 @@ class deltaMixWilson1964(DeltaMixtureRuleBehavior):
     ) -> float:
         return bmb.diffBm(i, y, T, bib, substances)
 
+    def diffDeltamMatrix(
+        self, y, T: float, bib: BiBehavior, bmb: BMixtureRuleBehavior, substances
+    ):
+        return bmb.diffBmMatrix(y, T, bib, substances)
+
 
 class epsilonMixWilson1964(EpsilonMixtureRuleBehavior):
     def epsilonm(
@@ -67,6 +123,11 @@ class epsilonMixWilson1964(EpsilonMixtureRuleBehavior):
     ) -> float:
         return 0.0
 
+    def epsilonmBatch(
+        self, Y, T, bib: BiBehavior, bmb: BMixtureRuleBehavior, substances
+    ):
+        return np.zeros(len(Y))
+
     def diffEpsilonm(
         self,
         i: int,
@@ -78,6 +139,11 @@ class epsilonMixWilson1964(EpsilonMixtureRuleBehavior):
     ) -> float:
         return 0.0
 
+    def diffEpsilonmMatrix(
+        self, y, T: float, bib: BiBehavior, bmb: BMixtureRuleBehavior, substances
+    ):
+        return np.zeros((len(y), len(y)), dtype=np.float64)
+
 
 class Wilson1964(EOSMixture):
     def __init__(self, _subs, _k):
@@ -1,3 +1,5 @@
+import numpy as np
+
 from EOSMixture import EOSMixture
 from EOSParametersBehavior.ParametersBehaviorInterface import (
     DeltaiBehavior,
@@ -11,6 +13,11 @@ from MixtureRules.MixtureRulesInterface import (
     EpsilonMixtureRuleBehavior,
     BMixtureRuleBehavior,
 )
+from EOSParametersBehavior.ParametersBehaviorInterface import (
+    constantBVector,
+    getComponentConstant,
+    getTemperatureArray,
+)
 from constants import R_IG
 
 
@@ -18,6 +25,9 @@ class bivanderWaals1890(BiBehavior):
     def getBi(self, i: int, T: float, substances) -> float:
         return 0.125 / (substances[i].Pc / (R_IG * substances[i].Tc))
 
+    def getBVector(self, T, substances):
+        return constantBVector(self, T, substances)
+
 
 class thetaivanderWaals1890(ThetaiBehavior):
     def a(self, i: int, T: float, substances):
@@ -26,6 +36,21 @@ class thetaivanderWaals1890(ThetaiBehavior):
     def getThetai(self, i: int, T: float, substances) -> float:
         return self.a(i, T, substances)
 
+    def getThetaVector(self, T, substances):
+        T = getTemperatureArray(T)
+        a = getComponentConstant(
+            self, "a", lambda i: self.a(i, T[0], substances), substances
+        )
+        return np.repeat(a[np.newaxis, :], len(T), axis=0)
+
+    def getdThetadTVector(self, T, substances):
+        T = getTemperatureArray(T)
+        return np.zeros((len(T), len(substances)), dtype=np.float64)
+
+    def getd2ThetadT2Vector(self, T, substances):
+        T = getTemperatureArray(T)
+        return np.zeros((len(T), len(substances)), dtype=np.float64)
+
 
 class epsilonivanderWaals1890(EpsiloniBehavior):
     def getEpsiloni(self, b: float) -> float:
@@ -43,6 +68,9 @@ class deltaMixvanderWaals1890(DeltaMixtureRuleBehavior):
     ) -> float:
         return 0.0
 
+    def deltamBatch(self, Y, T, bib: BiBehavior, bmb: BMixtureRuleBehavior, substances):
+        return np.zeros(len(Y))
+
     def diffDeltam(
         self,
         i: int,
@@ -54,6 +82,11 @@ class deltaMixvanderWaals1890(DeltaMixtureRuleBehavior):
     ) -> float:
         return 0.0
 
+    def diffDeltamMatrix(
+        self, y, T: float, bib: BiBehavior, bmb: BMixtureRuleBehavior, substances
+    ):
+        return np.zeros((len(y), len(y)), dtype=np.float64)
+
 
 class epsilonMixvanderWaals1890(EpsilonMixtureRuleBehavior):
     def epsilonm(
@@ -61,6 +94,11 @@ class epsilonMixvanderWaals1890(EpsilonMixtureRuleBehavior):
     ) -> float:
         return 0.0
 
+    def epsilonmBatch(
+        self, Y, T, bib: BiBehavior, bmb: BMixtureRuleBehavior, substances
+    ):
+        return np.zeros(len(Y))
+
     def diffEpsilonm(
         self,
         i: int,
@@ -72,6 +110,11 @@ class epsilonMixvanderWaals1890(EpsilonMixtureRuleBehavior):
     ) -> float:
         return 0.0
 
+    def diffEpsilonmMatrix(
+        self, y, T: float, bib: BiBehavior, bmb: BMixtureRuleBehavior, substances
+    ):
+        return np.zeros((len(y), len(y)), dtype=np.float64)
+
 
 class vanderWaals1890(EOSMixture):
     def __init__(self, _subs, _k):
@@ -5,7 +5,10 @@ from PySide2.QtWidgets import QTableWidget, QLineEdit, QPushButton
 
 import db
 import db_utils
-from DatabaseInterface.databaseSearchFunctions import getQueryBySearchNameFormulaOrCas
+from DatabaseInterface.databaseSearchFunctions import (
+    getQueryBySearchNameFormulaOrCas,
+    hasSearchIndex,
+)
 
 
 class DatabaseTableWidgetView:
@@ -65,6 +68,7 @@ class DatabaseTableWidgetView:
     def load_db(self):
         # Abrir banco de dados
         if os.path.isfile(self.dbfile):
+            self.search_indexed = hasSearchIndex(db.cursor)
             self.show_full_db()
         else:
             error_dialog = QtWidgets.QErrorMessage()
@@ -118,8 +122,10 @@ class DatabaseTableWidgetView:
             self.show_full_db()
         else:
             try:
-                query = getQueryBySearchNameFormulaOrCas(substance_string_name)
-                db.cursor.execute(query)
+                query, params = getQueryBySearchNameFormulaOrCas(
+                    substance_string_name, indexed=self.search_indexed
+                )
+                db.cursor.execute(query, params)
                 results = db.cursor.fetchall()
                 self.update_table_db(results)
             except:
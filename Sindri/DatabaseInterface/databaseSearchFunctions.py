@@ -1,16 +1,181 @@
-def getQueryBySearchNameFormulaOrCas(s: str) -> str:
-    table_name = "v_all_properties_including_correlations s"
-    table_name += " INNER JOIN substance sub ON sub.cas=s.cas LEFT JOIN substance_name_aliases a on sub.substance_id=a.substance_id"
-    query = """SELECT DISTINCT s.formula, s.name, s.cas, s.molar_weigth,
+"""
+Substance search by name, formula, CAS number or alias.
+
+The search uses substance_search, a FTS5 table with the trigram tokenizer (one row
+per substance, rowid = substance_id), so any part of at least three characters is
+found through the index. It's kept up to date by triggers on substance and
+substance_name_aliases, so every write to these tables updates it, whichever window
+makes it. createSearchIndex creates it in databases that don't have it yet. Without
+FTS5 the search falls back to LIKE.
+"""
+import sqlite3
+
+# rows returned by a search
+search_limit = 200
+
+_search_columns = """s.formula, s.name, s.cas, s.molar_weigth,
                s.tfp_k, s.tb_k, s.tc_k, s.pc_bar, s.vc_cm3_per_mol, s.zc, s.omega,
-               s.cp_trange, s.cp_a0, s.cp_a1, s.cp_a2, s.cp_a3, s.cp_a4, s.cpig, s.cpliq,
-               s.antoine_a, s.antoine_b, s.antoine_c, s.pvpmin_bar, s.tmin_k, s.pvpmax_bar, s.tmax_k
-               FROM {0}
-               WHERE s.name LIKE '%{1}%'
-               OR s.formula LIKE '%{1}%'
-               OR s.cas LIKE '%{1}%'
-               OR a.alias LIKE '%{1}%'
-               ORDER BY (s.name='{1}') DESC, length(s.name)""".format(
-        table_name, s
+               c.cp_tmin || '-' || c.cp_tmax as cp_trange,
+               c.cp_a0, c.cp_a1, c.cp_a2, c.cp_a3, c.cp_a4, c.cpig, c.cpliq,
+               a.antoine_a, a.antoine_b, a.antoine_c,
+               a.pvpmin_bar, a.tmin_k, a.pvpmax_bar, a.tmax_k"""
+
+# same rows as v_all_properties_including_correlations
+_search_tables = """substance_search f
+               INNER JOIN substance s ON s.substance_id = f.rowid
+               INNER JOIN cp_correlations c ON c.substance_id = s.substance_id
+               INNER JOIN antoine_correlations a ON a.substance_id = s.substance_id"""
+
+_like_tables = """substance s
+               INNER JOIN cp_correlations c ON c.substance_id = s.substance_id
+               INNER JOIN antoine_correlations a ON a.substance_id = s.substance_id
+               LEFT JOIN substance_name_aliases al
+                   ON al.substance_id = s.substance_id"""
+
+# exact name, formula or CAS first, then names starting with the string
+_search_order = """(lower(f.name) = lower(:s) OR lower(f.formula) = lower(:s)
+                   OR lower(f.cas) = lower(:s)) DESC,
+               f.name LIKE :prefix ESCAPE '\\' DESC"""
+
+_reindex = """
+    DELETE FROM substance_search WHERE rowid = {0}.substance_id;
+    INSERT INTO substance_search(rowid, name, formula, cas, aliases)
+    SELECT s.substance_id, s.name, s.formula, s.cas,
+        (SELECT group_concat(alias, ' ; ') FROM substance_name_aliases
+         WHERE substance_id = s.substance_id)
+    FROM substance s WHERE s.substance_id = {0}.substance_id;"""
+
+_triggers = {
+    ("substance", "INSERT"): ["new"],
+    ("substance", "UPDATE"): ["old", "new"],
+    ("substance", "DELETE"): ["old"],
+    ("substance_name_aliases", "INSERT"): ["new"],
+    ("substance_name_aliases", "UPDATE"): ["old", "new"],
+    ("substance_name_aliases", "DELETE"): ["old"],
+}
+
+
+def _searchSchema() -> dict:
+    # statements creating the index, its triggers and the indexes of the join, by name
+    schema = {
+        "substance_search": """CREATE VIRTUAL TABLE substance_search
+            USING fts5(name, formula, cas, aliases, tokenize = 'trigram')"""
+    }
+    for (table, event), rows in _triggers.items():
+        name = "{}_search_{}".format(table, event.lower())
+        schema[name] = "CREATE TRIGGER {} AFTER {} ON {} BEGIN {} END".format(
+            name, event, table, "".join(_reindex.format(row) for row in rows)
+        )
+    # the search joins the correlations by substance_id
+    for table in ("cp_correlations", "antoine_correlations"):
+        name = "{}_substance_id".format(table)
+        schema[name] = "CREATE INDEX {} ON {}(substance_id)".format(name, table)
+    return schema
+
+
+def createSearchIndex(cursor, rebuild: bool = False) -> bool:
+    """
+    Creates substance_search, its triggers and the indexes it needs if they don't
+    exist, and fills it when it's created or when rebuild is True. It commits only
+    when it changes the database, so it must be called when the database is opened,
+    before any pending edit.
+
+    Returns
+    -------
+    indexed : bool
+        False if this SQLite has no FTS5 or trigram tokenizer (it needs 3.34 or
+        newer), then the searches must use indexed=False.
+    """
+    cursor.execute("SELECT name FROM sqlite_master")
+    existing = {row[0] for row in cursor.fetchall()}
+    schema = _searchSchema()
+    if not rebuild and existing.issuperset(schema):
+        return hasSearchIndex(cursor)
+    try:
+        for name, statement in schema.items():
+            if name not in existing:
+                cursor.execute(statement)
+    except sqlite3.OperationalError:
+        return False
+    if rebuild or "substance_search" not in existing:
+        cursor.execute("DELETE FROM substance_search")
+        cursor.execute(
+            """INSERT INTO substance_search(rowid, name, formula, cas, aliases)
+               SELECT s.substance_id, s.name, s.formula, s.cas,
+                   group_concat(a.alias, ' ; ')
+               FROM substance s
+               LEFT JOIN substance_name_aliases a ON a.substance_id = s.substance_id
+               GROUP BY s.substance_id"""
+        )
+    cursor.connection.commit()
+    return True
+
+
+def hasSearchIndex(cursor) -> bool:
+    """
+    True if the database has substance_search and this SQLite can read it.
+    """
+    try:
+        cursor.execute("SELECT rowid FROM substance_search LIMIT 0")
+    except sqlite3.OperationalError:
+        return False
+    cursor.fetchall()
+    return True
+
+
+def getQueryBySearchNameFormulaOrCas(
+    s: str, limit: int = search_limit, indexed: bool = True
+) -> (str, dict):
+    """
+    Query for the substances with s in their name, formula, CAS number or an alias,
+    with the columns of v_all_properties_including_correlations.
+
+    With indexed, strings of three or more characters are looked up in the index of
+    createSearchIndex and ranked by bm25, strings with one or two characters
+    (shorter than a trigram) match the start of the name, formula, CAS number or
+    aliases instead. Without it, s is matched anywhere with LIKE, scanning the
+    tables.
+
+    Returns
+    -------
+    query : str
+        the query, to be executed with params.
+    params : dict
+        the parameters of query.
+    """
+    s = s.strip()
+    escaped = s.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    params = {"s": s, "prefix": escaped + "%", "limit": limit}
+    if not indexed:
+        params["like"] = "%" + escaped + "%"
+        query = """SELECT DISTINCT {0}
+               FROM {1}
+               WHERE s.name LIKE :like ESCAPE '\\'
+               OR s.formula LIKE :like ESCAPE '\\'
+               OR s.cas LIKE :like ESCAPE '\\'
+               OR al.alias LIKE :like ESCAPE '\\'
+               ORDER BY (lower(s.name) = lower(:s)) DESC, length(s.name)
+               LIMIT :limit""".format(
+            _search_columns, _like_tables
+        )
+        return query, params
+    if len(s) >= 3:
+        params["match"] = '"{}"'.format(s.replace('"', '""'))
+        where = "substance_search MATCH :match"
+        # matches in the name weigh more than in the other columns
+        order = _search_order + ", bm25(substance_search, 10.0, 5.0, 5.0, 2.0)"
+    else:
+        where = """(f.name LIKE :prefix ESCAPE '\\'
+               OR f.formula LIKE :prefix ESCAPE '\\'
+               OR f.cas LIKE :prefix ESCAPE '\\'
+               OR f.aliases LIKE :prefix ESCAPE '\\'
+               OR f.aliases LIKE '% ; ' || :prefix ESCAPE '\\')"""
+        order = _search_order
+    query = """SELECT {0}
+               FROM {1}
+               WHERE {2}
+               ORDER BY {3}, length(s.name)
+               LIMIT :limit""".format(
+        _search_columns, _search_tables, where, order
     )
-    return query
+    return query, params
@@ -0,0 +1,250 @@
+"""
+Comparison of equations of state on the same mixture, one process per equation of
+state.
+
+    python EOSComparison.py --substance methane CH4 --substance pentane C5H12 \
+        --task bubbleP --z 0.5 0.5 --values 250 300 350 --output comparison.csv
+"""
+import argparse
+import csv
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+
+import numpy as np
+
+import Models.LiquidModel as LiquidModel
+import db
+from Factories.EOSMixFactory import createEOSMix, getEOSMixOptions
+from compounds import SubstanceProp
+
+comparison_tasks = [
+    "state",
+    "bubbleP",
+    "dewP",
+    "bubbleT",
+    "dewT",
+    "isothermal",
+    "isobaric",
+]
+
+# data shared by all the tasks of a worker process, set by _initWorker
+_worker = {}
+
+
+def compareEOS(
+    substances: List[SubstanceProp],
+    task: str,
+    eosnames: List[str] = None,
+    k=None,
+    vle_method: str = "phi-phi",
+    processes: int = None,
+    **kwargs
+) -> dict:
+    """
+    Evaluates the same task with each equation of state of eosnames (all the
+    options of getEOSMixOptions by default), in a pool of processes.
+
+    The substances, k and the UNIFAC tables are sent once to each process, which
+    builds the mixtures from them without querying the database. With
+    processes=1 everything runs in this process.
+
+    Tasks and their keyword arguments:
+
+    - "state": P, T, y. Compressibility factors and fugacity coefficients of both
+      roots.
+    - "bubbleP", "dewP": z and the temperatures values; "bubbleT", "dewT": z and
+      the pressures values. Saturation point at each value.
+    - "isothermal": T; "isobaric": P. Binary P-x-y or T-x-y data.
+
+    Returns
+    -------
+    table : dict
+        columns of equal length, as numpy arrays, in the order of eosnames. The
+        "eos" column holds the name of the equation of state and "error" the
+        message of the points that failed, whose values are nan.
+    """
+    if task not in comparison_tasks:
+        raise ValueError("Unknown comparison task: {}".format(task))
+    if eosnames is None:
+        eosnames = getEOSMixOptions()
+    unknown = [name for name in eosnames if name not in getEOSMixOptions()]
+    if unknown:
+        raise ValueError("Unknown equations of state: {}".format(unknown))
+
+    initargs = (substances, k, vle_method, LiquidModel.get_unifac_tables())
+    if processes == 1:
+        _initWorker(*initargs)
+        results = [_runTask(name, task, kwargs) for name in eosnames]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=processes, initializer=_initWorker, initargs=initargs
+        ) as pool:
+            results = list(
+                pool.map(
+                    _runTask,
+                    eosnames,
+                    [task] * len(eosnames),
+                    [kwargs] * len(eosnames),
+                )
+            )
+
+    table = {"eos": []}
+    for name, columns in zip(eosnames, results):
+        nrows = len(next(iter(columns.values())))
+        table["eos"].extend([name] * nrows)
+        for key, values in columns.items():
+            table.setdefault(key, []).extend(values)
+    return {key: np.array(values) for key, values in table.items()}
+
+
+def _initWorker(substances, k, vle_method, unifac_tables):
+    LiquidModel._unifac_tables = unifac_tables
+    _worker["substances"] = substances
+    _worker["k"] = k
+    _worker["vle_method"] = vle_method
+
+
+def _runTask(eosname: str, task: str, kwargs: dict) -> dict:
+    eos = createEOSMix(_worker["substances"], eosname, _worker["k"])
+    eos.setVLEmethod(_worker["vle_method"])
+    if task == "state":
+        return _state(eos, **kwargs)
+    elif task in ("isothermal", "isobaric"):
+        return _binary(eos, task, **kwargs)
+    return _saturation(eos, task, **kwargs)
+
+
+def _state(eos, P: float, T: float, y) -> dict:
+    y = np.atleast_1d(np.asarray(y, dtype=np.float64))
+    try:
+        zliq, zvap = eos.getZLiqVap(P, T, y)[:2]
+        philiq = eos.getPhiVector(y, P, T, zliq)
+        phivap = eos.getPhiVector(y, P, T, zvap)
+        error = ""
+    except Exception as e:
+        zliq, zvap = np.nan, np.nan
+        philiq = phivap = np.full(eos.n, np.nan)
+        error = str(e) or type(e).__name__
+    columns = {"P": [P], "T": [T], "Z_liq": [zliq], "Z_vap": [zvap], "error": [error]}
+    for i in range(eos.n):
+        columns["phi_liq_{}".format(i + 1)] = [philiq[i]]
+        columns["phi_vap_{}".format(i + 1)] = [phivap[i]]
+    return columns
+
+
+def _saturation(eos, task: str, z, values) -> dict:
+    z = np.atleast_1d(np.asarray(z, dtype=np.float64))
+    solver = {
+        "bubbleP": eos.getBubblePointPressure,
+        "dewP": eos.getDewPointPressure,
+        "bubbleT": eos.getBubblePointTemperature,
+        "dewT": eos.getDewPointTemperature,
+    }[task]
+    var, unknown = ("T", "P") if task.endswith("P") else ("P", "T")
+
+    columns = {var: [], unknown: [], "iterations": [], "error": []}
+    for i in range(eos.n):
+        columns["w_{}".format(i + 1)] = []
+    guess = None
+    for value in np.atleast_1d(values):
+        try:
+            # warm start from the previous point of the curve
+            w, sat, phivap, philiq, kvec, ite = solver(z, value, guess=guess)
+            guess = (kvec, sat)
+            error = ""
+        except Exception as e:
+            w, sat, ite = np.full(eos.n, np.nan), np.nan, 0
+            error = str(e) or type(e).__name__
+            guess = None
+        columns[var].append(value)
+        columns[unknown].append(sat)
+        columns["iterations"].append(ite)
+        columns["error"].append(error)
+        for i in range(eos.n):
+            columns["w_{}".format(i + 1)].append(w[i])
+    return columns
+
+
+def _binary(eos, task: str, T: float = None, P: float = None) -> dict:
+    name = "P" if task == "isothermal" else "T"
+    try:
+        if task == "isothermal":
+            x, y, s, phivap, philiq, kvec = eos.isothermalBinaryMixtureGenData(T)
+        else:
+            x, y, s, phivap, philiq, kvec = eos.isobaricBinaryMixtureGenData(P)
+    except Exception as e:
+        # a single row, so that the other equations of state are still compared
+        return {
+            "x": [np.nan],
+            "y": [np.nan],
+            name: [np.nan],
+            "K": [np.nan],
+            "error": [str(e) or type(e).__name__],
+        }
+    rows = [(x[i], y[i], s[i], kvec[i], "") for i in range(len(x))]
+    # a row for each point left out
+    rows += [(xf, np.nan, np.nan, np.nan, msg) for xf, msg in eos.genDataFailures]
+    rows.sort(key=lambda row: row[0])
+    return {
+        "x": [row[0] for row in rows],
+        "y": [row[1] for row in rows],
+        name: [row[2] for row in rows],
+        "K": [row[3] for row in rows],
+        "error": [row[4] for row in rows],
+    }
+
+
+def writeCSV(table: dict, filename: str):
+    with open(filename, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(list(table.keys()))
+        writer.writerows(zip(*table.values()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compares equations of state on the same mixture."
+    )
+    parser.add_argument(
+        "--substance",
+        nargs=2,
+        action="append",
+        required=True,
+        metavar=("NAME", "FORMULA"),
+    )
+    parser.add_argument("--task", choices=comparison_tasks, required=True)
+    parser.add_argument("--eos", action="append", help="default: all of them")
+    parser.add_argument("--vle-method", default="phi-phi")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--P", type=float, help="Pa")
+    parser.add_argument("--T", type=float, help="K")
+    parser.add_argument("--z", type=float, nargs="+", help="mole fractions")
+    parser.add_argument("--values", type=float, nargs="+", help="K or Pa")
+    parser.add_argument("--output", required=True, help="csv file")
+    args = parser.parse_args(argv)
+
+    db.init()
+    substances = [SubstanceProp(name, formula) for name, formula in args.substance]
+    if args.task == "state":
+        kwargs = {"P": args.P, "T": args.T, "y": args.z}
+    elif args.task == "isothermal":
+        kwargs = {"T": args.T}
+    elif args.task == "isobaric":
+        kwargs = {"P": args.P}
+    else:
+        kwargs = {"z": args.z, "values": args.values}
+
+    table = compareEOS(
+        substances,
+        args.task,
+        eosnames=args.eos,
+        vle_method=args.vle_method,
+        processes=args.processes,
+        **kwargs
+    )
+    writeCSV(table, args.output)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,17 @@
+import copy
 import os
 from typing import List
 
 import numpy as np
-from numba import njit, float64, int64
-from scipy.integrate import quad
-
-import VLEBinaryDiagrams
+from numba import boolean, njit, float64, int64
+from numba.types import Tuple, UniTuple
+
+from Accelerators import acceleration_options, createAccelerator
+from EOSParametersBehavior.ParameterCache import (
+    CachedBiBehavior,
+    CachedThetaiBehavior,
+    ParameterCache,
+)
 from EOSParametersBehavior.ParametersBehaviorInterface import (
     BiBehavior,
     DeltaiBehavior,
@@ -18,11 +24,13 @@ from MixtureRules.MixtureRulesInterface import (
     MixtureRuleBehavior,
 )
 from Models.LiquidModel import UNIFAC, has_unifac_in_db
-from Properties import DeltaProp, Props
+from Properties import DeltaProp, DerivativeProps, PhaseEnvelope, Props
+from RachfordRice import solve_rachford_rice
+from SolverStats import SolverStats
 from compounds import MixtureProp
 from compounds import SubstanceProp
 from constants import R_IG, DBL_EPSILON
-from polyEqSolver import solve_cubic
+from polyEqSolver import solve_cubic_monic
 from units import conv_unit
 
 x_vec_for_plot = [
@@ -59,6 +67,8 @@ x_vec_for_plot = [
     1,
 ]
 
+vle_solver_options = ["successive substitution", "newton"]
+
 calc_options = {
     "Bubble-point Pressure": "bubbleP",
     "Dew-point Pressure": "dewP",
@@ -97,7 +107,15 @@ class EOSMixture:
         self.omegas = np.zeros(self.n)
         self.subs_ids = self.getSubstancesIDs()
         self.vle_method = "phi-phi"
+        # solver of the phi-phi bubble and dew point problems
+        self.vle_solver = "successive substitution"
+        self.solverStats = None
+        # (x, message) of the points that failed in the last *BinaryMixtureGenData
+        self.genDataFailures = []
+        # acceleration of the successive substitution loops, by calc_options value
+        self.acceleration = dict.fromkeys(calc_options.values(), "none")
         self.has_UNIFAC = self.hasUNIFAC()
+        self.parameterCache = None
 
         if self.has_UNIFAC:
             self.unifac_model = UNIFAC(self.subs_ids)
@@ -113,8 +131,79 @@ class EOSMixture:
             return False
         return has_unifac_in_db(self.subs_ids)
 
-    def getZfromPT(self, P: float, T: float, y):
+    def enableParameterCache(self, maxsize: int = 256):
+        """
+        Caches the pure-component parameter vectors (b_i, theta_i and its temperature
+        derivatives) for each temperature, in a LRU cache holding at most maxsize
+        vectors. Useful in the VLE solvers, that evaluate them many times at the same
+        temperature. Enabling it again discards the cached values.
+        """
+        self.disableParameterCache()
+        self.parameterCache = ParameterCache(maxsize)
+        self.biBehavior = CachedBiBehavior(self.biBehavior, self.parameterCache)
+        self.thetaiBehavior = CachedThetaiBehavior(
+            self.thetaiBehavior, self.parameterCache
+        )
+
+    def disableParameterCache(self):
+        if isinstance(self.biBehavior, CachedBiBehavior):
+            self.biBehavior = self.biBehavior.behavior
+        if isinstance(self.thetaiBehavior, CachedThetaiBehavior):
+            self.thetaiBehavior = self.thetaiBehavior.behavior
+        self.parameterCache = None
+
+    def clearParameterCache(self):
+        """
+        Discards the cached parameters. Must be called when the substances or the
+        parameters they depend on change.
+        """
+        if self.parameterCache is not None:
+            self.parameterCache.clear()
+
+    def getParameterCacheInfo(self) -> dict:
+        """
+        Hits, misses, size and maxsize of the parameter cache, or None if it's
+        disabled.
+        """
+        if self.parameterCache is None:
+            return None
+        return self.parameterCache.getInfo()
+
+    def set_k(self, k):
+        """
+        Replaces the binary interaction parameters, keeping everything else of the
+        system (substance data, UNIFAC model and parameter cache), which don't depend
+        on them.
+        """
+        k = np.array(k, dtype=np.float64)
+        if k.shape != (self.n, self.n):
+            raise ValueError(
+                "Binary interaction parameters must be a {0}x{0} matrix".format(self.n)
+            )
+        self.k = k
+
+    def clone_with(self, k=None) -> "EOSMixture":
+        """
+        Shallow copy of the system sharing all its precomputed structures, with its own
+        binary interaction parameters k (the current ones if None). The solver
+        settings, statistics and failures are its own too.
+        """
+        ret = copy.copy(self)
+        ret.acceleration = dict(self.acceleration)
+        ret.solverStats = None
+        ret.genDataFailures = []
+        if k is not None:
+            ret.set_k(k)
+        return ret
 
+    def getMixtureParameters(self, y, T: float):
+        """
+        Mixture parameters of the generalized cubic equation of state.
+
+        Returns
+        -------
+        b, theta, delta, epsilon : float
+        """
         b = self.mixRuleBehavior.bm(y, T, self.biBehavior, self.substances)
         theta = self.mixRuleBehavior.thetam(
             y, T, self.thetaiBehavior, self.substances, self.k
@@ -125,19 +214,178 @@ class EOSMixture:
         epsilon = self.epsilonMixBehavior.epsilonm(
             y, T, self.biBehavior, self.mixRuleBehavior, self.substances
         )
-        return _getZfromPT_helper(b, theta, delta, epsilon, T, P, R_IG)
-
-    def getPfromTV(self, T: float, V: float, y) -> float:
-        b = self.mixRuleBehavior.bm(y, T, self.biBehavior, self.substances)
-        theta = self.mixRuleBehavior.thetam(
+        return b, theta, delta, epsilon
+
+    def getMixtureParametersBatch(self, Y, T):
+        """
+        Mixture parameters of the generalized cubic equation of state for a batch of
+        compositions, each one at its own temperature.
+
+        Parameters
+        ----------
+        Y : ndarray
+            (N, n) matrix of compositions.
+        T : ndarray
+            (N,) array of temperatures, in K.
+
+        Returns
+        -------
+        b, theta, delta, epsilon : ndarray
+            (N,) arrays.
+        """
+        b = self.mixRuleBehavior.bmBatch(Y, T, self.biBehavior, self.substances)
+        theta = self.mixRuleBehavior.thetamBatch(
+            Y, T, self.thetaiBehavior, self.substances, self.k
+        )
+        delta = self.deltaMixBehavior.deltamBatch(
+            Y, T, self.biBehavior, self.mixRuleBehavior, self.substances
+        )
+        epsilon = self.epsilonMixBehavior.epsilonmBatch(
+            Y, T, self.biBehavior, self.mixRuleBehavior, self.substances
+        )
+        return b, theta, delta, epsilon
+
+    def getMixtureParametersdT(self, y, T: float):
+        """
+        Temperature derivatives of the mixture parameters of the generalized cubic
+        equation of state.
+
+        Returns
+        -------
+        dbdT, dthetadT, ddeltadT, depsilondT : float
+        """
+        dbdT = self.mixRuleBehavior.diffBmdT(y, T, self.biBehavior, self.substances)
+        dthetadT = self.mixRuleBehavior.diffThetamdT(
             y, T, self.thetaiBehavior, self.substances, self.k
         )
-        delta = self.deltaMixBehavior.deltam(
+        ddeltadT = self.deltaMixBehavior.diffDeltamdT(
             y, T, self.biBehavior, self.mixRuleBehavior, self.substances
         )
-        epsilon = self.epsilonMixBehavior.epsilonm(
+        depsilondT = self.epsilonMixBehavior.diffEpsilonmdT(
+            y, T, self.biBehavior, self.mixRuleBehavior, self.substances
+        )
+        return dbdT, dthetadT, ddeltadT, depsilondT
+
+    def getMixtureParametersd2T(self, y, T: float):
+        """
+        Second temperature derivatives of the mixture parameters of the generalized
+        cubic equation of state.
+
+        Returns
+        -------
+        d2bdT2, d2thetadT2, d2deltadT2, d2epsilondT2 : float
+        """
+        d2bdT2 = self.mixRuleBehavior.diffBmd2T(y, T, self.biBehavior, self.substances)
+        d2thetadT2 = self.mixRuleBehavior.diffThetamd2T(
+            y, T, self.thetaiBehavior, self.substances, self.k
+        )
+        d2deltadT2 = self.deltaMixBehavior.diffDeltamd2T(
             y, T, self.biBehavior, self.mixRuleBehavior, self.substances
         )
+        d2epsilondT2 = self.epsilonMixBehavior.diffEpsilonmd2T(
+            y, T, self.biBehavior, self.mixRuleBehavior, self.substances
+        )
+        return d2bdT2, d2thetadT2, d2deltadT2, d2epsilondT2
+
+    def getPVTDerivatives(self, y, T: float, V: float):
+        """
+        Partial derivatives of the pressure.
+
+        Returns
+        -------
+        dPdT : float
+            (dP/dT) at constant V, in Pa/K
+        dPdV : float
+            (dP/dV) at constant T, in Pa mol/m3
+        """
+        b, theta, delta, epsilon = self.getMixtureParameters(y, T)
+        dbdT, dthetadT, ddeltadT, depsilondT = self.getMixtureParametersdT(y, T)
+        return _getPVTDerivatives_helper(
+            T, V, R_IG, b, theta, delta, epsilon, dbdT, dthetadT, ddeltadT, depsilondT,
+        )
+
+    def getZfromPT(self, P: float, T: float, y):
+        """
+        Non-negative roots of the equation of state in Z, as an array. Only the
+        liquid (smallest) and vapor (largest) roots are returned.
+        """
+        zliq, zvap, nroots = self.getZLiqVap(P, T, y)
+        if zliq == zvap:
+            return np.array([zliq])
+        return np.array([zliq, zvap])
+
+    def getZLiqVap(self, P: float, T: float, y):
+        """
+        Liquid and vapor compressibility factors.
+
+        Returns
+        -------
+        zliq, zvap : float
+            smallest and largest non-negative roots in Z. They are equal when there's
+            only one root, and nan when there's none.
+        nroots : int
+            number of non-negative roots.
+        """
+        b, theta, delta, epsilon = self.getMixtureParameters(y, T)
+        return _getZfromPT_helper(b, theta, delta, epsilon, T, P, R_IG)
+
+    def getZfromPT_batch(self, P, T, Y):
+        """
+        Liquid and vapor compressibility factors for a batch of states.
+
+        The mixing rules are evaluated for all the states at once and the cubic is
+        solved in a compiled loop, so this is the entry point for building diagrams and
+        fitting data. Scalars P, T and a single composition are broadcast against the
+        other inputs, any other length mismatch raises ValueError.
+
+        Parameters
+        ----------
+        P : array_like
+            (N,) pressures, in Pa.
+        T : array_like
+            (N,) temperatures, in K.
+        Y : array_like
+            (N, n) matrix of compositions.
+
+        Returns
+        -------
+        zliq, zvap : ndarray
+            (N,) arrays with the smallest and largest non-negative roots in Z. They are
+            equal when there's only one root, and nan when there's none.
+        """
+        P = np.atleast_1d(np.asarray(P, dtype=np.float64))
+        T = np.atleast_1d(np.asarray(T, dtype=np.float64))
+        Y = np.atleast_2d(np.asarray(Y, dtype=np.float64))
+        N = max(len(P), len(T), len(Y))
+        for name, value in (("P", P), ("T", T), ("Y", Y)):
+            if len(value) not in (1, N):
+                raise ValueError(
+                    "{} has {} rows, expected 1 or {}".format(name, len(value), N)
+                )
+        if len(P) != N:
+            P = np.full(N, P[0])
+        if len(T) != N:
+            T = np.full(N, T[0])
+        if len(Y) != N:
+            Y = np.repeat(Y, N, axis=0)
+        P = np.ascontiguousarray(P)
+        T = np.ascontiguousarray(T)
+        Y = np.ascontiguousarray(Y)
+
+        b, theta, delta, epsilon = self.getMixtureParametersBatch(Y, T)
+        zliq, zvap, nroots = _getZfromPT_batch_helper(
+            np.ascontiguousarray(b, dtype=np.float64),
+            np.ascontiguousarray(theta, dtype=np.float64),
+            np.ascontiguousarray(delta, dtype=np.float64),
+            np.ascontiguousarray(epsilon, dtype=np.float64),
+            T,
+            P,
+            R_IG,
+        )
+        return zliq, zvap
+
+    def getPfromTV(self, T: float, V: float, y) -> float:
+        b, theta, delta, epsilon = self.getMixtureParameters(y, T)
         p = R_IG * T / (V - b) - theta / (V * (V + delta) + epsilon)
         return p
 
@@ -180,19 +428,238 @@ class EOSMixture:
             DBL_EPSILON,
         )
 
+    def getLnPhiVector(self, y, P: float, T: float, Z: float):
+        """
+        Natural logarithm of the fugacity coefficients of all components.
+
+        The pure-component parameters, the mixture parameters and their composition
+        derivatives are evaluated only once, instead of once per component as in
+        `getPhi_i`.
+
+        Parameters
+        ----------
+        y : array_like
+            molar fractions of the phase
+        P : float
+            pressure, in Pa
+        T : float
+            temperature, in K
+        Z : float
+            compressibility factor of the phase
+
+        Returns
+        -------
+        lnphi : ndarray
+            ln of the fugacity coefficient of each component.
+        """
+        y = np.atleast_1d(np.asarray(y, dtype=np.float64))
+
+        bm, thetam, deltam, epsilonm = self.getMixtureParameters(y, T)
+        # derivatives
+        diffthetam = self.mixRuleBehavior.diffThetamVector(
+            y, T, self.thetaiBehavior, self.substances, self.k
+        )
+        diffbm = self.mixRuleBehavior.diffBmVector(
+            y, T, self.biBehavior, self.substances
+        )
+        diffdeltam = self.deltaMixBehavior.diffDeltamVector(
+            y, T, self.biBehavior, self.mixRuleBehavior, self.substances
+        )
+        diffepsilonm = self.epsilonMixBehavior.diffEpsilonmVector(
+            y, T, self.biBehavior, self.mixRuleBehavior, self.substances
+        )
+        return _getLnPhi_vector_helper(
+            P,
+            T,
+            Z,
+            R_IG,
+            bm,
+            thetam,
+            deltam,
+            epsilonm,
+            diffthetam,
+            diffbm,
+            diffdeltam,
+            diffepsilonm,
+            DBL_EPSILON,
+        )
+
+    def getLnPhiDerivatives(
+        self, y, P: float, T: float, Z: float, temperature: bool = True
+    ):
+        """
+        ln of the fugacity coefficients of all components and their pressure and
+        temperature derivatives, at constant composition, for the phase with
+        compressibility factor Z.
+
+        The derivatives are analytic: the expression of `getLnPhiVector` is
+        differentiated along the volume of the phase (given by the equation of state)
+        and the temperature derivatives of the mixing rules. The temperature
+        derivative, which costs as much as the rest, is skipped (None) if temperature
+        is False.
+
+        Returns
+        -------
+        lnphi : ndarray
+        dlnphidP : ndarray
+            d ln(phi_i)/dP at constant T, in 1/Pa
+        dlnphidT : ndarray
+            d ln(phi_i)/dT at constant P, in 1/K
+        """
+        y = np.atleast_1d(np.asarray(y, dtype=np.float64))
+
+        params = self.getMixtureParameters(y, T)
+        bib, mrb = self.biBehavior, self.mixRuleBehavior
+        diffs = (
+            self.mixRuleBehavior.diffThetamVector(
+                y, T, self.thetaiBehavior, self.substances, self.k
+            ),
+            self.mixRuleBehavior.diffBmVector(y, T, bib, self.substances),
+            self.deltaMixBehavior.diffDeltamVector(y, T, bib, mrb, self.substances),
+            self.epsilonMixBehavior.diffEpsilonmVector(y, T, bib, mrb, self.substances),
+        )
+        lnphi = _getLnPhi_vector_helper(P, T, Z, R_IG, *params, *diffs, DBL_EPSILON)
+
+        V = R_IG * T * Z / P
+        no_dparams = (0.0, 0.0, 0.0, 0.0)
+        no_ddiffs = (np.zeros(self.n, dtype=np.float64),) * 4
+        dPdV = _getPVTDerivatives_helper(T, V, R_IG, *params, *no_dparams)[1]
+
+        # along P, at constant T: only the volume changes
+        dVdP = 1.0 / dPdV
+        dlnphidP = _getdLnPhi_vector_helper(
+            T,
+            V,
+            R_IG,
+            *params,
+            *diffs,
+            *no_dparams,
+            *no_ddiffs,
+            0.0,
+            dVdP,
+            1.0 / P + dVdP / V,
+            DBL_EPSILON,
+        )
+        if not temperature:
+            return lnphi, dlnphidP, None
+
+        # along T, at constant P
+        dparamsdT = self.getMixtureParametersdT(y, T)
+        ddiffsdT = (
+            self.mixRuleBehavior.diffThetamVectordT(
+                y, T, self.thetaiBehavior, self.substances, self.k
+            ),
+            self.mixRuleBehavior.diffBmVectordT(y, T, bib, self.substances),
+            self.deltaMixBehavior.diffDeltamVectordT(y, T, bib, mrb, self.substances),
+            self.epsilonMixBehavior.diffEpsilonmVectordT(
+                y, T, bib, mrb, self.substances
+            ),
+        )
+        dPdT = _getPVTDerivatives_helper(T, V, R_IG, *params, *dparamsdT)[0]
+        dVdT = -dPdT / dPdV
+        dlnphidT = _getdLnPhi_vector_helper(
+            T,
+            V,
+            R_IG,
+            *params,
+            *diffs,
+            *dparamsdT,
+            *ddiffsdT,
+            1.0,
+            dVdT,
+            dVdT / V - 1.0 / T,
+            DBL_EPSILON,
+        )
+
+        return lnphi, dlnphidP, dlnphidT
+
+    def getdLnPhidN(self, y, P: float, T: float, Z: float):
+        """
+        d ln(phi_i)/dn_j at constant T and P of the phase with compressibility factor
+        Z, for one mole with composition y.
+
+        The derivatives are analytic like those of `getLnPhiDerivatives`, with the
+        second composition derivatives of the mixing rules (their *Matrix methods,
+        by differences for the rules that don't override them).
+
+        Returns
+        -------
+        dlnphidn : ndarray
+            (n, n) matrix with d ln(phi_i)/dn_j, in 1/mol.
+        """
+        y = np.atleast_1d(np.asarray(y, dtype=np.float64))
+
+        params = self.getMixtureParameters(y, T)
+        bm, thetam, deltam, epsilonm = params
+        bib, mrb = self.biBehavior, self.mixRuleBehavior
+        diffs = (
+            self.mixRuleBehavior.diffThetamVector(
+                y, T, self.thetaiBehavior, self.substances, self.k
+            ),
+            self.mixRuleBehavior.diffBmVector(y, T, bib, self.substances),
+            self.deltaMixBehavior.diffDeltamVector(y, T, bib, mrb, self.substances),
+            self.epsilonMixBehavior.diffEpsilonmVector(y, T, bib, mrb, self.substances),
+        )
+        ddiffs = (
+            self.mixRuleBehavior.diffThetamMatrix(
+                y, T, self.thetaiBehavior, self.substances, self.k
+            )
+            - diffs[0][:, np.newaxis],
+            self.mixRuleBehavior.diffBmMatrix(y, T, bib, self.substances),
+            self.deltaMixBehavior.diffDeltamMatrix(y, T, bib, mrb, self.substances),
+            self.epsilonMixBehavior.diffEpsilonmMatrix(y, T, bib, mrb, self.substances)
+            - diffs[3][:, np.newaxis],
+        )
+        # derivatives of the mixture parameters in n_j
+        dthetam = diffs[0] - 2.0 * thetam
+        dbm = diffs[1] - bm
+        ddeltam = diffs[2] - deltam
+        depsilonm = diffs[3] - 2.0 * epsilonm
+
+        # the volume follows from the equation of state at constant T and P
+        V = R_IG * T * Z / P
+        q = V * (V + deltam) + epsilonm
+        dPdV = _getPVTDerivatives_helper(T, V, R_IG, *params, 0.0, 0.0, 0.0, 0.0)[1]
+        dPdn = (
+            R_IG * T * dbm / (V - bm) ** 2
+            - dthetam / q
+            + thetam * (V * ddeltam + depsilonm) / q ** 2
+        )
+        dV = -dPdn / dPdV
+
+        ret = np.empty((self.n, self.n), dtype=np.float64)
+        for j in range(self.n):
+            ret[:, j] = _getdLnPhi_vector_helper(
+                T,
+                V,
+                R_IG,
+                *params,
+                *diffs,
+                dbm[j],
+                dthetam[j],
+                ddeltam[j],
+                depsilonm[j],
+                *(ddiff[:, j] for ddiff in ddiffs),
+                0.0,
+                dV[j],
+                dV[j] / V,
+                DBL_EPSILON,
+            )
+        return ret
+
+    def getPhiVector(self, y, P: float, T: float, Z: float):
+        return np.exp(self.getLnPhiVector(y, P, T, Z))
+
     def getFugacity(self, y, _P: float, _T: float, _V: float, _Z: float) -> float:
-        f = 0.0
-        for i in range(self.n):
-            f += y[i] * self.getPhi_i(i, y, _P, _T, _Z)
-        return f * _P
+        phi = self.getPhiVector(y, _P, _T, _Z)
+        return np.sum(np.asarray(y, dtype=np.float64) * phi) * _P
 
     def getAllProps(
         self, y, Tref: float, T: float, Pref: float, P: float
     ) -> (Props, Props):
         log = ""
 
-        zs = self.getZfromPT(P, T, y)
-        zliq, zvap = np.min(zs), np.max(zs)
+        zliq, zvap, nroots = self.getZLiqVap(P, T, y)
         vliq, vvap = zliq * R_IG * T / P, zvap * R_IG * T / P
 
         MixSubs = MixtureProp(self.substances, y)
@@ -206,7 +673,12 @@ class EOSMixture:
         if MixSubs.hasCp():
             igprops = MixSubs.getIGProps(Tref, T, Pref, P)
             log += MixSubs.getCpLog(Tref, T)
-            pliq, pvap = self.getCpHSGUA(y, Tref, T, Pref, P)
+            # the departures at (P, T) serve both the properties and their derivatives
+            depliq = self._getDepartureProps(y, T, vliq, zliq)
+            depvap = self._getDepartureProps(y, T, vvap, zvap)
+            pliq, pvap = self.getCpHSGUA(
+                y, Tref, T, Pref, P, departures=(depliq[0], depvap[0])
+            )
         else:
             igprops = 0
             pliq, pvap = 0, 0
@@ -226,30 +698,126 @@ class EOSMixture:
         retPropsliq.Fugacity, retPropsvap.Fugacity = fl, fv
         retPropsliq.IGProps, retPropsvap.IGProps = igprops, igprops
         retPropsliq.Props, retPropsvap.Props = pliq, pvap
+        if MixSubs.hasCp():
+            retPropsliq.DerivativeProps = self.getDerivativeProps(y, P, T, zliq, depliq)
+            retPropsvap.DerivativeProps = self.getDerivativeProps(y, P, T, zvap, depvap)
         retPropsliq.log, retPropsvap.log = log, log
 
         return retPropsliq, retPropsvap
 
     def getdZdT(self, P: float, T: float, y) -> [float, float]:
-        h = 1e-5
-        z_plus_h = self.getZfromPT(P, T + h, y)
-        z_minus_h = self.getZfromPT(P, T - h, y)
-        zs = (z_plus_h - z_minus_h) / (2.0 * h)
-        return np.min(zs), np.max(zs)
+        """
+        (dZ/dT) at constant P of the liquid and vapor roots, in 1/K.
+        """
+        zliq, zvap, nroots = self.getZLiqVap(P, T, y)
+        ret = []
+        for Z in (zliq, zvap):
+            V = Z * R_IG * T / P
+            dPdT, dPdV = self.getPVTDerivatives(y, T, V)
+            dVdT = -dPdT / dPdV
+            ret.append(P * dVdT / (R_IG * T) - Z / T)
+        return ret[0], ret[1]
+
+    def getDerivativeProps(
+        self, y, P: float, T: float, Z: float, departures=None
+    ) -> DerivativeProps:
+        """
+        Heat capacities, speed of sound and Joule-Thomson coefficient of a phase.
+
+        departures is the (departure properties, dP/dT, dP/dV) of the phase at (T, V),
+        as returned by _getDepartureProps, when they have already been computed.
+
+        Raises ValueError if any of the substances doesn't have ideal gas Cp
+        parameters. The speed of sound is 0 when the molar mass is unknown.
+        """
+        y = np.atleast_1d(np.asarray(y, dtype=np.float64))
+        MixSubs = MixtureProp(self.substances, y)
+        if not MixSubs.hasCp():
+            raise ValueError("Mixture has no Cp")
+
+        V = Z * R_IG * T / P
+        if departures is None:
+            departures = self._getDepartureProps(y, T, V, Z)
+        dep, dPdT, dPdV = departures
+        cp = MixSubs.getCp(T) - dep.Cp
+        cv = cp + T * dPdT ** 2 / dPdV
+
+        M = MixSubs.getMolWt() * 1e-3
+        w = np.sqrt(-(V ** 2) * dPdV * cp / (cv * M)) if M else 0
+        mujt = (T * (-dPdT / dPdV) - V) / cp
+        return DerivativeProps(cp, cv, w, mujt)
 
-    # TODO speed up this part with numba
     def getDepartureProps(self, y, P, T, V, Z):
+        """
+        Departure properties (ideal gas minus real fluid) at (T, V).
+
+        The volume integrals of the generalized cubic equation of state are evaluated
+        in closed form, using the analytic temperature derivatives of the mixture
+        parameters.
+
+        Returns
+        -------
+        DeltaProp
+            with the Cp, H, S, G, U and A departures, in J/mol and J/(mol K).
+        """
+        return self._getDepartureProps(y, T, V, Z)[0]
+
+    def _getDepartureProps(self, y, T, V, Z):
+        """
+        getDepartureProps and the derivatives (dP/dT, dP/dV) it computes on the way.
+        """
+        b, theta, delta, epsilon = self.getMixtureParameters(y, T)
+        dbdT, dthetadT, ddeltadT, depsilondT = self.getMixtureParametersdT(y, T)
+        d2bdT2, d2thetadT2, d2deltadT2, d2epsilondT2 = self.getMixtureParametersd2T(
+            y, T
+        )
+        UR_RT, AR_RT = _getDepartureProps_helper(
+            T,
+            V,
+            Z,
+            R_IG,
+            b,
+            theta,
+            delta,
+            epsilon,
+            dbdT,
+            dthetadT,
+            ddeltadT,
+            depsilondT,
+        )
+        CvR_R = _getCvDeparture_helper(
+            T,
+            V,
+            R_IG,
+            b,
+            theta,
+            delta,
+            epsilon,
+            dbdT,
+            dthetadT,
+            ddeltadT,
+            depsilondT,
+            d2bdT2,
+            d2thetadT2,
+            d2deltadT2,
+            d2epsilondT2,
+        )
+        dPdT, dPdV = _getPVTDerivatives_helper(
+            T, V, R_IG, b, theta, delta, epsilon, dbdT, dthetadT, ddeltadT, depsilondT,
+        )
+        CpR = R_IG * (1.0 + CvR_R) + T * dPdT ** 2 / dPdV
+        ret = _getDeltaPropFromDepartures(UR_RT, AR_RT, T, Z)
+        ret.Cp = CpR
+        return ret, dPdT, dPdV
+
+    def getDeparturePropsNumerical(self, y, P, T, V, Z):
+        """
+        Departure properties by numerical quadrature of the volume integrals. Slow;
+        kept as a reference for getDepartureProps.
+        """
+
         def _Zfunc(v, t):
-            bm = self.mixRuleBehavior.bm(y, t, self.biBehavior, self.substances)
-            thetam = self.mixRuleBehavior.thetam(
-                y, t, self.thetaiBehavior, self.substances, self.k
-            )
-            delta = self.deltaMixBehavior.deltam(
-                y, t, self.biBehavior, self.mixRuleBehavior, self.substances
-            )
-            epsilon = self.epsilonMixBehavior.epsilonm(
-                y, t, self.biBehavior, self.mixRuleBehavior, self.substances
-            )
+            bm, thetam, delta, epsilon = self.getMixtureParameters(y, t)
             return v / (v - bm) - (thetam / (R_IG * t)) * v / (
                 v ** 2 + v * delta + epsilon
             )
@@ -264,25 +832,11 @@ class EOSMixture:
         def _ARfunc(v, t):
             return (1.0 - _Zfunc(v, t)) / v
 
-        # calculate UR
-        # nhau = _URfunc(V, T)
+        from scipy.integrate import quad
+
         UR_RT = quad(_URfunc, V, np.inf, args=(T,))[0]
-        UR = UR_RT * T * R_IG
-        # calculate AR
         AR_RT = quad(_ARfunc, V, np.inf, args=(T,))[0] + np.log(Z)
-        AR = AR_RT * T * R_IG
-        # calculate HR
-        HR_RT = UR_RT + 1.0 - Z
-        HR = HR_RT * R_IG * T
-        # calculate SR
-        SR_R = UR_RT - AR_RT
-        SR = SR_R * R_IG
-        # calculate GR
-        GR_RT = AR_RT + 1 - Z
-        GR = GR_RT * R_IG * T
-
-        ret = DeltaProp(0, HR, SR, GR, UR, AR)
-        return ret
+        return _getDeltaPropFromDepartures(UR_RT, AR_RT, T, Z)
 
     def getDeltaDepartureProps(
         self,
@@ -295,18 +849,31 @@ class EOSMixture:
         _T: float,
         _V: float,
         _Z: float,
+        state: DeltaProp = None,
     ) -> DeltaProp:
+        """
+        Change of the departure properties from the reference state. state is the
+        departure at (_P, _T) if it's already known.
+        """
         ref = self.getDepartureProps(y, _Pref, _Tref, _Vref, _Zref)
-        state = self.getDepartureProps(y, _P, _T, _V, _Z)
+        if state is None:
+            state = self.getDepartureProps(y, _P, _T, _V, _Z)
         delta = state.subtract(ref)
+        # Cp is a state property, not a change from the reference state
+        delta.Cp = state.Cp
         return delta
 
-    def getCpHSGUA(self, y, Tref: float, T: float, Pref: float, P: float):
-        zs = self.getZfromPT(P, T, y)
-        zsref = self.getZfromPT(Pref, Tref, y)
-
-        zliq, zvap = np.min(zs), np.max(zs)
-        zliqref, zvapref = np.min(zsref), np.max(zsref)
+    def getCpHSGUA(
+        self, y, Tref: float, T: float, Pref: float, P: float, departures=None
+    ):
+        """
+        departures is the (liquid, vapor) departure properties at (P, T) if they're
+        already known.
+        """
+        if departures is None:
+            departures = (None, None)
+        zliq, zvap, nroots = self.getZLiqVap(P, T, y)
+        zliqref, zvapref, nrootsref = self.getZLiqVap(Pref, Tref, y)
 
         vliq, vvap = zliq * R_IG * T / P, zvap * R_IG * T / P
         vliqref, vvapref = zliqref * R_IG * Tref / Pref, zvapref * R_IG * Tref / Pref
@@ -317,10 +884,10 @@ class EOSMixture:
         )  # make sure that mixture can handle single substances
 
         ddp_liq = self.getDeltaDepartureProps(
-            y, Pref, Tref, vliqref, zliqref, P, T, vliq, zliq
+            y, Pref, Tref, vliqref, zliqref, P, T, vliq, zliq, departures[0]
         )
         ddp_vap = self.getDeltaDepartureProps(
-            y, Pref, Tref, vvapref, zvapref, P, T, vvap, zvap
+            y, Pref, Tref, vvapref, zvapref, P, T, vvap, zvap, departures[1]
         )
         pliq = igprop.subtract(ddp_liq)
         pvap = igprop.subtract(ddp_vap)
@@ -334,7 +901,7 @@ class EOSMixture:
         return _helper_getPd_guess(y, T, self.Pcs, self.Tcs, self.omegas)
 
     def getCapPhi_i(self, i: int, y, P: float, T: float) -> float:
-        zv = np.max(self.getZfromPT(P, T, y))
+        zv = self.getZLiqVap(P, T, y)[1]
         return self.getPhi_i(i, y, P, T, zv)
 
     def getPSat_i(self, i: int, T: float) -> float:
@@ -366,7 +933,7 @@ class EOSMixture:
 
     def getCapPhiSat_i(self, i: int, y, T: float) -> float:
         P = self.getPSat_i(i, T)
-        zv = np.max(self.getZfromPT(P, T, y))
+        zv = self.getZLiqVap(P, T, y)[1]
         return self.getPhi_i(i, y, P, T, zv)
 
     def getDefCapPhi_i(self, i: int, y, P: float, T: float) -> float:
@@ -379,24 +946,25 @@ class EOSMixture:
         return np.sum(x * gamma * Psat / CapPhi)
 
     def getPhiVap(self, y, P, T):
-        phivap = np.zeros(self.n, dtype=np.float64)
-        zsvap = self.getZfromPT(P, T, y)
-        zvap = np.max(zsvap)
-        for i in range(self.n):
-            phivap[i] = self.getPhi_i(i, y, P, T, zvap)
-        return phivap
+        zvap = self.getZLiqVap(P, T, y)[1]
+        return self.getPhiVector(y, P, T, zvap)
 
     def getCapPhi(self, y, P, T):
-        capphi = np.ones(self.n, dtype=np.float64)
-        for i in range(self.n):
-            capphi[i] = self.getCapPhi_i(i, y, P, T)
-        return capphi
+        return self.getPhiVap(y, P, T)
 
-    def getBubblePointPressure(self, x, T: float, tol=1e3 * DBL_EPSILON, kmax=1000):
-        if self.vle_method == "phi-phi":
-            return self.getBubblePointPressure_phi_phi(x, T, tol=tol, kmax=kmax)
+    def getBubblePointPressure(
+        self, x, T: float, tol=1e3 * DBL_EPSILON, kmax=1000, guess=None
+    ):
+        """
+        guess is an optional (K factors, pressure) to start from, usually from a
+        nearby converged point.
+        """
+        if self.vle_method == "phi-phi" and self.vle_solver == "newton":
+            return self.getBubblePointPressure_newton(x, T, tol, kmax, guess)
+        elif self.vle_method == "phi-phi":
+            return self.getBubblePointPressure_phi_phi(x, T, tol, kmax, guess)
         elif self.vle_method == "UNIFAC":
-            return self.getBubblePointPressure_UNIFAC(x, T, tol=tol, kmax=kmax)
+            return self.getBubblePointPressure_UNIFAC(x, T, tol, kmax, guess)
         else:
             raise NotImplementedError("gamma-phi not implemented")
 
@@ -408,7 +976,9 @@ class EOSMixture:
         Psat = np.asarray([self.getPSat_i(i, T) for i in range(self.n)])
         return Psat
 
-    def getBubblePointPressure_UNIFAC(self, x, T, tol=1e3 * DBL_EPSILON, kmax=100):
+    def getBubblePointPressure_UNIFAC(
+        self, x, T, tol=1e3 * DBL_EPSILON, kmax=100, guess=None
+    ):
 
         assert len(x) == self.n
         assert np.sum(x) == 1.0
@@ -416,7 +986,11 @@ class EOSMixture:
         x = np.atleast_1d(x)
 
         gamma = self.unifac_model.getGamma(x, T)
-        capphi = np.ones(self.n, dtype=np.float64)
+        if guess is None:
+            capphi = np.ones(self.n, dtype=np.float64)
+        else:
+            k, pb = guess
+            capphi = self.getCapPhi(x * k / np.sum(x * k), pb, T)
         PSat = self.getPsat(T)
 
         pb = self.get_P_eq_12_11(x, gamma, PSat, capphi)
@@ -435,95 +1009,103 @@ class EOSMixture:
         k = self.get_k_gamma_phi(gamma, PSat, pb, capphi)
         return y, pb, phivap, gamma, k, ite
 
-    def getBubblePointPressure_phi_phi(self, x, T, tol=1e3 * DBL_EPSILON, kmax=1000):
+    def getBubblePointPressure_phi_phi(
+        self, x, T, tol=1e3 * DBL_EPSILON, kmax=1000, guess=None
+    ):
 
         assert len(x) == self.n
         assert np.sum(x) == 1.0
 
         x = np.atleast_1d(x)
-        pb = self._getPb_guess(x, T)
-
-        k = np.exp(
-            np.log(self.Pcs / pb) + 5.373 * (1 + self.omegas) * (1.0 - self.Tcs / T)
-        )
+        if guess is None:
+            pb = self._getPb_guess(x, T)
+            k = np.exp(
+                np.log(self.Pcs / pb) + 5.373 * (1 + self.omegas) * (1.0 - self.Tcs / T)
+            )
+        else:
+            k, pb = guess
         y = x * k / np.sum(x * k)
 
+        stats = SolverStats("bubble point pressure (phi-phi)")
+        accelerator = self._getAccelerator("bubbleP")
         err = 100
         ite = 0
 
-        phivap = np.empty(self.n, dtype=np.float64)
-        philiq = np.empty(self.n, dtype=np.float64)
-
         while err > tol and ite < kmax:
             ite += 1
 
-            zsvap = self.getZfromPT(pb, T, y)
-            zsliq = self.getZfromPT(pb, T, x)
+            zvap = self.getZLiqVap(pb, T, y)[1]
+            zliq = self.getZLiqVap(pb, T, x)[0]
 
-            zvap = np.max(zsvap)
-            zliq = np.min(zsliq)
+            phivap = self.getPhiVector(y, pb, T, zvap)
+            philiq = self.getPhiVector(x, pb, T, zliq)
 
-            for i in range(self.n):
-                phivap[i] = self.getPhi_i(i, y, pb, T, zvap)
-                philiq[i] = self.getPhi_i(i, x, pb, T, zliq)
-
-            k = philiq / phivap
-            y = x * k
-            yt = np.sum(y)
-            pb = pb * yt
+            k_new = philiq / phivap
+            yt = np.sum(x * k_new)
             err = np.abs(1.0 - yt)
+            k, pb = _accelerateKS(accelerator, k, pb, k_new, pb * yt)
+            y = x * k
 
+        self._finishStats(stats, accelerator, ite, err <= tol)
         return y, pb, phivap, philiq, k, ite
 
     ####### DEW POINT ###########
 
-    def getDewPointPressure(self, y, T: float, tol=1e3 * DBL_EPSILON, kmax=1000):
-        if self.vle_method == "phi-phi":
-            return self.getDewPointPressure_phi_phi(y, T, tol=tol, kmax=kmax)
+    def getDewPointPressure(
+        self, y, T: float, tol=1e3 * DBL_EPSILON, kmax=1000, guess=None
+    ):
+        """
+        guess is an optional (K factors, pressure) to start from, usually from a
+        nearby converged point. The UNIFAC solver doesn't use it.
+        """
+        if self.vle_method == "phi-phi" and self.vle_solver == "newton":
+            return self.getDewPointPressure_newton(y, T, tol, kmax, guess)
+        elif self.vle_method == "phi-phi":
+            return self.getDewPointPressure_phi_phi(y, T, tol, kmax, guess)
         elif self.vle_method == "UNIFAC":
             return self.getDewPointPressure_UNIFAC(y, T, tol=tol, kmax=kmax)
         else:
             raise NotImplementedError("gamma-phi not implemented")
 
-    def getDewPointPressure_phi_phi(self, y, T, tol=1e3 * DBL_EPSILON, kmax=1000):
+    def getDewPointPressure_phi_phi(
+        self, y, T, tol=1e3 * DBL_EPSILON, kmax=1000, guess=None
+    ):
         assert len(y) == self.n
         assert np.sum(y) == 1.0
 
         y = np.atleast_1d(y)
-        pd = self._getPd_guess(y, T)
-
-        k = np.exp(
-            np.log(self.Pcs / pd) + 5.373 * (1 + self.omegas) * (1.0 - self.Tcs / T)
-        )
+        if guess is None:
+            pd = self._getPd_guess(y, T)
+            k = np.exp(
+                np.log(self.Pcs / pd) + 5.373 * (1 + self.omegas) * (1.0 - self.Tcs / T)
+            )
+        else:
+            k, pd = guess
         x = y / k
         x = x / np.sum(x)
 
+        stats = SolverStats("dew point pressure (phi-phi)")
+        accelerator = self._getAccelerator("dewP")
         err = 100
         ite = 0
 
-        phivap = np.empty(self.n, dtype=np.float64)
-        philiq = np.empty(self.n, dtype=np.float64)
-
         while err > tol and ite < kmax:
             ite += 1
 
-            zsvap = self.getZfromPT(pd, T, y)
-            zsliq = self.getZfromPT(pd, T, x)
+            zvap = self.getZLiqVap(pd, T, y)[1]
+            zliq = self.getZLiqVap(pd, T, x)[0]
 
-            zvap = np.max(zsvap)
-            zliq = np.min(zsliq)
+            phivap = self.getPhiVector(y, pd, T, zvap)
+            philiq = self.getPhiVector(x, pd, T, zliq)
 
-            for i in range(self.n):
-                phivap[i] = self.getPhi_i(i, y, pd, T, zvap)
-                philiq[i] = self.getPhi_i(i, x, pd, T, zliq)
-
-            k = philiq / phivap
-            x = y / k
-            xt = np.sum(x)
-            pd = pd / xt
+            k_new = philiq / phivap
+            xt = np.sum(y / k_new)
             err = np.abs(1.0 - xt)
-            x = x / xt
+            k, pd = _accelerateKS(accelerator, k, pd, k_new, pd / xt)
+            x = y / k
+            x = x / np.sum(x)
 
+        self._finishStats(stats, accelerator, ite, err <= tol)
         return x, pd, phivap, philiq, k, ite
 
     def getP_eq_12_12(self, y, gamma, Psat, capphi):
@@ -555,15 +1137,10 @@ class EOSMixture:
         while err > tol and ite < kmax:
             ite += 1
             capphi = self.getCapPhi(y, pd, T)
-            err2 = 100
-            ite2 = 0
-            while err2 > tol and ite2 < kmax:
-                ite2 += 1
-                x = self.get_x_eq_12_10(y, gamma, Psat, capphi, pd)
-                x = x / np.sum(x)
-                gamma_old = gamma
-                gamma = self.unifac_model.getGamma(x, T)
-                err2 = np.max(np.abs(gamma_old - gamma))
+            x = self.get_x_eq_12_10(y, gamma, Psat, capphi, pd)
+            x, gamma = self._getLiquidComposition_UNIFAC(
+                y * capphi * pd / Psat, x / np.sum(x), T, tol=tol, kmax=kmax
+            )
             pd_old = pd
             pd = self.getP_eq_12_12(y, gamma, Psat, capphi)
             err = np.abs((pd - pd_old) / pd)
@@ -572,11 +1149,59 @@ class EOSMixture:
         k = self.get_k_gamma_phi(gamma, Psat, pd, capphi)
         return x, pd, phivap, gamma, k, ite
 
-    def getBubblePointTemperature(self, x, P: float, tol=1e3 * DBL_EPSILON, kmax=100):
-        if self.vle_method == "phi-phi":
-            return self.getBubblePointTemperature_phi_phi(x, P, tol=tol, kmax=kmax)
+    def _getLiquidComposition_UNIFAC(
+        self, a, x, T: float, tol=1e3 * DBL_EPSILON, kmax=100
+    ):
+        """
+        Solves x_i gamma_i(x, T) = a_i / sum_j(a_j / gamma_j) for the liquid mole
+        fractions x, with Newton steps on ln(x_i) + ln(gamma_i) - ln(a_i) - mu = 0 and
+        sum(x) = 1, starting from x.
+
+        Returns
+        -------
+        x, gamma
+        """
+        n = self.n
+        lna = np.log(a)
+        jac = np.zeros((n + 1, n + 1), dtype=np.float64)
+        jac[:n, n] = -1.0
+        jac[n, :n] = 1.0
+        f = np.empty(n + 1, dtype=np.float64)
+
+        lngamma, dlngamma_dx = self.unifac_model.getLnGammaDerivatives(x, T)[:2]
+        mu = -np.log(np.sum(a / np.exp(lngamma)))
+        ite = 0
+        while ite < kmax:
+            ite += 1
+            f[:n] = np.log(x) + lngamma - lna - mu
+            f[n] = np.sum(x) - 1.0
+            if np.max(np.abs(f)) < tol:
+                break
+            jac[:n, :n] = dlngamma_dx + np.diag(1.0 / x)
+            step = np.linalg.solve(jac, -f)
+            # keep the mole fractions positive
+            alpha = 1.0
+            while np.any(x + alpha * step[:n] <= 0.0):
+                alpha *= 0.5
+            x = x + alpha * step[:n]
+            mu += alpha * step[n]
+            lngamma, dlngamma_dx = self.unifac_model.getLnGammaDerivatives(x, T)[:2]
+
+        return x, np.exp(lngamma)
+
+    def getBubblePointTemperature(
+        self, x, P: float, tol=1e3 * DBL_EPSILON, kmax=100, guess=None
+    ):
+        """
+        guess is an optional (K factors, temperature) to start from, usually from a
+        nearby converged point.
+        """
+        if self.vle_method == "phi-phi" and self.vle_solver == "newton":
+            return self.getBubblePointTemperature_newton(x, P, tol, kmax, guess)
+        elif self.vle_method == "phi-phi":
+            return self.getBubblePointTemperature_phi_phi(x, P, tol, kmax, guess)
         elif self.vle_method == "UNIFAC":
-            return self.getBubblePointTemperature_UNIFAC(x, P, tol=tol, kmax=kmax)
+            return self.getBubblePointTemperature_UNIFAC(x, P, tol, kmax, guess)
         else:
             raise NotImplementedError("gamma-phi not implemented")
 
@@ -584,15 +1209,22 @@ class EOSMixture:
         k = gamma * psat / (P * capphi)
         return k
 
-    def getBubblePointTemperature_UNIFAC(self, x, P, tol=1e3 * DBL_EPSILON, kmax=100):
+    def getBubblePointTemperature_UNIFAC(
+        self, x, P, tol=1e3 * DBL_EPSILON, kmax=100, guess=None
+    ):
         assert len(x) == self.n
         x = np.atleast_1d(x)
         assert np.sum(x) == 1.0
 
-        tsat = self.getTsat(P)
-
-        tb = np.float(np.sum(x * tsat))
-        capphi = np.ones(self.n, dtype=np.float64)
+        if guess is None:
+            tb = float(np.sum(x * self.getTsat(P)))
+            capphi = np.ones(self.n, dtype=np.float64)
+            # second point of the secant
+            tb_step = 1.1
+        else:
+            k, tb = guess
+            capphi = self.getCapPhi(x * k / np.sum(x * k), P, tb)
+            tb_step = 1.01
         psat = self.getPsat(tb)
         gamma = self.unifac_model.getGamma(x, tb)
         k = self.get_k_gamma_phi(gamma, psat, P, capphi)
@@ -600,7 +1232,7 @@ class EOSMixture:
         tb2 = tb
         f2 = np.sum(x * k) - 1.0
 
-        tb1 = tb * 1.1
+        tb1 = tb * tb_step
         y = x * k / np.sum(x * k)
         capphi = self.getCapPhi(y, P, tb1)
         psat = self.getPsat(tb1)
@@ -610,6 +1242,11 @@ class EOSMixture:
 
         y = x * k / np.sum(x * k)
 
+        stats = SolverStats("bubble point temperature (UNIFAC)")
+        accelerator = self._getAccelerator("bubbleT")
+        # K factors of the vapor composition; only the composition is accelerated,
+        # the secant on T follows the unaccelerated K factors
+        ky = k
         err = 100
         ite = 0
 
@@ -622,39 +1259,45 @@ class EOSMixture:
             gamma = self.unifac_model.getGamma(x, tb)
             k = self.get_k_gamma_phi(gamma, psat, P, capphi)
 
-            y = x * k
-            yt = np.sum(y)
+            yt = np.sum(x * k)
             err = np.abs(1.0 - yt)
-            y = y / yt
+            ky = _accelerateK(accelerator, ky, k)
+            y = x * ky / np.sum(x * ky)
             tb2 = tb1
             tb1 = tb
             f2 = f1
             f1 = np.sum(k * x) - 1.0
 
+        self._finishStats(stats, accelerator, ite, err <= tol)
         phivap = self.getPhiVap(y, P, tb)
         return y, tb, phivap, gamma, k, ite
 
     # TODO optimize this! here, I used the secant method for Tb convergence.
-    def getBubblePointTemperature_phi_phi(self, x, P, tol=1e3 * DBL_EPSILON, kmax=100):
+    def getBubblePointTemperature_phi_phi(
+        self, x, P, tol=1e3 * DBL_EPSILON, kmax=100, guess=None
+    ):
 
         assert len(x) == self.n
         x = np.atleast_1d(x)
         assert np.sum(x) == 1.0
 
-        Tbi = np.empty(self.n)
-        for i in range(self.n):
-            if self.substances[i].Tb > 0:
-                Tbi[i] = self.substances[i].Tb
-            else:
-                Tbi[i] = 100.0
+        if guess is None:
+            Tbi = np.empty(self.n)
+            for i in range(self.n):
+                if self.substances[i].Tb > 0:
+                    Tbi[i] = self.substances[i].Tb
+                else:
+                    Tbi[i] = 100.0
 
-        tb = _helper_bubble_T_guess_from_wilson(
-            x, P, np.sum(x * Tbi), self.Pcs, self.Tcs, self.omegas
-        )
+            tb = _helper_bubble_T_guess_from_wilson(
+                x, P, np.sum(x * Tbi), self.Pcs, self.Tcs, self.omegas
+            )
 
-        k = np.exp(
-            np.log(self.Pcs / P) + 5.373 * (1 + self.omegas) * (1.0 - self.Tcs / tb)
-        )
+            k = np.exp(
+                np.log(self.Pcs / P) + 5.373 * (1 + self.omegas) * (1.0 - self.Tcs / tb)
+            )
+        else:
+            k, tb = guess
 
         err = 100
         ite = 0
@@ -662,48 +1305,63 @@ class EOSMixture:
         tb2 = tb
         f2 = np.sum(x * k) - 1.0
 
-        tb1 = tb * 1.1
-        k = np.exp(
-            np.log(self.Pcs / P) + 5.373 * (1 + self.omegas) * (1.0 - self.Tcs / tb1)
-        )
+        if guess is None:
+            tb1 = tb * 1.1
+            k = np.exp(
+                np.log(self.Pcs / P)
+                + 5.373 * (1 + self.omegas) * (1.0 - self.Tcs / tb1)
+            )
+        else:
+            # Wilson's temperature dependence from the guessed K factors
+            tb1 = tb * 1.01
+            k = k * np.exp(
+                5.373 * (1 + self.omegas) * self.Tcs * (1.0 / tb - 1.0 / tb1)
+            )
         f1 = np.sum(x * k) - 1.0
 
         y = x * k / np.sum(x * k)
 
-        phivap = np.empty(self.n, dtype=np.float64)
-        philiq = np.empty(self.n, dtype=np.float64)
-
+        stats = SolverStats("bubble point temperature (phi-phi)")
+        accelerator = self._getAccelerator("bubbleT")
+        # K factors of the vapor composition; only the composition is accelerated,
+        # the secant on T follows the unaccelerated K factors
+        ky = k
         while err > tol and ite < kmax:
             ite += 1
 
             tb = tb1 - f1 * ((tb1 - tb2) / (f1 - f2))
 
-            zsvap = self.getZfromPT(P, tb, y)
-            zsliq = self.getZfromPT(P, tb, x)
+            zvap = self.getZLiqVap(P, tb, y)[1]
+            zliq = self.getZLiqVap(P, tb, x)[0]
 
-            zvap = np.max(zsvap)
-            zliq = np.min(zsliq)
-
-            for i in range(self.n):
-                phivap[i] = self.getPhi_i(i, y, P, tb, zvap)
-                philiq[i] = self.getPhi_i(i, x, P, tb, zliq)
+            phivap = self.getPhiVector(y, P, tb, zvap)
+            philiq = self.getPhiVector(x, P, tb, zliq)
 
             k = philiq / phivap
 
-            y = x * k
-            yt = np.sum(y)
+            yt = np.sum(x * k)
             err = np.abs(1.0 - yt)
-            y = y / yt
+            ky = _accelerateK(accelerator, ky, k)
+            y = x * ky / np.sum(x * ky)
             tb2 = tb1
             tb1 = tb
             f2 = f1
             f1 = np.sum(k * x) - 1.0
 
+        self._finishStats(stats, accelerator, ite, err <= tol)
         return y, tb, phivap, philiq, k, ite
 
-    def getDewPointTemperature(self, y, P: float, tol=1e3 * DBL_EPSILON, kmax=100):
-        if self.vle_method == "phi-phi":
-            return self.getDewPointTemperature_phi_phi(y, P, tol=tol, kmax=kmax)
+    def getDewPointTemperature(
+        self, y, P: float, tol=1e3 * DBL_EPSILON, kmax=100, guess=None
+    ):
+        """
+        guess is an optional (K factors, temperature) to start from, usually from a
+        nearby converged point. The UNIFAC solver doesn't use it.
+        """
+        if self.vle_method == "phi-phi" and self.vle_solver == "newton":
+            return self.getDewPointTemperature_newton(y, P, tol, kmax, guess)
+        elif self.vle_method == "phi-phi":
+            return self.getDewPointTemperature_phi_phi(y, P, tol, kmax, guess)
         elif self.vle_method == "UNIFAC":
             return self.getDewPointTemperature_UNIFAC(y, P, tol=tol, kmax=kmax)
         else:
@@ -738,6 +1396,11 @@ class EOSMixture:
         x = self.get_x_eq_12_10(y, gamma, psat, capphi, P)
         x = x / np.sum(x)
 
+        stats = SolverStats("dew point temperature (UNIFAC)")
+        accelerator = self._getAccelerator("dewT")
+        # K factors of the liquid composition; only the composition is accelerated,
+        # the secant on T follows the unaccelerated K factors
+        kx = k
         err = 100
         ite = 0
         while err > tol and ite < kmax:
@@ -749,47 +1412,58 @@ class EOSMixture:
             gamma = self.unifac_model.getGamma(x, td)
             k = self.get_k_gamma_phi(gamma, psat, P, capphi)
 
-            x = self.get_x_eq_12_10(y, gamma, psat, capphi, P)
-            xt = np.sum(x)
+            xt = np.sum(y / k)
             err = np.abs(1.0 - xt)
-
-            x = x / xt
+            kx = _accelerateK(accelerator, kx, k)
+            x = y / kx / np.sum(y / kx)
             td2 = td1
             td1 = td
             f2 = f1
             f1 = np.sum(y / k) - 1.0
 
+        self._finishStats(stats, accelerator, ite, err <= tol)
         phivap = self.getPhiVap(y, P, td)
         return x, td, phivap, gamma, k, ite
 
     def getDewPointTemperature_phi_phi(
-        self, y, P: float, tol: float = 1e4 * DBL_EPSILON, kmax: int = 1000
+        self, y, P: float, tol: float = 1e4 * DBL_EPSILON, kmax: int = 1000, guess=None,
     ):
         assert len(y) == self.n
         y = np.atleast_1d(y)
         assert np.sum(y) == 1.0
 
-        Tdi = np.empty(self.n)
+        if guess is None:
+            Tdi = np.empty(self.n)
 
-        for i in range(self.n):
-            if self.substances[i].Tb > 0:
-                Tdi[i] = self.substances[i].Tb
-            else:
-                Tdi[i] = 100.0
+            for i in range(self.n):
+                if self.substances[i].Tb > 0:
+                    Tdi[i] = self.substances[i].Tb
+                else:
+                    Tdi[i] = 100.0
 
-        td = np.sum(y * Tdi)
+            td = np.sum(y * Tdi)
 
-        k = np.exp(
-            np.log(self.Pcs / P) + 5.373 * (1 + self.omegas) * (1.0 - self.Tcs / td)
-        )
+            k = np.exp(
+                np.log(self.Pcs / P) + 5.373 * (1 + self.omegas) * (1.0 - self.Tcs / td)
+            )
+        else:
+            k, td = guess
 
         td2 = td
         f2 = np.sum(y / k) - 1.0
 
-        td1 = td * 1.1
-        k = np.exp(
-            np.log(self.Pcs / P) + 5.373 * (1 + self.omegas) * (1.0 - self.Tcs / td1)
-        )
+        if guess is None:
+            td1 = td * 1.1
+            k = np.exp(
+                np.log(self.Pcs / P)
+                + 5.373 * (1 + self.omegas) * (1.0 - self.Tcs / td1)
+            )
+        else:
+            # Wilson's temperature dependence from the guessed K factors
+            td1 = td * 1.01
+            k = k * np.exp(
+                5.373 * (1 + self.omegas) * self.Tcs * (1.0 / td - 1.0 / td1)
+            )
         f1 = np.sum(y / k) - 1.0
 
         err = 100
@@ -797,36 +1471,34 @@ class EOSMixture:
         # x = np.full(self.n, 1.0 / self.n)
         x = (y / k) / np.sum(y / k)
 
-        phivap = np.empty(self.n, dtype=np.float64)
-        philiq = np.empty(self.n, dtype=np.float64)
-
+        stats = SolverStats("dew point temperature (phi-phi)")
+        accelerator = self._getAccelerator("dewT")
+        # K factors of the liquid composition; only the composition is accelerated,
+        # the secant on T follows the unaccelerated K factors
+        kx = k
         while err > tol and ite < kmax:
             ite += 1
 
             td = td1 - f1 * ((td1 - td2) / (f1 - f2))
 
-            zsvap = self.getZfromPT(P, td, y)
-            zsliq = self.getZfromPT(P, td, x)
-
-            zvap = np.max(zsvap)
-            zliq = np.min(zsliq)
+            zvap = self.getZLiqVap(P, td, y)[1]
+            zliq = self.getZLiqVap(P, td, x)[0]
 
-            for i in range(self.n):
-                phivap[i] = self.getPhi_i(i, y, P, td, zvap)
-                philiq[i] = self.getPhi_i(i, x, P, td, zliq)
+            phivap = self.getPhiVector(y, P, td, zvap)
+            philiq = self.getPhiVector(x, P, td, zliq)
 
             k = philiq / phivap
 
-            x = y / k
-            xt = np.sum(x)
+            xt = np.sum(y / k)
             err = np.abs(1.0 - xt)
-
-            x = x / xt
+            kx = _accelerateK(accelerator, kx, k)
+            x = y / kx / np.sum(y / kx)
             td2 = td1
             td1 = td
             f2 = f1
             f1 = np.sum(y / k) - 1.0
 
+        self._finishStats(stats, accelerator, ite, err <= tol)
         return x, td, phivap, philiq, k, ite
 
     def getFlash(self, z, P: float, T: float, tol=1e5 * DBL_EPSILON, kmax=1000):
@@ -843,44 +1515,30 @@ class EOSMixture:
         z = np.atleast_1d(z)
         assert np.sum(z) == 1.0
 
-        # check if is flash problem
-        y, pd, pv, pl, k, ite = self.getDewPointPressure(z, T)
-        x, pb, pv, pl, k, ite = self.getBubblePointPressure(z, T)
-
-        if not (pd <= P <= pb):
-            raise ValueError("P is not between Pdew and Pbubble")
-
-        v = (pb - P) / (pb - pd)
+        k, v, x, y = self._getFlashInitialGuess(z, P, T)
 
         err = 100
         ite = 0
 
-        phivap = np.empty(self.n, dtype=np.float64)
-        philiq = np.empty(self.n, dtype=np.float64)
-
-        y = np.full(self.n, 1.0 / self.n)
-        x = np.full(self.n, 1.0 / self.n)
-
+        stats = SolverStats("flash (phi-phi)")
+        accelerator = self._getAccelerator("flash")
         while err > tol and ite < kmax:
             ite += 1
-            zsvap = self.getZfromPT(P, T, y)
-            zsliq = self.getZfromPT(P, T, x)
+            zvap = self.getZLiqVap(P, T, y)[1]
+            zliq = self.getZLiqVap(P, T, x)[0]
 
-            zvap = np.max(zsvap)
-            zliq = np.min(zsliq)
+            phivap = self.getPhiVector(y, P, T, zvap)
+            philiq = self.getPhiVector(x, P, T, zliq)
 
-            for i in range(self.n):
-                phivap[i] = self.getPhi_i(i, y, P, T, zvap)
-                philiq[i] = self.getPhi_i(i, x, P, T, zliq)
-
-            k = philiq / phivap
+            k = _accelerateK(accelerator, k, philiq / phivap)
 
             vold = v
-            v = _RachfordRice(v, k, z, tol=1e-8, kmax=500)
+            v = solve_rachford_rice(v, k, z, tol=1e-8, kmax=500)
             x = z / (1.0 + v * (k - 1.0))
             y = k * x
             err = np.abs(v - vold)
 
+        self._finishStats(stats, accelerator, ite, err <= tol)
         return x, y, v, phivap, philiq, k, ite
 
     def getFlash_UNIFAC(self, z, P: float, T: float, tol=1e5 * DBL_EPSILON, kmax=1000):
@@ -889,19 +1547,11 @@ class EOSMixture:
         z = np.atleast_1d(z)
         assert np.sum(z) == 1.0
 
-        # check if is flash problem
-        y, pd, pv, pl, k, ite = self.getDewPointPressure(z, T)
-        x, pb, pv, pl, k, ite = self.getBubblePointPressure(z, T)
-
-        if not (pd <= P <= pb):
-            raise ValueError("P is not between Pdew and Pbubble")
-
-        v = (pb - P) / (pb - pd)
-
+        k, v, x, y = self._getFlashInitialGuess(z, P, T)
         psat = self.getPsat(T)
-        y = np.full(self.n, 1.0 / self.n)
-        x = np.full(self.n, 1.0 / self.n)
 
+        stats = SolverStats("flash (UNIFAC)")
+        accelerator = self._getAccelerator("flash")
         err = 100
         ite = 0
 
@@ -910,119 +1560,687 @@ class EOSMixture:
             phivap = self.getPhiVap(y, P, T)
             gamma = self.unifac_model.getGamma(x, T)
             capphi = self.getCapPhi(y, P, T)
-            k = self.get_k_gamma_phi(gamma, psat, P, capphi)
+            k = _accelerateK(
+                accelerator, k, self.get_k_gamma_phi(gamma, psat, P, capphi)
+            )
 
             vold = v
-            v = _RachfordRice(v, k, z, tol=1e-8, kmax=500)
+            v = solve_rachford_rice(v, k, z, tol=1e-8, kmax=500)
             x = z / (1.0 + v * (k - 1.0))
             y = k * x
             err = np.abs(v - vold)
 
+        self._finishStats(stats, accelerator, ite, err <= tol)
         return x, y, v, phivap, gamma, k, ite
 
-    def isobaricBinaryMixtureGenData(self, P, x=None, Punit="Pa", Tunit="K"):
+    def _getFlashInitialGuess(self, z, P: float, T: float):
+        """
+        K factors, vapor fraction and phase compositions that start the flash, from
+        the stability analysis of the feed. Raises ValueError if the feed is stable.
+        """
+        stable, k, tm = self.getStabilityAnalysis(z, P, T)
+        if stable:
+            raise ValueError("The feed is stable, it doesn't split into two phases")
+        v = solve_rachford_rice(0.5, k, z, tol=1e-8, kmax=500)
+        x = z / (1.0 + v * (k - 1.0))
+        y = k * x
+        return k, v, x, y
+
+    ####### STABILITY ANALYSIS ###########
+
+    def getStabilityAnalysis(self, z, P: float, T: float, tol=1e-10, kmax=200):
+        """
+        Michelsen's tangent plane stability analysis of the feed z at P and T.
+
+        A vapor-like (z K) and a liquid-like (z / K) trial phase, with Wilson's K
+        factors, are converged by successive substitution of
+        ln(W_i) = d_i - ln(f_i(w) / w_i), with d_i = ln(f_i(z)) and w = W / sum(W),
+        accelerated as set by setAcceleration for "flash". The feed is unstable if a
+        nontrivial trial phase has tm = 1 - sum(W) < 0.
+
+        Returns
+        -------
+        stable : bool
+        k : K factors to start the flash from, None if the feed is stable
+        tm : smallest tangent plane distance of the nontrivial trial phases
+        """
+        z = np.atleast_1d(z)
+        d = np.log(z) + self._getLnFugacityCoefficients(z, P, T, None)
+        kw = np.exp(
+            np.log(self.Pcs / P) + 5.373 * (1 + self.omegas) * (1.0 - self.Tcs / T)
+        )
 
-        assert self.n == 2
+        trials = []
+        for phase, W in (("vapor", z * kw), ("liquid", z / kw)):
+            accelerator = self._getAccelerator("flash")
+            lnW = np.log(W)
+            trivial = False
+            for ite in range(kmax):
+                w = np.exp(lnW) / np.sum(np.exp(lnW))
+                lnW_new = d - self._getLnFugacityCoefficients(w, P, T, phase)
+                if accelerator is not None:
+                    lnW_new = accelerator.update(lnW, lnW_new)
+                step = np.max(np.abs(lnW_new - lnW))
+                lnW = lnW_new
+                # converging to the feed itself
+                if np.sum((lnW - np.log(z)) ** 2) < 1e-4:
+                    trivial = True
+                    break
+                if step < tol:
+                    break
+            W = np.exp(lnW)
+            if not trivial:
+                trials.append((phase, W, 1.0 - np.sum(W)))
+
+        unstable = [t for t in trials if t[2] < -1e-10]
+        tm = min([t[2] for t in trials], default=0.0)
+        if not unstable:
+            return True, None, tm
+
+        w = {phase: W / np.sum(W) for phase, W, tmi in unstable}
+        if len(w) == 2:
+            k = w["vapor"] / w["liquid"]
+        elif "vapor" in w:
+            k = w["vapor"] / z
+        else:
+            k = z / w["liquid"]
+        return False, k, tm
+
+    def _getLnFugacityCoefficients(self, w, P: float, T: float, phase):
+        """
+        ln(f_i / w_i) of the phase with composition w, with fugacities in Pa. With
+        phi-phi, the root of lowest Gibbs energy is used whatever the phase. With
+        UNIFAC, the liquid is described by gamma and Psat and the vapor by the EOS;
+        phase=None selects the one of lowest Gibbs energy.
+        """
+        if self.vle_method == "UNIFAC":
+            if phase == "liquid":
+                return np.log(self.unifac_model.getGamma(w, T) * self.getPsat(T))
+            if phase == "vapor":
+                return np.log(self.getCapPhi(w, P, T) * P)
+            lnf = [
+                self._getLnFugacityCoefficients(w, P, T, "liquid"),
+                self._getLnFugacityCoefficients(w, P, T, "vapor"),
+            ]
+        else:
+            zliq, zvap = self.getZLiqVap(P, T, w)[:2]
+            lnf = [self.getLnPhiVector(w, P, T, zliq) + np.log(P)]
+            if zvap != zliq:
+                lnf.append(self.getLnPhiVector(w, P, T, zvap) + np.log(P))
+        return min(lnf, key=lambda lnfi: np.sum(w * lnfi))
 
-        if x is None:
-            x = x_vec_for_plot
+    ####### NEWTON SOLVERS ###########
+
+    def getBubblePointPressure_newton(
+        self, x, T: float, tol=1e3 * DBL_EPSILON, kmax=100, guess=None
+    ):
+        """
+        Bubble point pressure by Newton's method on ln(K_i) and ln(P), see
+        _getSaturationPoint_newton. Same results as getBubblePointPressure_phi_phi.
+        """
+        x = np.atleast_1d(x)
+        if guess is None:
+            P, lnK = self._getPb_guess(x, T), None
+        else:
+            P, lnK = guess[1], np.log(guess[0])
+        return self._getSaturationPoint_newton(
+            x, P, T, True, "P", tol, kmax, "bubble point pressure (Newton)", lnK=lnK
+        )
+
+    def getDewPointPressure_newton(
+        self, y, T: float, tol=1e3 * DBL_EPSILON, kmax=100, guess=None
+    ):
+        y = np.atleast_1d(y)
+        if guess is None:
+            P, lnK = self._getPd_guess(y, T), None
+        else:
+            P, lnK = guess[1], np.log(guess[0])
+        return self._getSaturationPoint_newton(
+            y, P, T, False, "P", tol, kmax, "dew point pressure (Newton)", lnK=lnK
+        )
 
+    def getBubblePointTemperature_newton(
+        self, x, P: float, tol=1e3 * DBL_EPSILON, kmax=100, guess=None
+    ):
         x = np.atleast_1d(x)
+        if guess is None:
+            T, lnK = self._getT_guess(x, P, True), None
+        else:
+            T, lnK = guess[1], np.log(guess[0])
+        return self._getSaturationPoint_newton(
+            x, P, T, True, "T", tol, kmax, "bubble point temperature (Newton)", lnK=lnK
+        )
 
-        xmix = np.empty(2, dtype=np.float64)
-        y = np.empty(len(x), dtype=np.float64)
-        T = np.empty(len(x), dtype=np.float64)
-        kvec = np.empty(len(x), dtype=np.float64)
-        phi_vap_vec = np.empty(len(x), dtype=np.float64)
-        phi_liq_vec = np.empty(len(x), dtype=np.float64)
-        pv = np.empty(len(x), dtype=np.float64)
-        pl = np.empty(len(x), dtype=np.float64)
-        k = np.empty(len(x), dtype=np.float64)
+    def getDewPointTemperature_newton(
+        self, y, P: float, tol=1e4 * DBL_EPSILON, kmax=100, guess=None
+    ):
+        y = np.atleast_1d(y)
+        if guess is None:
+            T, lnK = self._getT_guess(y, P, False), None
+        else:
+            T, lnK = guess[1], np.log(guess[0])
+        return self._getSaturationPoint_newton(
+            y, P, T, False, "T", tol, kmax, "dew point temperature (Newton)", lnK=lnK
+        )
 
-        for i in range(len(x)):
-            xmix[0] = x[i]
-            xmix[1] = 1.0 - x[i]
+    def _getT_guess(self, z, P: float, bubble: bool) -> float:
+        Tbi = np.array(
+            [s.Tb if s.Tb > 0 else 100.0 for s in self.substances], dtype=np.float64
+        )
+        return _helper_T_guess_from_wilson(
+            np.asarray(z, dtype=np.float64),
+            P,
+            np.sum(z * Tbi),
+            self.Pcs,
+            self.Tcs,
+            self.omegas,
+            bubble,
+        )
 
-            try:
-                yres, T[i], pv, pl, k, ite = self.getBubblePointTemperature(xmix, P)
-            except:
-                try:
-                    yres = [0, 0]
-                    yres[0] = y[i - 1]
-                    T[i] = T[i - 1]
-                    x[i] = x[i - 1]
-                    pv[0] = phi_vap_vec[i - 1]
-                    pl[0] = phi_liq_vec[i - 1]
-                    k[0] = kvec[i - 1]
-                except:
-                    yres = [0, 0]
-                    yres[0] = y[i + 1]
-                    T[i] = T[i + 1]
-                    x[i] = x[i + 1]
-                    pv[0] = phi_vap_vec[i + 1]
-                    pl[0] = phi_liq_vec[i + 1]
-                    k[0] = kvec[i + 1]
-
-            T[i] = conv_unit(T[i], "K", Tunit)
-            y[i] = yres[0]
-            phi_vap_vec[i] = pv[0]
-            phi_liq_vec[i] = pl[0]
-            kvec[i] = k[0]
+    def _getSaturationPoint_newton(
+        self,
+        z,
+        P: float,
+        T: float,
+        bubble: bool,
+        unknown: str,
+        tol: float,
+        kmax: int,
+        name: str,
+        switch_tol: float = 1e-2,
+        lnK=None,
+    ):
+        """
+        Bubble (bubble=True) or dew point of the phase with composition z, solving for
+        the pressure (unknown="P") or the temperature (unknown="T").
+
+        The equations are ln(K_i) + ln(phi_i^vap) - ln(phi_i^liq) = 0 and
+        sum(z K) = 1 (bubble) or sum(z / K) = 1 (dew). Far from the solution the K
+        factors are updated by successive substitution while the pressure or
+        temperature takes a Newton step on the summation equation. Once the K factors
+        change by less than switch_tol, all the unknowns take Newton steps. The
+        derivatives in P, T and the composition of the incipient phase are analytic
+        (getLnPhiDerivatives and getdLnPhidN). The K factors start from lnK if given,
+        else from Wilson's equation.
+
+        The iterations and the wall time are stored in solverStats.
+
+        Returns
+        -------
+        w : incipient phase composition (y for bubble, x for dew points)
+        P or T : saturation pressure or temperature
+        phivap, philiq : fugacity coefficients of both phases
+        k : K factors
+        ite : number of iterations
+        """
+        assert len(z) == self.n
+        assert np.abs(np.sum(z) - 1.0) < 1e-10
+
+        stats = SolverStats(name)
+        n = self.n
+        if lnK is None:
+            lnK = np.log(self.Pcs / P) + 5.373 * (1 + self.omegas) * (
+                1.0 - self.Tcs / T
+            )
+        # the mole numbers of the incipient phase are m = z K^sign
+        sign = 1.0 if bubble else -1.0
+        jac = np.zeros((n + 1, n + 1), dtype=np.float64)
+        newton = False
+        converged = False
+        ite = 0
+
+        f, dfds, state = self._saturationResiduals(z, lnK, P, T, bubble, unknown)
+        while ite < kmax:
+            if not np.all(np.isfinite(f)):
+                raise ValueError(
+                    "{}: the equation of state can't be evaluated at P = {} Pa, "
+                    "T = {} K".format(name, P, T)
+                )
+            if np.max(np.abs(f)) < tol:
+                converged = True
+                break
+            ite += 1
+
+            # largest change of ln(P) or T in one iteration
+            max_ds = 0.05 * T if unknown == "T" else 0.5
+            if newton:
+                jac[:n, :n] = np.eye(n) + self._getdLnPhidLnN(state)
+                jac[:n, n] = dfds
+                jac[n, :n] = sign * state["m"]
+                step = np.linalg.solve(jac, -f)
+                step *= min(1.0, max_ds / max(np.abs(step[n]), 1e-300))
+
+                res = self._getNewtonStep(
+                    z, lnK, P, T, bubble, unknown, step, np.max(np.abs(f))
+                )
+                if res is not None:
+                    stats.newton_iterations += 1
+                    lnK, P, T, (f, dfds, state) = res
+                    continue
+                newton = False
+
+            # successive substitution on K, Newton step on the summation equation
+            lnK_new = lnK - f[:n]
+            m = z * np.exp(sign * lnK_new)
+            g = np.sum(m) - 1.0
+            dgds = -sign * np.sum(m * dfds)
+            if dgds == 0.0 or not np.isfinite(dgds):
+                # both phases have the same fugacity coefficients, as for a pure
+                # substance or at the trivial solution K = 1
+                raise ValueError(
+                    "{}: the summation equation doesn't depend on {}, the phases "
+                    "are identical".format(name, unknown)
+                )
+            ds = np.clip(-g / dgds, -max_ds, max_ds)
+            P, T = self._updateSaturationVariable(P, T, unknown, ds)
+            newton = np.max(np.abs(lnK_new - lnK)) < switch_tol
+            lnK = lnK_new
+            f, dfds, state = self._saturationResiduals(z, lnK, P, T, bubble, unknown)
+
+        stats.finish(ite, converged)
+        self.solverStats = stats
+
+        k = np.exp(lnK)
+        w = state["w"]
+        if bubble:
+            phivap, philiq = np.exp(state["lnphi_inc"]), np.exp(state["lnphi_z"])
+        else:
+            phivap, philiq = np.exp(state["lnphi_z"]), np.exp(state["lnphi_inc"])
+        sat = P if unknown == "P" else T
+        return w, sat, phivap, philiq, k, ite
+
+    def _getNewtonStep(self, z, lnK, P, T, bubble, unknown, step, norm):
+        """
+        Backtracks along the Newton step until the residuals decrease, rejecting steps
+        that collapse the K factors towards the trivial solution K = 1.
+
+        Returns
+        -------
+        lnK, P, T and the residuals at them, or None if no step was accepted.
+        """
+        n = self.n
+        max_lnK = np.max(np.abs(lnK))
+        alpha = 1.0
+        for _ in range(8):
+            lnK_new = lnK + alpha * step[:n]
+            P_new, T_new = self._updateSaturationVariable(
+                P, T, unknown, alpha * step[n]
+            )
+            res = self._saturationResiduals(z, lnK_new, P_new, T_new, bubble, unknown)
+            f = res[0]
+            if (
+                np.all(np.isfinite(f))
+                and np.max(np.abs(f)) < norm
+                and np.max(np.abs(lnK_new)) > 0.5 * max_lnK
+            ):
+                return lnK_new, P_new, T_new, res
+            alpha *= 0.5
+        return None
+
+    def _updateSaturationVariable(self, P: float, T: float, unknown: str, ds: float):
+        if unknown == "P":
+            return P * np.exp(ds), T
+        return P, T + ds
+
+    def _saturationResiduals(self, z, lnK, P: float, T: float, bubble: bool, unknown):
+        """
+        Residuals of _getSaturationPoint_newton and their derivatives in ln(P) or T at
+        constant K.
+        """
+        sign = 1.0 if bubble else -1.0
+        # the phase with composition z is the liquid for bubble points
+        z_phase, inc_phase = (0, 1) if bubble else (1, 0)
+        m = z * np.exp(sign * lnK)
+        w = m / np.sum(m)
+
+        Zz = self.getZLiqVap(P, T, z)[z_phase]
+        Zinc = self.getZLiqVap(P, T, w)[inc_phase]
+        temperature = unknown == "T"
+        lnphi_z, dlnphi_z_dP, dlnphi_z_dT = self.getLnPhiDerivatives(
+            z, P, T, Zz, temperature
+        )
+        lnphi_inc, dlnphi_inc_dP, dlnphi_inc_dT = self.getLnPhiDerivatives(
+            w, P, T, Zinc, temperature
+        )
+
+        if bubble:
+            lnphivap, lnphiliq = lnphi_inc, lnphi_z
+        else:
+            lnphivap, lnphiliq = lnphi_z, lnphi_inc
+        f = np.empty(self.n + 1, dtype=np.float64)
+        f[: self.n] = lnK + lnphivap - lnphiliq
+        f[self.n] = np.sum(m) - 1.0
+
+        if unknown == "P":
+            dfds = sign * P * (dlnphi_inc_dP - dlnphi_z_dP)
+        else:
+            dfds = sign * (dlnphi_inc_dT - dlnphi_z_dT)
+
+        state = {
+            "m": m,
+            "w": w,
+            "P": P,
+            "T": T,
+            "Z": Zinc,
+            "lnphi_z": lnphi_z,
+            "lnphi_inc": lnphi_inc,
+        }
+        return f, dfds, state
+
+    def _getdLnPhidLnN(self, state):
+        """
+        d ln(phi_i) / d ln(m_j) of the incipient phase with mole numbers m. It's the
+        composition block of the Jacobian of the residuals of
+        _getSaturationPoint_newton for both bubble and dew points.
+        """
+        w = state["w"]
+        return self.getdLnPhidN(w, state["P"], state["T"], state["Z"]) * w
+
+    ####### PHASE ENVELOPE ###########
+
+    def getPhaseEnvelope(
+        self, z, P0: float = 1e5, max_points: int = 500, tol=1e-10, kmax: int = 20
+    ) -> PhaseEnvelope:
+        """
+        Phase envelope of the mixture with composition z, by Michelsen's method.
+
+        The unknowns are X = (ln(K_i), ln(T), ln(P)), with the equations
+        ln(K_i) + ln(phi_i(w)) - ln(phi_i(z)) = 0 and sum(z K) = 1, where w = z K is
+        the incipient phase, and one of the unknowns fixed at a specified value. Both
+        phases take the root of lowest Gibbs energy, so past the critical point (all
+        K = 1) the same equations describe the bubble branch. The trace starts at the
+        dew point at P0 and stops when the bubble branch gets back to P0 or after
+        max_points points.
+
+        Each step specifies the unknown with the largest sensitivity dX/dS, and
+        starts Newton's method from the linear extrapolation X + dX/dS dS. The step
+        grows when Newton converges quickly and is halved when it doesn't. Near the
+        critical point, where the ln(K_i) are specified, the step jumps over
+        ln(K_i) = 0 to the symmetric value.
+        """
+        z = np.atleast_1d(z).astype(np.float64)
+        assert len(z) == self.n
+        n = self.n
+
+        x, T0, phivap, philiq, k, ite = self.getDewPointTemperature_newton(z, P0)
+        # on the dew branch the incipient phase is the liquid, w = z / K_dew
+        X = np.empty(n + 2, dtype=np.float64)
+        X[:n] = -np.log(k)
+        X[n] = np.log(T0)
+        X[n + 1] = np.log(P0)
+        spec = n + 1
+        X, J, ite = self._solveEnvelopePoint(z, X, spec, X[spec], tol, kmax)
+        if X is None:
+            raise ValueError("The dew point at P0 didn't converge")
+
+        # the ln(K) that changes sign at the critical point
+        i0 = int(np.argmax(np.abs(X[:n])))
+        points = [X]
+        critical = None
+        ds = 0.1
+        # largest change of ln(K), ln(T) and ln(P) in one step
+        max_dX = np.full(n + 2, 0.3)
+        max_dX[n] = 0.05
+        rhs = np.zeros(n + 2, dtype=np.float64)
+        rhs[n + 1] = 1.0
+
+        while len(points) < max_points:
+            dXdS = np.linalg.solve(J, rhs)
+            new_spec = int(np.argmax(np.abs(dXdS)))
+            if new_spec != spec:
+                ds *= dXdS[new_spec]
+                spec = new_spec
+                J[n + 1, :] = 0.0
+                J[n + 1, spec] = 1.0
+                dXdS = np.linalg.solve(J, rhs)
+            ds = np.sign(ds) * min(np.abs(ds), np.min(max_dX / np.abs(dXdS)))
+
+            S = X[spec] + ds
+            if spec < n and (S * X[spec] <= 0.0 or np.abs(S) < 0.02):
+                S = -X[spec]
+            X_new, J_new, ite = self._solveEnvelopePoint(
+                z, X + dXdS * (S - X[spec]), spec, S, tol, kmax
+            )
+            if X_new is None:
+                ds *= 0.5
+                if np.abs(ds) < 1e-6:
+                    break
+                continue
+
+            if X_new[i0] * X[i0] < 0.0:
+                frac = X[i0] / (X[i0] - X_new[i0])
+                crit = X[n:] + frac * (X_new[n:] - X[n:])
+                critical = (np.exp(crit[0]), np.exp(crit[1]))
+            ds = S - X[spec]
+            if ite <= 3:
+                ds *= 1.5
+            elif ite > 5:
+                ds *= 0.5
+            X, J = X_new, J_new
+            points.append(X)
+            if critical is not None and X[n + 1] < np.log(P0):
+                break
+
+        points = np.array(points)
+        bubble = points[:, i0] * points[0, i0] < 0.0
+        lnK = np.where(bubble[:, None], points[:, :n], -points[:, :n])
+        return PhaseEnvelope(
+            np.exp(points[:, n]),
+            np.exp(points[:, n + 1]),
+            np.exp(lnK),
+            bubble,
+            critical,
+        )
+
+    def _solveEnvelopePoint(self, z, X, spec: int, S: float, tol: float, kmax: int):
+        """
+        Newton's method on the equations of getPhaseEnvelope, with X[spec] = S.
+
+        Returns
+        -------
+        X, the Jacobian at X and the number of iterations, or None, None, kmax if it
+        didn't converge.
+        """
+        for ite in range(1, kmax + 1):
+            F, J = self._envelopeResiduals(z, X, spec, S)
+            if not np.all(np.isfinite(F)):
+                break
+            dX = np.linalg.solve(J, -F)
+            # keep the steps of ln(T) and ln(P) reasonable
+            dX *= min(1.0, 0.2 / max(np.max(np.abs(dX[-2:])), 1e-300))
+            X = X + dX
+            if np.max(np.abs(dX)) < tol:
+                F, J = self._envelopeResiduals(z, X, spec, S)
+                return X, J, ite
+        return None, None, kmax
+
+    def _envelopeResiduals(self, z, X, spec: int, S: float):
+        n = self.n
+        lnK = X[:n]
+        T = np.exp(X[n])
+        P = np.exp(X[n + 1])
+        m = z * np.exp(lnK)
+        w = m / np.sum(m)
+
+        z_phase, Zz = self._getMinGibbsPhase(z, P, T)
+        Zw = self._getMinGibbsPhase(w, P, T)[1]
+        lnphi_z, dlnphi_z_dP, dlnphi_z_dT = self.getLnPhiDerivatives(z, P, T, Zz)
+        lnphi_w, dlnphi_w_dP, dlnphi_w_dT = self.getLnPhiDerivatives(w, P, T, Zw)
+
+        F = np.empty(n + 2, dtype=np.float64)
+        F[:n] = lnK + lnphi_w - lnphi_z
+        F[n] = np.sum(m) - 1.0
+        F[n + 1] = X[spec] - S
+
+        state = {"w": w, "P": P, "T": T, "Z": Zw}
+        J = np.zeros((n + 2, n + 2), dtype=np.float64)
+        J[:n, :n] = np.eye(n) + self._getdLnPhidLnN(state)
+        J[:n, n] = T * (dlnphi_w_dT - dlnphi_z_dT)
+        J[:n, n + 1] = P * (dlnphi_w_dP - dlnphi_z_dP)
+        J[n, :n] = m
+        J[n + 1, spec] = 1.0
+        return F, J
+
+    def _getMinGibbsPhase(self, w, P: float, T: float):
+        """
+        Index (0 liquid, 1 vapor) and Z of the root of lowest Gibbs energy.
+        """
+        zliq, zvap = self.getZLiqVap(P, T, w)[:2]
+        if zliq == zvap:
+            return 0, zliq
+        gliq = np.sum(w * self.getLnPhiVector(w, P, T, zliq))
+        gvap = np.sum(w * self.getLnPhiVector(w, P, T, zvap))
+        return (0, zliq) if gliq <= gvap else (1, zvap)
 
+    def isobaricBinaryMixtureGenData(self, P, x=None, Punit="Pa", Tunit="K"):
+        """
+        T-x-y data of a binary mixture at the pressure P, from bubble point
+        temperatures. See _binaryMixtureGenData.
+        """
+        x, y, T, phi_vap_vec, phi_liq_vec, kvec = self._binaryMixtureGenData(x, P, "T")
+        T = np.array([conv_unit(Ti, "K", Tunit) for Ti in T])
         return x, y, T, phi_vap_vec, phi_liq_vec, kvec
 
     def isothermalBinaryMixtureGenData(self, T, x=None, Punit="Pa", Tunit="K"):
+        """
+        P-x-y data of a binary mixture at the temperature T, from bubble point
+        pressures. See _binaryMixtureGenData.
+        """
+        x, y, P, phi_vap_vec, phi_liq_vec, kvec = self._binaryMixtureGenData(x, T, "P")
+        P = np.array([conv_unit(Pi, "Pa", Punit) for Pi in P])
+        return x, y, P, phi_vap_vec, phi_liq_vec, kvec
 
+    def _binaryMixtureGenData(
+        self,
+        x,
+        var: float,
+        unknown: str,
+        max_angle: float = 0.3,
+        min_dx: float = 1e-3,
+        max_residual: float = 1e-3,
+    ):
+        """
+        Bubble point temperatures at the pressure var (unknown="T") or pressures at
+        the temperature var (unknown="P") of a binary mixture, along the liquid mole
+        fractions x of the first component.
+
+        Each point starts from the K factors and saturation temperature or pressure
+        of the previous one. With the default x (x_vec_for_plot), intervals are
+        halved where the T-x-y or P-x-y curve turns by more than max_angle radians,
+        in coordinates scaled to the unit square, down to min_dx. Points whose
+        solver fails or doesn't converge, or whose K factors differ from the ones
+        recomputed at the solution by more than max_residual in ln(K), are left out
+        and listed in genDataFailures as (x, message).
+
+        Returns
+        -------
+        x, y, T or P, phi_vap and phi_liq and K of the first component
+        """
         assert self.n == 2
 
+        adaptive = x is None
         if x is None:
             x = x_vec_for_plot
-
-        x = np.atleast_1d(x)
-
-        xmix = np.empty(2, dtype=np.float64)
-        y = np.empty(len(x), dtype=np.float64)
-        P = np.empty(len(x), dtype=np.float64)
-        kvec = np.empty(len(x), dtype=np.float64)
-        phi_vap_vec = np.empty(len(x), dtype=np.float64)
-        phi_liq_vec = np.empty(len(x), dtype=np.float64)
-        phi_vap = np.empty(len(x), dtype=np.float64)
-        phi_liq = np.empty(len(x), dtype=np.float64)
-        kv = np.empty(len(x), dtype=np.float64)
-
-        for i in range(len(x)):
-            xmix[0] = x[i]
-            xmix[1] = 1.0 - x[i]
-
+        self.genDataFailures = []
+        points = {}
+        tried = set()
+
+        def solve(xi, guess):
+            tried.add(xi)
+            xmix = np.array([xi, 1.0 - xi])
+            self.solverStats = None
             try:
-                yres, P[i], phi_vap, phi_liq, kv, ite = self.getBubblePointPressure(
-                    xmix, T, tol=1e-5, kmax=100
+                if unknown == "T":
+                    ret = self.getBubblePointTemperature(xmix, var, guess=guess)
+                    P, T = var, ret[1]
+                else:
+                    ret = self.getBubblePointPressure(
+                        xmix, var, tol=1e-5, kmax=100, guess=guess
+                    )
+                    P, T = ret[1], var
+                if not np.isfinite(ret[1]) or not np.all(np.isfinite(ret[4])):
+                    raise ValueError("the solution isn't finite")
+                if self.solverStats is not None and not self.solverStats.converged:
+                    raise ValueError("the solver didn't converge")
+                if np.max(np.abs(np.log(ret[4]))) < 1e-4:
+                    raise ValueError("trivial solution, K = 1")
+                y = ret[0] / np.sum(ret[0])
+                lnK = np.log(self._getKFactors(xmix, y, P, T))
+                residual = np.max(np.abs(lnK - np.log(ret[4])))
+                if residual > max_residual:
+                    raise ValueError(
+                        "not an equilibrium point, ln(K) residual {:.2g}".format(
+                            residual
+                        )
+                    )
+            except Exception as e:
+                self.genDataFailures.append((xi, str(e)))
+                return None
+            points[xi] = ret
+            return ret
+
+        guess = None
+        for xi in np.atleast_1d(x):
+            ret = solve(float(xi), guess)
+            if ret is not None:
+                guess = (ret[4], ret[1])
+
+        for _ in range(6 if adaptive else 0):
+            xs = sorted(points)
+            s = np.array([points[xi][1] for xi in xs])
+            # x, y and the scaled T or P
+            curve = np.column_stack(
+                (
+                    xs,
+                    [points[xi][0][0] for xi in xs],
+                    (s - np.min(s)) / max(np.max(s) - np.min(s), 1e-300),
                 )
-            except:
-                try:
-                    yres = [0, 0]
-                    yres[0] = y[i - 1]
-                    P[i] = P[i - 1]
-                    x[i] = x[i - 1]
-                    phi_vap[0] = phi_vap_vec[i - 1]
-                    phi_liq[0] = phi_liq_vec[i - 1]
-                    kv[0] = kvec[i - 1]
-                except:
-                    yres = [0, 0]
-                    yres[0] = y[i + 1]
-                    P[i] = P[i + 1]
-                    x[i] = x[i + 1]
-                    phi_vap[0] = phi_vap_vec[i + 1]
-                    phi_liq[0] = phi_liq_vec[i + 1]
-                    kv[0] = kv[i + 1]
-
-            P[i] = conv_unit(P[i], "Pa", Punit)
-            y[i] = yres[0]
-            phi_vap_vec[i] = phi_vap[0]
-            phi_liq_vec[i] = phi_liq[0]
-            kvec[i] = kv[0]
+            )
+            d = np.diff(curve, axis=0)
+            norms = np.linalg.norm(d, axis=1)
+            cos = np.sum(d[1:] * d[:-1], axis=1) / np.maximum(
+                norms[1:] * norms[:-1], 1e-300
+            )
+            new = set()
+            for i in np.nonzero(np.arccos(np.clip(cos, -1.0, 1.0)) > max_angle)[0]:
+                for a, b in ((xs[i], xs[i + 1]), (xs[i + 1], xs[i + 2])):
+                    if b - a > min_dx and 0.5 * (a + b) not in tried:
+                        new.add((a, b))
+            if not new:
+                break
+            for a, b in sorted(new):
+                # interpolated from both ends
+                guess = (
+                    np.sqrt(points[a][4] * points[b][4]),
+                    0.5 * (points[a][1] + points[b][1]),
+                )
+                solve(0.5 * (a + b), guess)
 
-        return x, y, P, phi_vap_vec, phi_liq_vec, kvec
+        if not points:
+            raise ValueError(
+                "No bubble point converged: {}".format(self.genDataFailures[0][1])
+            )
+        xs = np.array(sorted(points))
+        ret = [points[xi] for xi in xs]
+        y = np.array([r[0][0] for r in ret])
+        s = np.array([r[1] for r in ret])
+        phi_vap_vec = np.array([r[2][0] for r in ret])
+        phi_liq_vec = np.array([r[3][0] for r in ret])
+        kvec = np.array([r[4][0] for r in ret])
+        return xs, y, s, phi_vap_vec, phi_liq_vec, kvec
+
+    def _getKFactors(self, x, y, P: float, T: float):
+        """
+        K factors of the liquid x and the vapor y at P and T, with the VLE method.
+        """
+        if self.vle_method == "UNIFAC":
+            gamma = self.unifac_model.getGamma(x, T)
+            return self.get_k_gamma_phi(
+                gamma, self.getPsat(T), P, self.getCapPhi(y, P, T)
+            )
+        zliq = self.getZLiqVap(P, T, x)[0]
+        zvap = self.getZLiqVap(P, T, y)[1]
+        return self.getPhiVector(x, P, T, zliq) / self.getPhiVector(y, P, T, zvap)
 
     def isobaricBinaryMixturePlot(
         self, P, x=None, Punit="Pa", Tunit="K", expfilename="", plottype="both"
@@ -1030,9 +2248,7 @@ class EOSMixture:
 
         assert self.n == 2
 
-        if x is None:
-            x = x_vec_for_plot
-
+        # x=None refines the default points, the failed ones are in genDataFailures
         x, y, T, phiv, phil, kvec = self.isobaricBinaryMixtureGenData(
             P, x, Punit=Punit, Tunit=Tunit
         )
@@ -1051,6 +2267,9 @@ class EOSMixture:
             self.eosname,
         )
 
+        # matplotlib is only loaded for plotting
+        import VLEBinaryDiagrams
+
         vleplot = VLEBinaryDiagrams.VLEBinaryMixturePlot(
             "isobaric", T, x, y, Tunit, title, plottype
         )
@@ -1058,6 +2277,48 @@ class EOSMixture:
             vleplot.expPlot(expfilename)
         vleplot.plot()
 
+    def setVLESolver(self, solver: str):
+        """
+        Selects the solver of the phi-phi bubble and dew point problems, one of
+        vle_solver_options.
+        """
+        if solver not in vle_solver_options:
+            raise ValueError("Unknown VLE solver: {}".format(solver))
+        self.vle_solver = solver
+
+    def setAcceleration(self, method: str, solvers=None):
+        """
+        Selects the acceleration of the successive substitution of ln(K), one of
+        acceleration_options, for the given solvers (values of calc_options) or for
+        all of them. The Newton solvers (setVLESolver) aren't accelerated.
+        """
+        if method not in acceleration_options:
+            raise ValueError("Unknown acceleration method: {}".format(method))
+        if solvers is None:
+            solvers = self.acceleration.keys()
+        for solver in solvers:
+            if solver not in self.acceleration:
+                raise ValueError("Unknown solver: {}".format(solver))
+            self.acceleration[solver] = method
+
+    def _getAccelerator(self, solver: str):
+        method = self.acceleration[solver]
+        if method == "none":
+            return None
+        return createAccelerator(method)
+
+    def _finishStats(self, stats: SolverStats, accelerator, ite: int, converged):
+        if accelerator is not None:
+            stats.accelerated_iterations = accelerator.accelerated_steps
+        stats.finish(ite, bool(converged))
+        self.solverStats = stats
+
+    def getSolverStats(self) -> SolverStats:
+        """
+        Iterations and wall time of the last solver that reports them, or None.
+        """
+        return self.solverStats
+
     def setVLEmethod(self, method: str):
         if not self.has_UNIFAC:
             self.vle_method = "phi-phi"
@@ -1070,9 +2331,7 @@ class EOSMixture:
 
         assert self.n == 2
 
-        if x is None:
-            x = x_vec_for_plot
-
+        # x=None refines the default points, the failed ones are in genDataFailures
         x, y, P, phiv, phil, kvec = self.isothermalBinaryMixtureGenData(
             T, x, Punit=Punit, Tunit=Tunit
         )
@@ -1091,6 +2350,9 @@ class EOSMixture:
             self.eosname,
         )
 
+        # matplotlib is only loaded for plotting
+        import VLEBinaryDiagrams
+
         vleplot = VLEBinaryDiagrams.VLEBinaryMixturePlot(
             "isothermal", P, x, y, Punit, title, plottype
         )
@@ -1099,22 +2361,21 @@ class EOSMixture:
         vleplot.plot()
 
 
-@njit(float64(float64, float64[:], float64[:], float64, int64), cache=True)
-def _RachfordRice(v, k, z, tol, kmax):
+def _accelerateK(accelerator, k, k_new):
+    if accelerator is None:
+        return k_new
+    return np.exp(accelerator.update(np.log(k), np.log(k_new)))
 
-    v0 = v
-    v1 = 999.0
-    err = 1000.0
 
-    iter = 0
-    while err > tol or iter > kmax:
-        iter += 1
-        f = np.sum(z * (k - 1.0) / (1.0 + v0 * (k - 1.0)))
-        dfdv = -np.sum(z * (k - 1.0) ** 2 / (1.0 + v0 * (k - 1.0)) ** 2)
-        v1 = v0 - f / dfdv
-        err = np.abs(v0 - v1)
-        v0 = v1
-    return v1
+def _accelerateKS(accelerator, k, s, k_new, s_new):
+    # ln(K) together with the ln of the saturation pressure or temperature
+    if accelerator is None:
+        return k_new, s_new
+    n = len(k)
+    ret = np.exp(
+        accelerator.update(np.log(np.append(k, s)), np.log(np.append(k_new, s_new)))
+    )
+    return ret[:n], ret[n]
 
 
 @njit(float64(float64[:], float64, float64[:], float64[:], float64[:]), cache=True)
@@ -1171,10 +2432,33 @@ def _helper_bubble_T_guess_from_wilson(x, P, T, Pcs, Tcs, omegas):
     return T
 
 
-from numba import njit, float64, jit
+@njit(
+    float64(float64[:], float64, float64, float64[:], float64[:], float64[:], boolean),
+    cache=True,
+)
+def _helper_T_guess_from_wilson(z, P, T, Pcs, Tcs, omegas, bubble):
+    # Newton on ln(sum(z K)) = 0 (bubble) or ln(sum(z / K)) = 0 (dew), with Wilson's K
+    c = 5.373 * (1.0 + omegas) * Tcs
+    sign = 1.0 if bubble else -1.0
+    for _ in range(50):
+        m = z * np.exp(sign * (np.log(Pcs / P) + 5.373 * (1.0 + omegas) - c / T))
+        s = np.sum(m)
+        f = np.log(s)
+        df = sign * np.sum(m * c) / (s * T * T)
+        dT = -f / df
+        dT = max(min(dT, 0.2 * T), -0.2 * T)
+        T += dT
+        if np.abs(dT) < 1e-8 * T:
+            break
+    return T
 
 
-@jit((float64, float64, float64, float64, float64, float64, float64), cache=True)
+@njit(
+    Tuple((float64, float64, int64))(
+        float64, float64, float64, float64, float64, float64, float64
+    ),
+    cache=True,
+)
 def _getZfromPT_helper(
     b: float,
     theta: float,
@@ -1184,6 +2468,10 @@ def _getZfromPT_helper(
     P: float,
     R_IG: float,
 ):
+    """
+    Returns the smallest and largest non-negative roots of the cubic in Z and how many
+    non-negative roots were found.
+    """
     Bl = b * P / (R_IG * T)
     deltal = delta * P / (R_IG * T)
     epsilonl = epsilon * np.power(P / (R_IG * T), 2)
@@ -1191,9 +2479,39 @@ def _getZfromPT_helper(
     _b = deltal - Bl - 1.0
     _c = thetal + epsilonl - deltal * (1.0 + Bl)
     _d = -(epsilonl * (Bl + 1.0) + Bl * thetal)
-    roots = np.array(solve_cubic(1.0, _b, _c, _d))
-    real_values = roots[roots >= 0]
-    return real_values
+    x1, x2, x3, nroots = solve_cubic_monic(_b, _c, _d)
+
+    if nroots == 1:
+        if x1 >= 0.0:
+            return x1, x1, 1
+        return np.nan, np.nan, 0
+
+    # the roots are sorted, keep the non-negative ones
+    if x1 >= 0.0:
+        return x1, x3, 3
+    if x2 >= 0.0:
+        return x2, x3, 2
+    if x3 >= 0.0:
+        return x3, x3, 1
+    return np.nan, np.nan, 0
+
+
+@njit(
+    Tuple((float64[:], float64[:], int64[:]))(
+        float64[:], float64[:], float64[:], float64[:], float64[:], float64[:], float64,
+    ),
+    cache=True,
+)
+def _getZfromPT_batch_helper(b, theta, delta, epsilon, T, P, R_IG):
+    n = len(P)
+    zliq = np.empty(n, dtype=np.float64)
+    zvap = np.empty(n, dtype=np.float64)
+    nroots = np.empty(n, dtype=np.int64)
+    for i in range(n):
+        zliq[i], zvap[i], nroots[i] = _getZfromPT_helper(
+            b[i], theta[i], delta[i], epsilon[i], T[i], P[i], R_IG
+        )
+    return zliq, zvap, nroots
 
 
 @njit(
@@ -1262,3 +2580,445 @@ def _getPhi_i_helper(
     lnphi_i = firstline * secline_p1 + secline_p2 * thirdline + fourthline
     phi_i = np.exp(lnphi_i)
     return phi_i
+
+
+@njit(
+    float64[:](
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64[:],
+        float64[:],
+        float64[:],
+        float64[:],
+        float64,
+    ),
+    cache=True,
+)
+def _getLnPhi_vector_helper(
+    P: float,
+    T: float,
+    Z: float,
+    R_IG: float,
+    bm: float,
+    thetam: float,
+    deltam: float,
+    epsilonm: float,
+    diffthetam,
+    diffbm,
+    diffdeltam,
+    diffepsilonm,
+    DBL_EPSILON: float,
+):
+    n = len(diffthetam)
+    lnphi = np.empty(n, dtype=np.float64)
+
+    RT = R_IG * T
+    V = RT * Z / P
+    deltam2_minus_4epislonm = deltam * deltam - 4.0 * epsilonm
+    # terms that don't depend on the component
+    common_term = -np.log((V - bm) / V) - np.log(Z)
+
+    if abs(deltam2_minus_4epislonm) < 100 * DBL_EPSILON:
+        substitute_term = -1.0 / (V + deltam / 2.0)
+        for i in range(n):
+            first_term = substitute_term * diffthetam[i] / RT
+            last_term = diffbm[i] / (V - bm) + common_term
+            lnphi[i] = first_term + last_term
+        return lnphi
+
+    sqrt_d2_minus_4eps = np.sqrt(deltam2_minus_4epislonm)
+    twoV_plus_deltam_minus_sqrtd24eps = 2.0 * V + deltam - sqrt_d2_minus_4eps
+    twoV_plus_deltam_plus_sqrtd24eps = 2.0 * V + deltam + sqrt_d2_minus_4eps
+    secline_p1 = np.log(
+        twoV_plus_deltam_minus_sqrtd24eps / twoV_plus_deltam_plus_sqrtd24eps
+    )
+    secline_p2 = (thetam / RT) / sqrt_d2_minus_4eps
+
+    # Equation(Poling, 2001)
+    for i in range(n):
+        deltaN = deltam * diffdeltam[i] * 2.0 - 4.0 * diffepsilonm[i]
+        firstline = (1.0 / sqrt_d2_minus_4eps) * (diffthetam[i] / RT) - (
+            thetam / RT
+        ) * deltaN / (2.0 * np.power(deltam2_minus_4epislonm, 1.5))
+        thirdline = (
+            (diffdeltam[i] - deltaN / (2.0 * sqrt_d2_minus_4eps))
+            / twoV_plus_deltam_minus_sqrtd24eps
+            - (diffdeltam[i] + deltaN / (2.0 * sqrt_d2_minus_4eps))
+            / twoV_plus_deltam_plus_sqrtd24eps
+        )
+        fourthline = diffbm[i] / (V - bm) + common_term
+        lnphi[i] = firstline * secline_p1 + secline_p2 * thirdline + fourthline
+    return lnphi
+
+
+@njit(
+    float64[:](
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64[:],
+        float64[:],
+        float64[:],
+        float64[:],
+        float64,
+        float64,
+        float64,
+        float64,
+        float64[:],
+        float64[:],
+        float64[:],
+        float64[:],
+        float64,
+        float64,
+        float64,
+        float64,
+    ),
+    cache=True,
+)
+def _getdLnPhi_vector_helper(
+    T: float,
+    V: float,
+    R_IG: float,
+    bm: float,
+    thetam: float,
+    deltam: float,
+    epsilonm: float,
+    diffthetam,
+    diffbm,
+    diffdeltam,
+    diffepsilonm,
+    dbm: float,
+    dthetam: float,
+    ddeltam: float,
+    depsilonm: float,
+    ddiffthetam,
+    ddiffbm,
+    ddiffdeltam,
+    ddiffepsilonm,
+    dT: float,
+    dV: float,
+    dlnZ: float,
+    DBL_EPSILON: float,
+):
+    """
+    Derivative of the ln(phi_i) of _getLnPhi_vector_helper along a direction, given
+    the derivatives (the d* arguments) of each of its inputs along it.
+    """
+    n = len(diffthetam)
+    dlnphi = np.empty(n, dtype=np.float64)
+
+    RT = R_IG * T
+    dRT_RT = dT / T
+    D = deltam * deltam - 4.0 * epsilonm
+    dD = 2.0 * deltam * ddeltam - 4.0 * depsilonm
+    t = thetam / RT
+    dt = dthetam / RT - t * dRT_RT
+    # d[-ln((V - b) / V) - ln(Z)]
+    common_term = -(dV - dbm) / (V - bm) + dV / V - dlnZ
+
+    if abs(D) < 100 * DBL_EPSILON:
+        h = V + deltam / 2.0
+        dh = dV + ddeltam / 2.0
+        for i in range(n):
+            a = diffthetam[i] / RT
+            da = ddiffthetam[i] / RT - a * dRT_RT
+            dlnphi[i] = (
+                -da / h
+                + a * dh / (h * h)
+                + ddiffbm[i] / (V - bm)
+                - diffbm[i] * (dV - dbm) / (V - bm) ** 2
+                + common_term
+            )
+        return dlnphi
+
+    sq = np.sqrt(D)
+    dsq = dD / (2.0 * sq)
+    u = 2.0 * V + deltam - sq
+    w = 2.0 * V + deltam + sq
+    du = 2.0 * dV + ddeltam - dsq
+    dw = 2.0 * dV + ddeltam + dsq
+    L = np.log(u / w)
+    dL = du / u - dw / w
+    p2 = t / sq
+    dp2 = dt / sq - t * dsq / D
+
+    for i in range(n):
+        a = diffthetam[i] / RT
+        da = ddiffthetam[i] / RT - a * dRT_RT
+        deltaN = deltam * diffdeltam[i] * 2.0 - 4.0 * diffepsilonm[i]
+        ddeltaN = (
+            2.0 * (ddeltam * diffdeltam[i] + deltam * ddiffdeltam[i])
+            - 4.0 * ddiffepsilonm[i]
+        )
+
+        firstline = a / sq - t * deltaN / (2.0 * D * sq)
+        dfirstline = (
+            da / sq
+            - a * dsq / D
+            - (dt * deltaN + t * ddeltaN) / (2.0 * D * sq)
+            + t * deltaN * 1.5 * dD / (2.0 * D * D * sq)
+        )
+
+        g = deltaN / (2.0 * sq)
+        dg = ddeltaN / (2.0 * sq) - deltaN * dsq / (2.0 * D)
+        A = diffdeltam[i] - g
+        B = diffdeltam[i] + g
+        dA = ddiffdeltam[i] - dg
+        dB = ddiffdeltam[i] + dg
+        thirdline = A / u - B / w
+        dthirdline = dA / u - A * du / (u * u) - dB / w + B * dw / (w * w)
+
+        dfourthline = (
+            ddiffbm[i] / (V - bm) - diffbm[i] * (dV - dbm) / (V - bm) ** 2 + common_term
+        )
+        dlnphi[i] = (
+            dfirstline * L
+            + firstline * dL
+            + dp2 * thirdline
+            + p2 * dthirdline
+            + dfourthline
+        )
+    return dlnphi
+
+
+def _getDeltaPropFromDepartures(UR_RT: float, AR_RT: float, T: float, Z: float):
+    UR = UR_RT * T * R_IG
+    AR = AR_RT * T * R_IG
+    # calculate HR
+    HR_RT = UR_RT + 1.0 - Z
+    HR = HR_RT * R_IG * T
+    # calculate SR
+    SR_R = UR_RT - AR_RT
+    SR = SR_R * R_IG
+    # calculate GR
+    GR_RT = AR_RT + 1 - Z
+    GR = GR_RT * R_IG * T
+
+    return DeltaProp(0, HR, SR, GR, UR, AR)
+
+
+@njit(
+    UniTuple(float64, 3)(float64, float64, float64), cache=True,
+)
+def _attractive_volume_integrals(V: float, delta: float, epsilon: float):
+    """
+    Integrals from V to infinity of 1/q, 1/q^2 and v/q^2, with q = v^2 + delta*v + epsilon.
+    """
+    u = 2.0 * V + delta
+    q = V * (V + delta) + epsilon
+    D = delta * delta - 4.0 * epsilon
+    r = D / (u * u)
+
+    if abs(r) < 1e-3:
+        # series in D, avoids the cancellation of the closed forms when D -> 0
+        J = 0.0
+        K1 = 0.0
+        rk = 1.0
+        for k in range(8):
+            J += rk / (2.0 * k + 1.0)
+            K1 += rk * (k + 1.0) / (2.0 * k + 3.0)
+            rk *= r
+        J *= 2.0 / u
+        K1 *= 8.0 / (u * u * u)
+    else:
+        if D > 0.0:
+            sqrtD = np.sqrt(D)
+            J = np.log1p(2.0 * sqrtD / (u - sqrtD)) / sqrtD
+        else:
+            sqrt_minusD = np.sqrt(-D)
+            J = 2.0 * np.arctan2(sqrt_minusD, u) / sqrt_minusD
+        K1 = (u / q - 2.0 * J) / D
+
+    K2 = 0.5 / q - 0.5 * delta * K1
+    return J, K1, K2
+
+
+@njit(
+    UniTuple(float64, 3)(float64, float64, float64, float64), cache=True,
+)
+def _attractive_volume_integrals_cubed(V: float, delta: float, epsilon: float, K1):
+    """
+    Integrals from V to infinity of 1/q^3, v/q^3 and v^2/q^3, with
+    q = v^2 + delta*v + epsilon and K1 the integral of 1/q^2.
+    """
+    u = 2.0 * V + delta
+    q = V * (V + delta) + epsilon
+    D = delta * delta - 4.0 * epsilon
+    r = D / (u * u)
+
+    if abs(r) < 1e-3:
+        L0 = 0.0
+        rk = 1.0
+        for k in range(8):
+            L0 += rk * 0.5 * (k + 1.0) * (k + 2.0) / (2.0 * k + 5.0)
+            rk *= r
+        L0 *= 32.0 / u ** 5
+    else:
+        L0 = (0.5 * u / (q * q) - 3.0 * K1) / D
+
+    L1 = 0.25 / (q * q) - 0.5 * delta * L0
+    L2 = K1 - delta * L1 - epsilon * L0
+    return L0, L1, L2
+
+
+@njit(
+    UniTuple(float64, 2)(
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+    ),
+    cache=True,
+)
+def _getPVTDerivatives_helper(
+    T: float,
+    V: float,
+    R_IG: float,
+    b: float,
+    theta: float,
+    delta: float,
+    epsilon: float,
+    dbdT: float,
+    dthetadT: float,
+    ddeltadT: float,
+    depsilondT: float,
+):
+    q = V * (V + delta) + epsilon
+    dqdT = V * ddeltadT + depsilondT
+    dPdT = (
+        R_IG / (V - b)
+        + R_IG * T * dbdT / (V - b) ** 2
+        - dthetadT / q
+        + theta * dqdT / (q * q)
+    )
+    dPdV = -R_IG * T / (V - b) ** 2 + theta * (2.0 * V + delta) / (q * q)
+    return dPdT, dPdV
+
+
+@njit(
+    float64(
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+    ),
+    cache=True,
+)
+def _getCvDeparture_helper(
+    T: float,
+    V: float,
+    R_IG: float,
+    b: float,
+    theta: float,
+    delta: float,
+    epsilon: float,
+    dbdT: float,
+    dthetadT: float,
+    ddeltadT: float,
+    depsilondT: float,
+    d2bdT2: float,
+    d2thetadT2: float,
+    d2deltadT2: float,
+    d2epsilondT2: float,
+) -> float:
+    """
+    Returns (Cv_ig - Cv)/R = (T/R) times the integral from V to infinity of
+    (d2P/dT2) at constant v.
+    """
+    J, K1, K2 = _attractive_volume_integrals(V, delta, epsilon)
+    L0, L1, L2 = _attractive_volume_integrals_cubed(V, delta, epsilon, K1)
+
+    Vb = V - b
+    repulsive = (
+        2.0 * R_IG * dbdT / Vb
+        + R_IG * T * d2bdT2 / Vb
+        + R_IG * T * dbdT * dbdT / (Vb * Vb)
+    )
+    attractive = (
+        -d2thetadT2 * J
+        + 2.0 * dthetadT * (ddeltadT * K2 + depsilondT * K1)
+        + theta * (d2deltadT2 * K2 + d2epsilondT2 * K1)
+        - 2.0
+        * theta
+        * (
+            ddeltadT * ddeltadT * L2
+            + 2.0 * ddeltadT * depsilondT * L1
+            + depsilondT * depsilondT * L0
+        )
+    )
+    return T * (repulsive + attractive) / R_IG
+
+
+@njit(
+    UniTuple(float64, 2)(
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+        float64,
+    ),
+    cache=True,
+)
+def _getDepartureProps_helper(
+    T: float,
+    V: float,
+    Z: float,
+    R_IG: float,
+    b: float,
+    theta: float,
+    delta: float,
+    epsilon: float,
+    dbdT: float,
+    dthetadT: float,
+    ddeltadT: float,
+    depsilondT: float,
+):
+    """
+    Returns UR/RT and AR/RT, the closed forms of the integrals from V to infinity of
+    T (dZ/dT)_v / v and (1 - Z) / v (plus ln Z), respectively.
+    """
+    RT = R_IG * T
+    J, K1, K2 = _attractive_volume_integrals(V, delta, epsilon)
+
+    AR_RT = np.log((V - b) / V) + theta * J / RT + np.log(Z)
+    UR_RT = T * (
+        dbdT / (V - b)
+        - (dthetadT / RT - theta / (RT * T)) * J
+        + (theta / RT) * (K2 * ddeltadT + K1 * depsilondT)
+    )
+    return UR_RT, AR_RT
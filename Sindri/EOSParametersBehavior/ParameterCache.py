@@ -0,0 +1,134 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from EOSParametersBehavior.ParametersBehaviorInterface import BiBehavior, ThetaiBehavior
+
+
+class ParameterCache:
+    """
+    Size-bounded LRU cache of the pure-component parameter vectors of an equation of
+    state, keyed by parameter and temperature.
+
+    The cached arrays are shared with the callers, which must not modify them.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def get(self, key, func):
+        """
+        Returns the value stored in key, calling func() to compute it on a miss.
+        """
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            value = func()
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+            return value
+        self.hits += 1
+        self._data.move_to_end(key)
+        return value
+
+    def clear(self):
+        """
+        Removes all the values. The hit and miss counters are kept.
+        """
+        self._data.clear()
+
+    def resetCounters(self):
+        self.hits = 0
+        self.misses = 0
+
+    def getInfo(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
+
+
+def _isScalar(T) -> bool:
+    return isinstance(T, (float, int, np.floating, np.integer))
+
+
+class CachedBiBehavior(BiBehavior):
+    """
+    Wraps a BiBehavior, caching its b vector for scalar temperatures.
+    """
+
+    def __init__(self, behavior: BiBehavior, cache: ParameterCache):
+        self.behavior = behavior
+        self.cache = cache
+
+    def getBi(self, i: int, T: float, substances) -> float:
+        return self.getBVector(T, substances)[0, i]
+
+    def getBVector(self, T, substances):
+        if not _isScalar(T):
+            return self.behavior.getBVector(T, substances)
+        return self.cache.get(
+            ("b", float(T)), lambda: self.behavior.getBVector(T, substances)
+        )
+
+    def getdBdTVector(self, T, substances):
+        return self.behavior.getdBdTVector(T, substances)
+
+    def getd2BdT2Vector(self, T, substances):
+        return self.behavior.getd2BdT2Vector(T, substances)
+
+    def __getattr__(self, name):
+        if name == "behavior":
+            raise AttributeError(name)
+        return getattr(self.behavior, name)
+
+
+class CachedThetaiBehavior(ThetaiBehavior):
+    """
+    Wraps a ThetaiBehavior, caching theta and its temperature derivatives for scalar
+    temperatures.
+    """
+
+    def __init__(self, behavior: ThetaiBehavior, cache: ParameterCache):
+        self.behavior = behavior
+        self.cache = cache
+
+    def getThetai(self, i: int, T: float, substances) -> float:
+        return self.getThetaVector(T, substances)[0, i]
+
+    def getThetaVector(self, T, substances):
+        if not _isScalar(T):
+            return self.behavior.getThetaVector(T, substances)
+        return self.cache.get(
+            ("theta", float(T)), lambda: self.behavior.getThetaVector(T, substances)
+        )
+
+    def getdThetadTVector(self, T, substances):
+        if not _isScalar(T):
+            return self.behavior.getdThetadTVector(T, substances)
+        return self.cache.get(
+            ("dthetadT", float(T)),
+            lambda: self.behavior.getdThetadTVector(T, substances),
+        )
+
+    def getd2ThetadT2Vector(self, T, substances):
+        if not _isScalar(T):
+            return self.behavior.getd2ThetadT2Vector(T, substances)
+        return self.cache.get(
+            ("d2thetadT2", float(T)),
+            lambda: self.behavior.getd2ThetadT2Vector(T, substances),
+        )
+
+    def __getattr__(self, name):
+        if name == "behavior":
+            raise AttributeError(name)
+        return getattr(self.behavior, name)
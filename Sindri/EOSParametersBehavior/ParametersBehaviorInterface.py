@@ -1,5 +1,70 @@
 import abc
 
+import numpy as np
+
+
+def getTemperatureArray(T):
+    return np.atleast_1d(np.asarray(T, dtype=np.float64))
+
+
+def getCriticalArrays(substances):
+    """
+    Packs the critical properties of the substances into arrays.
+
+    Returns
+    -------
+    Tc, Pc, omega : ndarray
+        critical temperature (K), critical pressure (Pa) and acentric factor of each
+        substance.
+    """
+    Tc = np.array([s.Tc for s in substances], dtype=np.float64)
+    Pc = np.array([s.Pc for s in substances], dtype=np.float64)
+    omega = np.array([s.omega for s in substances], dtype=np.float64)
+    return Tc, Pc, omega
+
+
+def getComponentArray(func, substances):
+    """
+    Packs func(i) for every substance i into an array.
+    """
+    return np.array([func(i) for i in range(len(substances))], dtype=np.float64)
+
+
+def getPackedConstants(behavior, name: str, pack, substances):
+    """
+    Returns pack(), evaluated only once per behavior and list of substances: the
+    result is kept in the behavior under name and packed again only for another list
+    of substances. The vector methods get their per-component constants this way, so
+    they aren't evaluated substance by substance on every call. What pack returns
+    must not depend on the temperature.
+    """
+    constants = behavior.__dict__.setdefault("_packedConstants", {})
+    packed = constants.get(name)
+    if packed is None or packed[0] is not substances:
+        packed = (substances, pack())
+        constants[name] = packed
+    return packed[1]
+
+
+def getComponentConstant(behavior, name: str, func, substances):
+    """
+    getComponentArray(func, substances), packed once per behavior and list of
+    substances (see getPackedConstants).
+    """
+    return getPackedConstants(
+        behavior, name, lambda: getComponentArray(func, substances), substances
+    )
+
+
+def getCriticalConstants(behavior, substances):
+    """
+    getCriticalArrays(substances), packed once per behavior and list of substances
+    (see getPackedConstants).
+    """
+    return getPackedConstants(
+        behavior, "critical", lambda: getCriticalArrays(substances), substances
+    )
+
 
 class BiBehavior:
     __metaclass__ = abc.ABCMeta
@@ -8,6 +73,60 @@ class BiBehavior:
     def getBi(self, i: int, T: float, substances) -> float:
         pass
 
+    def getBVector(self, T, substances):
+        """
+        Evaluates b_i for every substance and every temperature.
+
+        Returns
+        -------
+        b : ndarray
+            (nT, n) matrix, where b[t, i] is the parameter of substance i at T[t].
+        """
+        T = getTemperatureArray(T)
+        n = len(substances)
+        ret = np.empty((len(T), n), dtype=np.float64)
+        for t in range(len(T)):
+            for i in range(n):
+                ret[t, i] = self.getBi(i, T[t], substances)
+        return ret
+
+    def getdBdTVector(self, T, substances):
+        """
+        Evaluates d(b_i)/dT for every substance and every temperature.
+
+        The default implementation uses central differences over getBVector, which
+        are exactly zero when b_i doesn't depend on temperature; behaviors with a
+        temperature dependent b_i override it.
+
+        Returns
+        -------
+        dbdT : ndarray
+            (nT, n) matrix, where dbdT[t, i] is the derivative of substance i at T[t].
+        """
+        T = getTemperatureArray(T)
+        h = 1e-5 * T
+        return (
+            self.getBVector(T + h, substances) - self.getBVector(T - h, substances)
+        ) / (2.0 * h[:, np.newaxis])
+
+    def getd2BdT2Vector(self, T, substances):
+        """
+        Evaluates d2(b_i)/dT2 for every substance and every temperature.
+
+        The default implementation uses central differences over getdBdTVector.
+
+        Returns
+        -------
+        d2bdT2 : ndarray
+            (nT, n) matrix, where d2bdT2[t, i] is the derivative of substance i at T[t].
+        """
+        T = getTemperatureArray(T)
+        h = 1e-5 * T
+        return (
+            self.getdBdTVector(T + h, substances)
+            - self.getdBdTVector(T - h, substances)
+        ) / (2.0 * h[:, np.newaxis])
+
 
 class ThetaiBehavior:
     __metaclass__ = abc.ABCMeta
@@ -16,6 +135,67 @@ class ThetaiBehavior:
     def getThetai(self, i: int, T: float, substances) -> float:
         pass
 
+    def getThetaVector(self, T, substances):
+        """
+        Evaluates theta_i for every substance and every temperature.
+
+        Returns
+        -------
+        theta : ndarray
+            (nT, n) matrix, where theta[t, i] is the parameter of substance i at T[t].
+        """
+        T = getTemperatureArray(T)
+        n = len(substances)
+        ret = np.empty((len(T), n), dtype=np.float64)
+        for t in range(len(T)):
+            for i in range(n):
+                ret[t, i] = self.getThetai(i, T[t], substances)
+        return ret
+
+    def getdThetadTVector(self, T, substances):
+        """
+        Evaluates d(theta_i)/dT for every substance and every temperature.
+
+        The default implementation uses central differences over getThetaVector;
+        behaviors with an analytic alpha function override it.
+
+        Returns
+        -------
+        dthetadT : ndarray
+            (nT, n) matrix, where dthetadT[t, i] is the derivative of substance i at T[t].
+        """
+        T = getTemperatureArray(T)
+        h = 1e-5 * T
+        return (
+            self.getThetaVector(T + h, substances)
+            - self.getThetaVector(T - h, substances)
+        ) / (2.0 * h[:, np.newaxis])
+
+    def getd2ThetadT2Vector(self, T, substances):
+        """
+        Evaluates d2(theta_i)/dT2 for every substance and every temperature.
+
+        The default implementation uses central differences over getdThetadTVector.
+
+        Returns
+        -------
+        d2thetadT2 : ndarray
+            (nT, n) matrix, where d2thetadT2[t, i] is the derivative of substance i at
+            T[t].
+        """
+        T = getTemperatureArray(T)
+        h = 1e-5 * T
+        return (
+            self.getdThetadTVector(T + h, substances)
+            - self.getdThetadTVector(T - h, substances)
+        ) / (2.0 * h[:, np.newaxis])
+
+    def getdThetaidT(self, i: int, T: float, substances) -> float:
+        return self.getdThetadTVector(T, substances)[0, i]
+
+    def getd2ThetaidT2(self, i: int, T: float, substances) -> float:
+        return self.getd2ThetadT2Vector(T, substances)[0, i]
+
 
 class DeltaiBehavior:
     __metaclass__ = abc.ABCMeta
@@ -31,3 +211,14 @@ class EpsiloniBehavior:
     @abc.abstractmethod
     def getEpsiloni(self, i: int, T: float, bib: BiBehavior, substances) -> float:
         pass
+
+
+def constantBVector(bib: BiBehavior, T, substances):
+    """
+    b vector for behaviors whose b_i doesn't depend on temperature.
+    """
+    T = getTemperatureArray(T)
+    b = getComponentConstant(
+        bib, "b", lambda i: bib.getBi(i, T[0], substances), substances
+    )
+    return np.repeat(b[np.newaxis, :], len(T), axis=0)
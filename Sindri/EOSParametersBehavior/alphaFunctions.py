@@ -0,0 +1,441 @@
+"""
+Compiled alpha functions used by the array interface of the ThetaiBehavior classes.
+
+Every function receives the temperatures as a 1d array of size nT and the packed
+component parameters as 1d arrays of size n, returning a (nT, n) matrix.
+"""
+
+import numpy as np
+from numba import njit, float64
+
+
+@njit(float64[:, :](float64[:], float64[:], float64[:]), cache=True)
+def soave_alpha_vector(T, Tc, m):
+    # (1 + m * (1 - sqrt(Tr)))^2
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            ret[t, i] = (1.0 + m[i] * (1.0 - np.sqrt(T[t] / Tc[i]))) ** 2
+    return ret
+
+
+@njit(float64[:, :](float64[:], float64[:]), cache=True)
+def redlich_kwong_alpha_vector(T, Tc):
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            ret[t, i] = 1.0 / np.sqrt(T[t] / Tc[i])
+    return ret
+
+
+@njit(float64[:, :](float64[:], float64[:], float64[:]), cache=True)
+def wilson_alpha_vector(T, Tc, omega):
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            tr = T[t] / Tc[i]
+            ret[t, i] = (1.0 + (1.57 + 1.62 * omega[i]) * (1.0 / tr - 1.0)) * tr
+    return ret
+
+
+@njit(float64[:, :](float64[:], float64[:], float64[:]), cache=True)
+def schmidt_wenzel_alpha_vector(T, Tc, k0):
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            tr = T[t] / Tc[i]
+            tr_m = min(tr, 1.0)
+            m = k0[i] + (5.0 * tr_m - 3.0 * k0[i] - 1.0) ** 2 / 70.0
+            ret[t, i] = (1.0 + m * (1.0 - np.sqrt(tr))) ** 2
+    return ret
+
+
+@njit(float64[:, :](float64[:], float64[:], float64[:], float64[:]), cache=True)
+def stryjek_vera_alpha_vector(T, Tc, k0, k1):
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            tr = T[t] / Tc[i]
+            m = k0[i] + k1[i] * (1.0 + tr) * (0.7 - tr)
+            ret[t, i] = (1.0 + m * (1.0 - np.sqrt(tr))) ** 2
+    return ret
+
+
+@njit(
+    float64[:, :](float64[:], float64[:], float64[:], float64[:], float64[:]),
+    cache=True,
+)
+def mathias_copeman_alpha_vector(T, Tc, c1, c2, c3):
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            tr = T[t] / Tc[i]
+            one_minus_sqrt_tr = 1.0 - tr ** 0.5
+            ret[t, i] = (
+                np.exp(c1[i] * (1.0 - tr))
+                * (
+                    1.0
+                    + c2[i] * one_minus_sqrt_tr ** 2
+                    + c3[i] * one_minus_sqrt_tr ** 3
+                )
+                ** 2
+            )
+    return ret
+
+
+@njit(float64[:, :](float64[:], float64[:], float64[:], float64[:]), cache=True)
+def twu_alpha_vector(T, Tc, omega, params):
+    # params: (N0, M0, L0, N1, M1, L1) of alpha = tr^N * exp(L * (1 - tr^M))
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            tr = T[t] / Tc[i]
+            alpha0 = tr ** params[0] * np.exp(params[2] * (1.0 - tr ** params[1]))
+            alpha1 = tr ** params[3] * np.exp(params[5] * (1.0 - tr ** params[4]))
+            ret[t, i] = alpha0 + omega[i] * (alpha1 - alpha0)
+    return ret
+
+
+@njit(float64[:, :](float64[:], float64[:], float64[:]), cache=True)
+def gasem_alpha_vector(T, Tc, omega):
+    A = 2.0
+    B = 0.836
+    C = 0.134
+    D = 0.508
+    E = -0.0467
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            tr = T[t] / Tc[i]
+            w = omega[i]
+            ret[t, i] = np.exp((A + B * tr) * (1.0 - tr ** (C + D * w + E * w * w)))
+    return ret
+
+
+@njit(float64[:, :](float64[:], float64[:], float64[:], float64[:]), cache=True)
+def tsai_chen_alpha_vector(T, Tc, M, N):
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            tr = T[t] / Tc[i]
+            ret[t, i] = (1.0 + M[i] * (1.0 - tr) + N[i] * (1.0 - tr) * (0.7 - tr)) ** 2
+    return ret
+
+
+# ============ first temperature derivatives =================
+
+
+@njit(float64[:, :](float64[:], float64[:], float64[:]), cache=True)
+def soave_dalpha_dT_vector(T, Tc, m):
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            sqrt_tr = np.sqrt(T[t] / Tc[i])
+            g = 1.0 + m[i] * (1.0 - sqrt_tr)
+            ret[t, i] = -m[i] * g / (sqrt_tr * Tc[i])
+    return ret
+
+
+@njit(float64[:, :](float64[:], float64[:]), cache=True)
+def redlich_kwong_dalpha_dT_vector(T, Tc):
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            tr = T[t] / Tc[i]
+            ret[t, i] = -0.5 * tr ** -1.5 / Tc[i]
+    return ret
+
+
+@njit(float64[:, :](float64[:], float64[:], float64[:]), cache=True)
+def wilson_dalpha_dT_vector(T, Tc, omega):
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            ret[t, i] = (1.0 - (1.57 + 1.62 * omega[i])) / Tc[i]
+    return ret
+
+
+@njit(float64[:, :](float64[:], float64[:], float64[:]), cache=True)
+def schmidt_wenzel_dalpha_dT_vector(T, Tc, k0):
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            tr = T[t] / Tc[i]
+            sqrt_tr = np.sqrt(tr)
+            if tr > 1.0:
+                m = k0[i] + (5.0 - 3.0 * k0[i] - 1.0) ** 2 / 70.0
+                dm = 0.0
+            else:
+                m = k0[i] + (5.0 * tr - 3.0 * k0[i] - 1.0) ** 2 / 70.0
+                dm = (5.0 * tr - 3.0 * k0[i] - 1.0) / (7.0 * Tc[i])
+            g = 1.0 + m * (1.0 - sqrt_tr)
+            dg = dm * (1.0 - sqrt_tr) - m / (2.0 * sqrt_tr * Tc[i])
+            ret[t, i] = 2.0 * g * dg
+    return ret
+
+
+@njit(float64[:, :](float64[:], float64[:], float64[:], float64[:]), cache=True)
+def stryjek_vera_dalpha_dT_vector(T, Tc, k0, k1):
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            tr = T[t] / Tc[i]
+            sqrt_tr = np.sqrt(tr)
+            m = k0[i] + k1[i] * (1.0 + tr) * (0.7 - tr)
+            dm = k1[i] * (-0.3 - 2.0 * tr) / Tc[i]
+            g = 1.0 + m * (1.0 - sqrt_tr)
+            dg = dm * (1.0 - sqrt_tr) - m / (2.0 * sqrt_tr * Tc[i])
+            ret[t, i] = 2.0 * g * dg
+    return ret
+
+
+@njit(
+    float64[:, :](float64[:], float64[:], float64[:], float64[:], float64[:]),
+    cache=True,
+)
+def mathias_copeman_dalpha_dT_vector(T, Tc, c1, c2, c3):
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            tr = T[t] / Tc[i]
+            sqrt_tr = np.sqrt(tr)
+            u = 1.0 - sqrt_tr
+            du = -1.0 / (2.0 * sqrt_tr * Tc[i])
+            e = np.exp(c1[i] * (1.0 - tr))
+            de = -c1[i] * e / Tc[i]
+            h = 1.0 + c2[i] * u ** 2 + c3[i] * u ** 3
+            dh = (2.0 * c2[i] * u + 3.0 * c3[i] * u ** 2) * du
+            ret[t, i] = de * h * h + e * 2.0 * h * dh
+    return ret
+
+
+@njit(float64[:, :](float64[:], float64[:], float64[:], float64[:]), cache=True)
+def twu_dalpha_dT_vector(T, Tc, omega, params):
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            tr = T[t] / Tc[i]
+            alpha0 = tr ** params[0] * np.exp(params[2] * (1.0 - tr ** params[1]))
+            alpha1 = tr ** params[3] * np.exp(params[5] * (1.0 - tr ** params[4]))
+            # d(ln alpha)/dT
+            q0 = (
+                params[0] / tr - params[2] * params[1] * tr ** (params[1] - 1.0)
+            ) / Tc[i]
+            q1 = (
+                params[3] / tr - params[5] * params[4] * tr ** (params[4] - 1.0)
+            ) / Tc[i]
+            dalpha0 = alpha0 * q0
+            dalpha1 = alpha1 * q1
+            ret[t, i] = dalpha0 + omega[i] * (dalpha1 - dalpha0)
+    return ret
+
+
+@njit(float64[:, :](float64[:], float64[:], float64[:]), cache=True)
+def gasem_dalpha_dT_vector(T, Tc, omega):
+    A = 2.0
+    B = 0.836
+    C = 0.134
+    D = 0.508
+    E = -0.0467
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            tr = T[t] / Tc[i]
+            w = omega[i]
+            p = C + D * w + E * w * w
+            alpha = np.exp((A + B * tr) * (1.0 - tr ** p))
+            df = B * (1.0 - tr ** p) - (A + B * tr) * p * tr ** (p - 1.0)
+            ret[t, i] = alpha * df / Tc[i]
+    return ret
+
+
+@njit(float64[:, :](float64[:], float64[:], float64[:], float64[:]), cache=True)
+def tsai_chen_dalpha_dT_vector(T, Tc, M, N):
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            tr = T[t] / Tc[i]
+            g = 1.0 + M[i] * (1.0 - tr) + N[i] * (1.0 - tr) * (0.7 - tr)
+            dg = (-M[i] + N[i] * (2.0 * tr - 1.7)) / Tc[i]
+            ret[t, i] = 2.0 * g * dg
+    return ret
+
+
+# ============ second temperature derivatives =================
+
+
+@njit(float64[:, :](float64[:], float64[:], float64[:]), cache=True)
+def soave_d2alpha_dT2_vector(T, Tc, m):
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            sqrt_TTc = np.sqrt(T[t] * Tc[i])
+            g = 1.0 + m[i] * (1.0 - np.sqrt(T[t] / Tc[i]))
+            dg = -m[i] / (2.0 * sqrt_TTc)
+            d2g = m[i] / (4.0 * T[t] * sqrt_TTc)
+            ret[t, i] = 2.0 * (dg * dg + g * d2g)
+    return ret
+
+
+@njit(float64[:, :](float64[:], float64[:]), cache=True)
+def redlich_kwong_d2alpha_dT2_vector(T, Tc):
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            tr = T[t] / Tc[i]
+            ret[t, i] = 0.75 * tr ** -2.5 / (Tc[i] * Tc[i])
+    return ret
+
+
+@njit(float64[:, :](float64[:], float64[:], float64[:]), cache=True)
+def schmidt_wenzel_d2alpha_dT2_vector(T, Tc, k0):
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            tr = T[t] / Tc[i]
+            sqrt_TTc = np.sqrt(T[t] * Tc[i])
+            if tr > 1.0:
+                m = k0[i] + (5.0 - 3.0 * k0[i] - 1.0) ** 2 / 70.0
+                dm = 0.0
+                d2m = 0.0
+            else:
+                m = k0[i] + (5.0 * tr - 3.0 * k0[i] - 1.0) ** 2 / 70.0
+                dm = (5.0 * tr - 3.0 * k0[i] - 1.0) / (7.0 * Tc[i])
+                d2m = 5.0 / (7.0 * Tc[i] * Tc[i])
+            s = 1.0 - np.sqrt(tr)
+            ds = -1.0 / (2.0 * sqrt_TTc)
+            d2s = 1.0 / (4.0 * T[t] * sqrt_TTc)
+            g = 1.0 + m * s
+            dg = dm * s + m * ds
+            d2g = d2m * s + 2.0 * dm * ds + m * d2s
+            ret[t, i] = 2.0 * (dg * dg + g * d2g)
+    return ret
+
+
+@njit(float64[:, :](float64[:], float64[:], float64[:], float64[:]), cache=True)
+def stryjek_vera_d2alpha_dT2_vector(T, Tc, k0, k1):
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            tr = T[t] / Tc[i]
+            sqrt_TTc = np.sqrt(T[t] * Tc[i])
+            m = k0[i] + k1[i] * (1.0 + tr) * (0.7 - tr)
+            dm = k1[i] * (-0.3 - 2.0 * tr) / Tc[i]
+            d2m = -2.0 * k1[i] / (Tc[i] * Tc[i])
+            s = 1.0 - np.sqrt(tr)
+            ds = -1.0 / (2.0 * sqrt_TTc)
+            d2s = 1.0 / (4.0 * T[t] * sqrt_TTc)
+            g = 1.0 + m * s
+            dg = dm * s + m * ds
+            d2g = d2m * s + 2.0 * dm * ds + m * d2s
+            ret[t, i] = 2.0 * (dg * dg + g * d2g)
+    return ret
+
+
+@njit(
+    float64[:, :](float64[:], float64[:], float64[:], float64[:], float64[:]),
+    cache=True,
+)
+def mathias_copeman_d2alpha_dT2_vector(T, Tc, c1, c2, c3):
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            tr = T[t] / Tc[i]
+            sqrt_TTc = np.sqrt(T[t] * Tc[i])
+            u = 1.0 - np.sqrt(tr)
+            du = -1.0 / (2.0 * sqrt_TTc)
+            d2u = 1.0 / (4.0 * T[t] * sqrt_TTc)
+            e = np.exp(c1[i] * (1.0 - tr))
+            de = -c1[i] * e / Tc[i]
+            d2e = c1[i] * c1[i] * e / (Tc[i] * Tc[i])
+            h = 1.0 + c2[i] * u ** 2 + c3[i] * u ** 3
+            dh_du = 2.0 * c2[i] * u + 3.0 * c3[i] * u ** 2
+            dh = dh_du * du
+            d2h = (2.0 * c2[i] + 6.0 * c3[i] * u) * du * du + dh_du * d2u
+            H = h * h
+            dH = 2.0 * h * dh
+            d2H = 2.0 * (dh * dh + h * d2h)
+            ret[t, i] = d2e * H + 2.0 * de * dH + e * d2H
+    return ret
+
+
+@njit(float64[:, :](float64[:], float64[:], float64[:], float64[:]), cache=True)
+def twu_d2alpha_dT2_vector(T, Tc, omega, params):
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            tr = T[t] / Tc[i]
+            Tc2 = Tc[i] * Tc[i]
+            d2alpha = np.empty(2, dtype=np.float64)
+            for k in range(2):
+                N = params[3 * k]
+                M = params[3 * k + 1]
+                L = params[3 * k + 2]
+                alpha = tr ** N * np.exp(L * (1.0 - tr ** M))
+                # d(ln alpha)/dT and its derivative
+                q = (N / tr - L * M * tr ** (M - 1.0)) / Tc[i]
+                dq = (-N / (tr * tr) - L * M * (M - 1.0) * tr ** (M - 2.0)) / Tc2
+                d2alpha[k] = alpha * (q * q + dq)
+            ret[t, i] = d2alpha[0] + omega[i] * (d2alpha[1] - d2alpha[0])
+    return ret
+
+
+@njit(float64[:, :](float64[:], float64[:], float64[:]), cache=True)
+def gasem_d2alpha_dT2_vector(T, Tc, omega):
+    A = 2.0
+    B = 0.836
+    C = 0.134
+    D = 0.508
+    E = -0.0467
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            tr = T[t] / Tc[i]
+            w = omega[i]
+            p = C + D * w + E * w * w
+            alpha = np.exp((A + B * tr) * (1.0 - tr ** p))
+            df = B * (1.0 - tr ** p) - (A + B * tr) * p * tr ** (p - 1.0)
+            d2f = -2.0 * B * p * tr ** (p - 1.0) - (A + B * tr) * p * (
+                p - 1.0
+            ) * tr ** (p - 2.0)
+            ret[t, i] = alpha * (df * df + d2f) / (Tc[i] * Tc[i])
+    return ret
+
+
+@njit(float64[:, :](float64[:], float64[:], float64[:], float64[:]), cache=True)
+def tsai_chen_d2alpha_dT2_vector(T, Tc, M, N):
+    nT, n = len(T), len(Tc)
+    ret = np.empty((nT, n), dtype=np.float64)
+    for t in range(nT):
+        for i in range(n):
+            tr = T[t] / Tc[i]
+            g = 1.0 + M[i] * (1.0 - tr) + N[i] * (1.0 - tr) * (0.7 - tr)
+            dg = (-M[i] + N[i] * (2.0 * tr - 1.7)) / Tc[i]
+            d2g = 2.0 * N[i] / (Tc[i] * Tc[i])
+            ret[t, i] = 2.0 * (dg * dg + g * d2g)
+    return ret
@@ -0,0 +1,88 @@
+"""
+Import time of the calculation core, measured in fresh interpreters.
+
+    python ImportBenchmark.py --repeat 5
+
+The core must import without the graphical interface and plotting libraries, so
+the benchmark fails if any of gui_modules is loaded.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+# what a batch worker imports
+core_imports = [
+    "import db",
+    "from Factories.EOSMixFactory import createEOSMix, getEOSMixOptions",
+    "from compounds import SubstanceProp",
+]
+
+gui_modules = ["matplotlib", "sympy", "PySide2"]
+
+_probe = """
+import json, sys, time
+t = time.perf_counter()
+{imports}
+t = time.perf_counter() - t
+loaded = sorted({{m.split(".")[0] for m in sys.modules}} & set({gui_modules!r}))
+print(json.dumps({{"time": t, "loaded": loaded}}))
+"""
+
+
+def measureImport(imports: list = None) -> dict:
+    """
+    Imports the statements of imports (core_imports by default) in a new
+    interpreter, with this directory in the path.
+
+    Returns
+    -------
+    result : dict
+        "time", the import time in seconds, and "loaded", the gui_modules that were
+        imported.
+    """
+    if imports is None:
+        imports = core_imports
+    here = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (here, os.path.dirname(here), env.get("PYTHONPATH")) if p
+    )
+    code = _probe.format(imports="\n".join(imports), gui_modules=gui_modules)
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        cwd=here,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(out.splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import time of the core.")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    # the first run may compile or write the numba caches
+    measureImport()
+    results = [measureImport() for _ in range(args.repeat)]
+    times = np.array([r["time"] for r in results])
+    print(
+        "core import: median {:.3f} s, min {:.3f} s, max {:.3f} s ({} runs)".format(
+            np.median(times), np.min(times), np.max(times), args.repeat
+        )
+    )
+    loaded = sorted({m for r in results for m in r["loaded"]})
+    if loaded:
+        print("the core imported {}".format(", ".join(loaded)), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
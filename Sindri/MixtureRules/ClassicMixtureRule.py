@@ -1,4 +1,5 @@
 import numpy as np
+from numba import njit, float64
 
 from EOSParametersBehavior.ParametersBehaviorInterface import BiBehavior, ThetaiBehavior
 from MixtureRules.MixtureRulesInterface import (
@@ -9,47 +10,97 @@ from MixtureRules.MixtureRulesInterface import (
 
 
 class ClassicThetaMixture(ThetaMixtureRuleBehavior):
+    def getThetaiVector(self, y, T: float, thetaib: ThetaiBehavior, substances):
+        return thetaib.getThetaVector(T, substances)[0]
+
     def thetam(self, y, T: float, thetaib, substances, k) -> float:
-        s1 = 0.0
-        n = len(y)
-        for i in range(n):
-            s2 = 0.0
-            thetai = thetaib.getThetai(i, T, substances)
-            for j in range(n):
-                thetaj = thetaib.getThetai(j, T, substances)
-                s2 += y[i] * y[j] * np.sqrt(thetai * thetaj) * (1.0 - k[i][j])
-            s1 += s2
-        return s1
+        thetai = self.getThetaiVector(y, T, thetaib, substances)
+        return _thetam_helper(
+            np.asarray(y, dtype=np.float64), thetai, np.asarray(k, dtype=np.float64)
+        )
+
+    def thetamBatch(self, Y, T, thetaib: ThetaiBehavior, substances, k):
+        thetai = thetaib.getThetaVector(T, substances)
+        return _thetam_batch_helper(
+            np.asarray(Y, dtype=np.float64), thetai, np.asarray(k, dtype=np.float64)
+        )
 
     def diffThetam(
         self, i: int, y, T: float, thetaib: ThetaiBehavior, substances, k
     ) -> float:
-        s = 0.0
-        n = len(y)
-        for j in range(n):
-            if j != i:
-                alphai = np.sqrt(
-                    thetaib.getThetai(i, T, substances)
-                    * thetaib.getThetai(j, T, substances)
-                ) * (1.0 - k[i][j])
-                alphaj = np.sqrt(
-                    thetaib.getThetai(i, T, substances)
-                    * thetaib.getThetai(j, T, substances)
-                ) * (1.0 - k[j][i])
-                s += y[j] * (alphai + alphaj)
-        return s + 2.0 * y[i] * thetaib.getThetai(i, T, substances)
+        return self.diffThetamVector(y, T, thetaib, substances, k)[i]
+
+    def diffThetamVector(self, y, T: float, thetaib: ThetaiBehavior, substances, k):
+        thetai = self.getThetaiVector(y, T, thetaib, substances)
+        return _diffThetam_vector_helper(
+            np.asarray(y, dtype=np.float64), thetai, np.asarray(k, dtype=np.float64)
+        )
+
+    def diffThetamMatrix(self, y, T: float, thetaib: ThetaiBehavior, substances, k):
+        # d2(N^2 thetam)/dn_i dn_j doesn't depend on the composition
+        thetai = self.getThetaiVector(y, T, thetaib, substances)
+        return _diffThetam_matrix_helper(thetai, np.asarray(k, dtype=np.float64))
+
+    def diffThetamdT(
+        self, y, T: float, thetaib: ThetaiBehavior, substances, k
+    ) -> float:
+        thetai = self.getThetaiVector(y, T, thetaib, substances)
+        dthetaidT = thetaib.getdThetadTVector(T, substances)[0]
+        return _diffThetamdT_helper(
+            np.asarray(y, dtype=np.float64),
+            thetai,
+            dthetaidT,
+            np.asarray(k, dtype=np.float64),
+        )
+
+    def diffThetamd2T(
+        self, y, T: float, thetaib: ThetaiBehavior, substances, k
+    ) -> float:
+        thetai = self.getThetaiVector(y, T, thetaib, substances)
+        dthetaidT = thetaib.getdThetadTVector(T, substances)[0]
+        d2thetaidT2 = thetaib.getd2ThetadT2Vector(T, substances)[0]
+        return _diffThetamd2T_helper(
+            np.asarray(y, dtype=np.float64),
+            thetai,
+            dthetaidT,
+            d2thetaidT2,
+            np.asarray(k, dtype=np.float64),
+        )
+
+    def diffThetamVectordT(self, y, T: float, thetaib: ThetaiBehavior, substances, k):
+        thetai = self.getThetaiVector(y, T, thetaib, substances)
+        dthetaidT = thetaib.getdThetadTVector(T, substances)[0]
+        return _diffThetamVectordT_helper(
+            np.asarray(y, dtype=np.float64),
+            thetai,
+            dthetaidT,
+            np.asarray(k, dtype=np.float64),
+        )
 
 
 class ClassicBMixture(BMixtureRuleBehavior):
     def bm(self, y, T: float, bib: BiBehavior, substances) -> float:
-        s1 = 0.0
-        for i in range(len(y)):
-            s1 += y[i] * bib.getBi(i, T, substances)
-        return s1
+        return float(np.dot(y, bib.getBVector(T, substances)[0]))
+
+    def bmBatch(self, Y, T, bib: BiBehavior, substances):
+        return np.sum(Y * bib.getBVector(T, substances), axis=1)
 
     def diffBm(self, i: int, y, T: float, bib: BiBehavior, substances) -> float:
         return bib.getBi(i, T, substances)
 
+    def diffBmdT(self, y, T: float, bib: BiBehavior, substances) -> float:
+        return float(np.dot(y, bib.getdBdTVector(T, substances)[0]))
+
+    def diffBmd2T(self, y, T: float, bib: BiBehavior, substances) -> float:
+        return float(np.dot(y, bib.getd2BdT2Vector(T, substances)[0]))
+
+    def diffBmVectordT(self, y, T: float, bib: BiBehavior, substances):
+        return bib.getdBdTVector(T, substances)[0]
+
+    def diffBmMatrix(self, y, T: float, bib: BiBehavior, substances):
+        # N bm is linear in the mole numbers
+        return np.zeros((len(y), len(y)), dtype=np.float64)
+
 
 class ClassicMixtureRule(MixtureRuleBehavior):
     def __init__(self):
@@ -59,13 +110,163 @@ class ClassicMixtureRule(MixtureRuleBehavior):
     def bm(self, y, T: float, bib: BiBehavior, substances) -> float:
         return self.bmBehavior.bm(y, T, bib, substances)
 
+    def bmBatch(self, Y, T, bib: BiBehavior, substances):
+        return self.bmBehavior.bmBatch(Y, T, bib, substances)
+
     def diffBm(self, i: int, y, T: float, bib: BiBehavior, substances) -> float:
         return self.bmBehavior.diffBm(i, y, T, bib, substances)
 
+    def diffBmVector(self, y, T: float, bib: BiBehavior, substances):
+        return self.bmBehavior.diffBmVector(y, T, bib, substances)
+
+    def diffBmdT(self, y, T: float, bib: BiBehavior, substances) -> float:
+        return self.bmBehavior.diffBmdT(y, T, bib, substances)
+
+    def diffBmd2T(self, y, T: float, bib: BiBehavior, substances) -> float:
+        return self.bmBehavior.diffBmd2T(y, T, bib, substances)
+
+    def diffBmMatrix(self, y, T: float, bib: BiBehavior, substances):
+        return self.bmBehavior.diffBmMatrix(y, T, bib, substances)
+
     def thetam(self, y, T: float, thetaib: ThetaiBehavior, substances, k) -> float:
         return self.thetamBehavior.thetam(y, T, thetaib, substances, k)
 
+    def thetamBatch(self, Y, T, thetaib: ThetaiBehavior, substances, k):
+        return self.thetamBehavior.thetamBatch(Y, T, thetaib, substances, k)
+
     def diffThetam(
         self, i: int, y, T: float, thetaib: ThetaiBehavior, substances, k
     ) -> float:
         return self.thetamBehavior.diffThetam(i, y, T, thetaib, substances, k)
+
+    def diffThetamVector(self, y, T: float, thetaib: ThetaiBehavior, substances, k):
+        return self.thetamBehavior.diffThetamVector(y, T, thetaib, substances, k)
+
+    def diffThetamMatrix(self, y, T: float, thetaib: ThetaiBehavior, substances, k):
+        return self.thetamBehavior.diffThetamMatrix(y, T, thetaib, substances, k)
+
+    def diffThetamdT(
+        self, y, T: float, thetaib: ThetaiBehavior, substances, k
+    ) -> float:
+        return self.thetamBehavior.diffThetamdT(y, T, thetaib, substances, k)
+
+    def diffThetamd2T(
+        self, y, T: float, thetaib: ThetaiBehavior, substances, k
+    ) -> float:
+        return self.thetamBehavior.diffThetamd2T(y, T, thetaib, substances, k)
+
+    def diffBmVectordT(self, y, T: float, bib: BiBehavior, substances):
+        return self.bmBehavior.diffBmVectordT(y, T, bib, substances)
+
+    def diffThetamVectordT(self, y, T: float, thetaib: ThetaiBehavior, substances, k):
+        return self.thetamBehavior.diffThetamVectordT(y, T, thetaib, substances, k)
+
+
+@njit(float64(float64[:], float64[:], float64[:, :]), cache=True)
+def _thetam_helper(y, thetai, k):
+    n = len(y)
+    s = 0.0
+    for i in range(n):
+        for j in range(n):
+            s += y[i] * y[j] * np.sqrt(thetai[i] * thetai[j]) * (1.0 - k[i, j])
+    return s
+
+
+@njit(float64[:](float64[:, :], float64[:, :], float64[:, :]), cache=True)
+def _thetam_batch_helper(Y, thetai, k):
+    N, n = Y.shape
+    ret = np.empty(N, dtype=np.float64)
+    for r in range(N):
+        s = 0.0
+        for i in range(n):
+            for j in range(n):
+                s += (
+                    Y[r, i]
+                    * Y[r, j]
+                    * np.sqrt(thetai[r, i] * thetai[r, j])
+                    * (1.0 - k[i, j])
+                )
+        ret[r] = s
+    return ret
+
+
+@njit(float64[:](float64[:], float64[:], float64[:, :]), cache=True)
+def _diffThetam_vector_helper(y, thetai, k):
+    n = len(y)
+    ret = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        s = 0.0
+        for j in range(n):
+            if j != i:
+                sqrt_thetaij = np.sqrt(thetai[i] * thetai[j])
+                s += y[j] * sqrt_thetaij * (2.0 - k[i, j] - k[j, i])
+        ret[i] = s + 2.0 * y[i] * thetai[i]
+    return ret
+
+
+@njit(float64[:, :](float64[:], float64[:, :]), cache=True)
+def _diffThetam_matrix_helper(thetai, k):
+    n = len(thetai)
+    ret = np.empty((n, n), dtype=np.float64)
+    for i in range(n):
+        for j in range(n):
+            if j != i:
+                sqrt_thetaij = np.sqrt(thetai[i] * thetai[j])
+                ret[i, j] = sqrt_thetaij * (2.0 - k[i, j] - k[j, i])
+            else:
+                ret[i, j] = 2.0 * thetai[i]
+    return ret
+
+
+@njit(float64[:](float64[:], float64[:], float64[:], float64[:, :]), cache=True)
+def _diffThetamVectordT_helper(y, thetai, dthetaidT, k):
+    n = len(y)
+    ret = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        s = 0.0
+        for j in range(n):
+            if j != i:
+                sqrt_thetaij = np.sqrt(thetai[i] * thetai[j])
+                dsqrt_thetaij = (
+                    dthetaidT[i] * thetai[j] + thetai[i] * dthetaidT[j]
+                ) / (2.0 * sqrt_thetaij)
+                s += y[j] * dsqrt_thetaij * (2.0 - k[i, j] - k[j, i])
+        ret[i] = s + 2.0 * y[i] * dthetaidT[i]
+    return ret
+
+
+@njit(float64(float64[:], float64[:], float64[:], float64[:, :]), cache=True)
+def _diffThetamdT_helper(y, thetai, dthetaidT, k):
+    # d sqrt(theta_i theta_j)/dT = (theta_i' theta_j + theta_i theta_j') / (2 sqrt(theta_i theta_j))
+    n = len(y)
+    s = 0.0
+    for i in range(n):
+        for j in range(n):
+            sqrt_thetaij = np.sqrt(thetai[i] * thetai[j])
+            dsqrt_thetaij = (dthetaidT[i] * thetai[j] + thetai[i] * dthetaidT[j]) / (
+                2.0 * sqrt_thetaij
+            )
+            s += y[i] * y[j] * dsqrt_thetaij * (1.0 - k[i, j])
+    return s
+
+
+@njit(
+    float64(float64[:], float64[:], float64[:], float64[:], float64[:, :]), cache=True
+)
+def _diffThetamd2T_helper(y, thetai, dthetaidT, d2thetaidT2, k):
+    # with g = theta_i theta_j: d2 sqrt(g)/dT2 = g'' / (2 sqrt(g)) - g'^2 / (4 g^1.5)
+    n = len(y)
+    s = 0.0
+    for i in range(n):
+        for j in range(n):
+            g = thetai[i] * thetai[j]
+            sqrt_g = np.sqrt(g)
+            dg = dthetaidT[i] * thetai[j] + thetai[i] * dthetaidT[j]
+            d2g = (
+                d2thetaidT2[i] * thetai[j]
+                + 2.0 * dthetaidT[i] * dthetaidT[j]
+                + thetai[i] * d2thetaidT2[j]
+            )
+            d2sqrt_g = d2g / (2.0 * sqrt_g) - dg * dg / (4.0 * g * sqrt_g)
+            s += y[i] * y[j] * d2sqrt_g * (1.0 - k[i, j])
+    return s
@@ -1,8 +1,67 @@
 import abc
 
+import numpy as np
+
 from EOSParametersBehavior.ParametersBehaviorInterface import BiBehavior, ThetaiBehavior
 
 
+def centralDifference(func, T: float, h: float = 1e-5) -> float:
+    """
+    d(func)/dT by central differences, used as the default temperature derivative of
+    the mixing rules. It is exactly zero when func doesn't depend on temperature.
+    """
+    return (func(T + h) - func(T - h)) / (2.0 * h)
+
+
+def secondCentralDifference(func, T: float, h: float = 1e-2) -> float:
+    """
+    d2(func)/dT2 by central differences, exactly zero when func doesn't depend on
+    temperature.
+    """
+    return (func(T + h) - 2.0 * func(T) + func(T - h)) / (h * h)
+
+
+def compositionDifference(func, y, order: int, h: float = 1e-5):
+    """
+    d(func_i)/dn_j by central differences in the mole numbers n, at n = y, used as
+    the default second composition derivative of the mixing rules. func(y) gives
+    the composition derivatives of a mixing rule, d(N^(order + 1) q)/dn_i / N^order,
+    with N = sum(n) and q the mixture parameter: order is 0 for b and delta and 1 for
+    theta and epsilon.
+
+    Returns
+    -------
+    M : ndarray
+        (n, n) matrix with d2(N^(order + 1) q)/dn_i dn_j.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    ret = np.empty((len(y), len(y)), dtype=np.float64)
+    for j in range(len(y)):
+        columns = []
+        for step in (h, -h):
+            m = y.copy()
+            m[j] += step
+            N = np.sum(m)
+            columns.append(N ** order * func(m / N))
+        ret[:, j] = (columns[0] - columns[1]) / (2.0 * h)
+    return ret
+
+
+def evaluateRows(func, Y, T):
+    """
+    Evaluates func(y, T) for every row of the composition matrix Y, used as the default
+    batched mixing rule. Rules that can be written as matrix operations override it.
+
+    Parameters
+    ----------
+    Y : ndarray
+        (N, n) matrix of compositions.
+    T : ndarray
+        (N,) array of temperatures, one for each composition.
+    """
+    return np.array([func(Y[r], T[r]) for r in range(len(Y))], dtype=np.float64)
+
+
 class MixtureRuleBehavior:
 
     __metaclass__ = abc.ABCMeta
@@ -25,6 +84,62 @@ class MixtureRuleBehavior:
     ) -> float:
         pass
 
+    def bmBatch(self, Y, T, bib: BiBehavior, substances):
+        return evaluateRows(lambda y, t: self.bm(y, t, bib, substances), Y, T)
+
+    def thetamBatch(self, Y, T, thetaib: ThetaiBehavior, substances, k):
+        return evaluateRows(
+            lambda y, t: self.thetam(y, t, thetaib, substances, k), Y, T
+        )
+
+    def diffBmVector(self, y, T: float, bib: BiBehavior, substances):
+        return np.array(
+            [self.diffBm(i, y, T, bib, substances) for i in range(len(y))],
+            dtype=np.float64,
+        )
+
+    def diffBmdT(self, y, T: float, bib: BiBehavior, substances) -> float:
+        return centralDifference(lambda t: self.bm(y, t, bib, substances), T)
+
+    def diffBmd2T(self, y, T: float, bib: BiBehavior, substances) -> float:
+        return secondCentralDifference(lambda t: self.bm(y, t, bib, substances), T)
+
+    def diffBmVectordT(self, y, T: float, bib: BiBehavior, substances):
+        return centralDifference(lambda t: self.diffBmVector(y, t, bib, substances), T)
+
+    def diffThetamVector(self, y, T: float, thetaib: ThetaiBehavior, substances, k):
+        return np.array(
+            [self.diffThetam(i, y, T, thetaib, substances, k) for i in range(len(y))],
+            dtype=np.float64,
+        )
+
+    def diffThetamdT(
+        self, y, T: float, thetaib: ThetaiBehavior, substances, k
+    ) -> float:
+        return centralDifference(lambda t: self.thetam(y, t, thetaib, substances, k), T)
+
+    def diffThetamd2T(
+        self, y, T: float, thetaib: ThetaiBehavior, substances, k
+    ) -> float:
+        return secondCentralDifference(
+            lambda t: self.thetam(y, t, thetaib, substances, k), T
+        )
+
+    def diffThetamVectordT(self, y, T: float, thetaib: ThetaiBehavior, substances, k):
+        return centralDifference(
+            lambda t: self.diffThetamVector(y, t, thetaib, substances, k), T
+        )
+
+    def diffBmMatrix(self, y, T: float, bib: BiBehavior, substances):
+        return compositionDifference(
+            lambda w: self.diffBmVector(w, T, bib, substances), y, 0
+        )
+
+    def diffThetamMatrix(self, y, T: float, thetaib: ThetaiBehavior, substances, k):
+        return compositionDifference(
+            lambda w: self.diffThetamVector(w, T, thetaib, substances, k), y, 1
+        )
+
 
 class BMixtureRuleBehavior:
 
@@ -38,6 +153,29 @@ class BMixtureRuleBehavior:
     def diffBm(self, i: int, y, T: float, bib: BiBehavior, substances) -> float:
         pass
 
+    def bmBatch(self, Y, T, bib: BiBehavior, substances):
+        return evaluateRows(lambda y, t: self.bm(y, t, bib, substances), Y, T)
+
+    def diffBmVector(self, y, T: float, bib: BiBehavior, substances):
+        return np.array(
+            [self.diffBm(i, y, T, bib, substances) for i in range(len(y))],
+            dtype=np.float64,
+        )
+
+    def diffBmdT(self, y, T: float, bib: BiBehavior, substances) -> float:
+        return centralDifference(lambda t: self.bm(y, t, bib, substances), T)
+
+    def diffBmd2T(self, y, T: float, bib: BiBehavior, substances) -> float:
+        return secondCentralDifference(lambda t: self.bm(y, t, bib, substances), T)
+
+    def diffBmVectordT(self, y, T: float, bib: BiBehavior, substances):
+        return centralDifference(lambda t: self.diffBmVector(y, t, bib, substances), T)
+
+    def diffBmMatrix(self, y, T: float, bib: BiBehavior, substances):
+        return compositionDifference(
+            lambda w: self.diffBmVector(w, T, bib, substances), y, 0
+        )
+
 
 class ThetaMixtureRuleBehavior:
 
@@ -53,6 +191,39 @@ class ThetaMixtureRuleBehavior:
     ) -> float:
         pass
 
+    def thetamBatch(self, Y, T, thetaib: ThetaiBehavior, substances, k):
+        return evaluateRows(
+            lambda y, t: self.thetam(y, t, thetaib, substances, k), Y, T
+        )
+
+    def diffThetamVector(self, y, T: float, thetaib: ThetaiBehavior, substances, k):
+        return np.array(
+            [self.diffThetam(i, y, T, thetaib, substances, k) for i in range(len(y))],
+            dtype=np.float64,
+        )
+
+    def diffThetamdT(
+        self, y, T: float, thetaib: ThetaiBehavior, substances, k
+    ) -> float:
+        return centralDifference(lambda t: self.thetam(y, t, thetaib, substances, k), T)
+
+    def diffThetamd2T(
+        self, y, T: float, thetaib: ThetaiBehavior, substances, k
+    ) -> float:
+        return secondCentralDifference(
+            lambda t: self.thetam(y, t, thetaib, substances, k), T
+        )
+
+    def diffThetamVectordT(self, y, T: float, thetaib: ThetaiBehavior, substances, k):
+        return centralDifference(
+            lambda t: self.diffThetamVector(y, t, thetaib, substances, k), T
+        )
+
+    def diffThetamMatrix(self, y, T: float, thetaib: ThetaiBehavior, substances, k):
+        return compositionDifference(
+            lambda w: self.diffThetamVector(w, T, thetaib, substances, k), y, 1
+        )
+
 
 class DeltaMixtureRuleBehavior:
 
@@ -70,6 +241,43 @@ class DeltaMixtureRuleBehavior:
     ) -> float:
         pass
 
+    def deltamBatch(self, Y, T, bib: BiBehavior, bmb: MixtureRuleBehavior, substances):
+        return evaluateRows(lambda y, t: self.deltam(y, t, bib, bmb, substances), Y, T)
+
+    def diffDeltamVector(
+        self, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ):
+        return np.array(
+            [self.diffDeltam(i, y, T, bib, bmb, substances) for i in range(len(y))],
+            dtype=np.float64,
+        )
+
+    def diffDeltamdT(
+        self, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ) -> float:
+        return centralDifference(lambda t: self.deltam(y, t, bib, bmb, substances), T)
+
+    def diffDeltamd2T(
+        self, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ) -> float:
+        return secondCentralDifference(
+            lambda t: self.deltam(y, t, bib, bmb, substances), T
+        )
+
+    def diffDeltamVectordT(
+        self, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ):
+        return centralDifference(
+            lambda t: self.diffDeltamVector(y, t, bib, bmb, substances), T
+        )
+
+    def diffDeltamMatrix(
+        self, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ):
+        return compositionDifference(
+            lambda w: self.diffDeltamVector(w, T, bib, bmb, substances), y, 0
+        )
+
 
 class EpsilonMixtureRuleBehavior:
 
@@ -86,3 +294,44 @@ class EpsilonMixtureRuleBehavior:
         self, i: int, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
     ) -> float:
         pass
+
+    def epsilonmBatch(
+        self, Y, T, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ):
+        return evaluateRows(
+            lambda y, t: self.epsilonm(y, t, bib, bmb, substances), Y, T
+        )
+
+    def diffEpsilonmVector(
+        self, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ):
+        return np.array(
+            [self.diffEpsilonm(i, y, T, bib, bmb, substances) for i in range(len(y))],
+            dtype=np.float64,
+        )
+
+    def diffEpsilonmdT(
+        self, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ) -> float:
+        return centralDifference(lambda t: self.epsilonm(y, t, bib, bmb, substances), T)
+
+    def diffEpsilonmd2T(
+        self, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ) -> float:
+        return secondCentralDifference(
+            lambda t: self.epsilonm(y, t, bib, bmb, substances), T
+        )
+
+    def diffEpsilonmVectordT(
+        self, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ):
+        return centralDifference(
+            lambda t: self.diffEpsilonmVector(y, t, bib, bmb, substances), T
+        )
+
+    def diffEpsilonmMatrix(
+        self, y, T: float, bib: BiBehavior, bmb: MixtureRuleBehavior, substances
+    ):
+        return compositionDifference(
+            lambda w: self.diffEpsilonmVector(w, T, bib, bmb, substances), y, 1
+        )
@@ -62,10 +62,16 @@ class FitExpDataToBinaryParameterModel:
         y2_exp = 1.0 - y1_exp
         t = self.isovar
 
+        zls, _ = self.model.system.getZfromPT_batch(
+            p_exp, t, np.column_stack((x1_exp, x2_exp))
+        )
+        _, zvs = self.model.system.getZfromPT_batch(
+            p_exp, t, np.column_stack((y1_exp, y2_exp))
+        )
+
         s = 0.0
         for i in range(self.n_exp):
-            zls = self.model.system.getZfromPT(p_exp[i], t, [x1_exp[i], x2_exp[i]])
-            zl = np.min(zls)
+            zl = zls[i]
             phi_liq_0 = self.model.system.getPhi_i(
                 0, [x1_exp[i], x2_exp[i]], p_exp[i], t, zl
             )
@@ -73,8 +79,7 @@ class FitExpDataToBinaryParameterModel:
                 1, [x1_exp[i], x2_exp[i]], p_exp[i], t, zl
             )
 
-            zvs = self.model.system.getZfromPT(p_exp[i], t, [y1_exp[i], y2_exp[i]])
-            zv = np.max(zvs)
+            zv = zvs[i]
             phi_vap_0 = self.model.system.getPhi_i(
                 0, [y1_exp[i], y2_exp[i]], p_exp[i], t, zv
             )
@@ -107,10 +112,16 @@ class FitExpDataToBinaryParameterModel:
         y2_exp = 1.0 - y1_exp
         p = self.isovar
 
+        zls, _ = self.model.system.getZfromPT_batch(
+            p, t_exp, np.column_stack((x1_exp, x2_exp))
+        )
+        _, zvs = self.model.system.getZfromPT_batch(
+            p, t_exp, np.column_stack((y1_exp, y2_exp))
+        )
+
         s = 0.0
         for i in range(self.n_exp):
-            zls = self.model.system.getZfromPT(p, t_exp[i], [x1_exp[i], x2_exp[i]])
-            zl = np.min(zls)
+            zl = zls[i]
             phi_liq_0 = self.model.system.getPhi_i(
                 0, [x1_exp[i], x2_exp[i]], p, t_exp[i], zl
             )
@@ -118,8 +129,7 @@ class FitExpDataToBinaryParameterModel:
                 1, [x1_exp[i], x2_exp[i]], p, t_exp[i], zl
             )
 
-            zvs = self.model.system.getZfromPT(p, t_exp[i], [y1_exp[i], y2_exp[i]])
-            zv = np.max(zvs)
+            zv = zvs[i]
             phi_vap_0 = self.model.system.getPhi_i(
                 0, [y1_exp[i], y2_exp[i]], p, t_exp[i], zv
             )
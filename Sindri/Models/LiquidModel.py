@@ -1,8 +1,11 @@
+import re
+
 import numpy as np
 
 # from fortran.UNIFAC import getgamma as _helper_getGamma2
 
 import db
+from constants import R_IG
 from numba import njit, jit
 
 
@@ -21,152 +24,316 @@ def get_all_id_and_subgroups_formulas():
     return ret_dict
 
 
+class UNIFACTables:
+    """
+    All UNIFAC tables of the database as dense arrays.
+
+    Subgroups are indexed by their position in the sorted subgroup numbers and main
+    groups by their position in the sorted main group numbers:
+
+    - R, Q: subgroup volume and surface parameters
+    - maingroup_index: main group position of each subgroup
+    - A: main group interaction parameters, A[m, n] is a_mn (zero if missing)
+    - substance_groups: {substance_id: (subgroup positions, frequencies)}
+    """
+
+    def __init__(self, cursor):
+        res = cursor.execute(
+            "select number, R, Q from unifac_subgroups order by number"
+        ).fetchall()
+        self.subgroups = np.array([r[0] for r in res], dtype=np.int64)
+        self.R = np.array([r[1] for r in res], dtype=np.float64)
+        self.Q = np.array([r[2] for r in res], dtype=np.float64)
+        subgroup_index = {g: i for i, g in enumerate(self.subgroups.tolist())}
+
+        res = cursor.execute(
+            "select number, subgroups from unifac_maingroups order by number"
+        ).fetchall()
+        self.maingroups = np.array([r[0] for r in res], dtype=np.int64)
+        maingroup_index = {g: i for i, g in enumerate(self.maingroups.tolist())}
+        self.maingroup_index = np.full(len(self.subgroups), -1, dtype=np.int64)
+        for maingroup, subgroups in res:
+            for subgroup in re.findall(r"\[(\d+)\]", subgroups):
+                i = subgroup_index.get(int(subgroup))
+                if i is not None and self.maingroup_index[i] < 0:
+                    self.maingroup_index[i] = maingroup_index[maingroup]
+
+        self.A = np.zeros((len(self.maingroups), len(self.maingroups)))
+        res = cursor.execute(
+            "select i, j, Aij, Aji from unifac_interaction_parameters"
+        ).fetchall()
+        for i, j, aij, aji in res:
+            _i, _j = maingroup_index[i], maingroup_index[j]
+            self.A[_i, _j] = aij
+            self.A[_j, _i] = aji
+
+        groups = {}
+        res = cursor.execute(
+            "select substance_id, subgroup_id, frequency from substance_unifac_subgroups"
+        ).fetchall()
+        for substance_id, subgroup, frequency in res:
+            groups.setdefault(substance_id, []).append(
+                (subgroup_index[subgroup], frequency)
+            )
+        self.substance_groups = {
+            s: (
+                np.array([g[0] for g in v], dtype=np.int64),
+                np.array([g[1] for g in v], dtype=np.int64),
+            )
+            for s, v in groups.items()
+        }
+
+
+_unifac_tables = None
+
+
+def get_unifac_tables() -> UNIFACTables:
+    """
+    Process-wide UNIFACTables, read from the database on the first call.
+
+    Call clear_unifac_cache after changing the UNIFAC tables in the database.
+    """
+    global _unifac_tables
+    if _unifac_tables is None:
+        _unifac_tables = UNIFACTables(db.cursor)
+    return _unifac_tables
+
+
+def clear_unifac_cache():
+    global _unifac_tables
+    _unifac_tables = None
+
+
 def has_unifac_in_db(subs_ids):
-    cursor = db.cursor
-    n = len(subs_ids)
-    subs_ids = np.atleast_1d(subs_ids)
-    for i in range(n):
-        query = """select distinct us.subgroup_name
-             from substance_unifac_subgroups sunifac inner join unifac_subgroups us on us.number = sunifac.subgroup_id
-             where sunifac.substance_id ={} order by us.number""".format(
-            subs_ids[0]
-        )
-        res = cursor.execute(query).fetchall()
-        if len(res) < 1:
-            return False
-    return True
+    groups = get_unifac_tables().substance_groups
+    return all(int(i) in groups for i in np.atleast_1d(subs_ids))
 
 
 class UNIFAC:
     def __init__(self, subs_ids):
 
-        cursor = db.cursor
-        query = """select distinct us.subgroup_name
-         from substance_unifac_subgroups sunifac inner join unifac_subgroups us on us.number = sunifac.subgroup_id
-         where sunifac.substance_id in ({}) order by us.number""".format(
-            ",".join("?" * len(subs_ids))
-        )
-        res = cursor.execute(query, subs_ids).fetchall()
-        groups = []
-        for g in res:
-            groups.append(g[0])
+        tables = get_unifac_tables()
+        groups = [tables.substance_groups[int(i)] for i in subs_ids]
+        idx = np.unique(np.concatenate([g[0] for g in groups]))
 
-        self.m = len(groups)
-        self.n = len(subs_ids)
+        self.m = len(idx)
+        self.n = len(groups)
         self.vk = np.zeros((self.n, self.m), dtype=np.int64)
-        for _i in range(self.n):
-            for _j in range(self.m):
-                query = """select frequency from substance_unifac_subgroups
-                 where substance_id=? and subgroup_id=(select number from unifac_subgroups where subgroup_name=?)"""
-                res = cursor.execute(query, (subs_ids[_i], groups[_j])).fetchone()
-                if res is not None:
-                    self.vk[_i][_j] = res[0]
-
-        self.amk = np.zeros((self.m, self.m), dtype=np.float64)
-        self.k = np.zeros(self.m, dtype=np.int64)
-        self.Rk = np.zeros(self.m, dtype=np.float64)
-        self.Qk = np.zeros(self.m, dtype=np.float64)
-
-        list_groups = ""
-        for i in range(self.m - 1):
-            list_groups += "'" + groups[i] + "', "
-        list_groups += "'" + groups[-1] + "'"
-
-        for i in range(self.m):
-            cursor.execute(
-                "SELECT R,Q from unifac_subgroups where subgroup_name = '{}' order by number".format(
-                    groups[i]
-                )
-            )
-            res = cursor.fetchone()
-            self.Rk[i], self.Qk[i] = res
-            query = "select number from unifac_maingroups where subgroups like '%[' || (select number from unifac_subgroups where subgroup_name = '{}')|| ']%'".format(
-                groups[i]
-            )
-            cursor.execute(query)
-            self.k[i] = cursor.fetchone()[0]
-
-        for _i in range(self.m):
-            for _j in range(self.m):
-                query = "select Aij, Aji from unifac_interaction_parameters where i = {} and j = {} order by i, j"
-                cursor.execute(query.format(self.k[_i], self.k[_j]))
-                res = cursor.fetchone()
-                if res is not None:
-                    self.amk[_i][_j] = res[0]
-                    self.amk[_j][_i] = res[1]
-        # cursor.close()
+        for i, (g, frequency) in enumerate(groups):
+            self.vk[i, np.searchsorted(idx, g)] = frequency
+
+        main = tables.maingroup_index[idx]
+        self.k = tables.maingroups[main]
+        self.Rk = tables.R[idx]
+        self.Qk = tables.Q[idx]
+        self.amk = tables.A[np.ix_(main, main)]
+
+        self.r = self.vk @ self.Rk
+        self.q = self.vk @ self.Qk
+        self.e = np.ascontiguousarray((self.vk * self.Qk).T / self.q)
+
+        # tau and beta of the last temperature
+        self._T = None
+        self._tau = None
+        self._beta = None
+
+    def getTauBeta(self, T: float):
+        """
+        Group interaction parameters tau_mk and beta_ik at temperature T, cached for
+        the last temperature.
+        """
+        if T != self._T:
+            self._tau, self._beta = _helper_getTauBeta(T, self.amk, self.e)
+            self._T = T
+        return self._tau, self._beta
 
     def getGamma(self, x, T: float):
-        # return _helper_getGamma2(
-        #     x, T,self.amk, self.vk, self.Rk, self.Qk
-        # )
-        # x = np.atleast_1d(x)
-        return _helper_getGamma(
-            x, T, self.n, self.m, self.amk, self.vk, self.Rk, self.Qk
+        tau, beta = self.getTauBeta(T)
+        return _helper_getGamma(x, self.r, self.q, self.e, tau, beta)
+
+    def getLnGammaDerivatives(self, x, T: float):
+        """
+        ln(gamma_i) and its derivatives, evaluated in a single pass.
+
+        The derivatives with respect to x_j hold the other mole fractions constant (x
+        is not normalized), so they can be combined with any constraint on x.
+
+        Returns
+        -------
+        lngamma: ndarray, shape (n,)
+        dlngamma_dx: ndarray, shape (n, n), dlngamma_dx[i, j] = d ln(gamma_i) / d x_j
+        dlngamma_dT: ndarray, shape (n,)
+        """
+        tau, beta = self.getTauBeta(T)
+        return _helper_getLnGammaDerivatives(
+            x, T, self.r, self.q, self.e, self.amk, tau, beta
         )
 
+    def getExcessEnthalpy(self, x, T: float) -> float:
+        """
+        Excess enthalpy of the liquid, H^E = -R T^2 sum_i x_i d ln(gamma_i) / dT, in
+        J/mol.
+        """
+        dlngamma_dT = self.getLnGammaDerivatives(x, T)[2]
+        return -R_IG * T * T * np.sum(x * dlngamma_dT)
+
+    def getGammaBatch(self, X, T):
+        """
+        Activity coefficients for each row of X (compositions) at the temperatures T,
+        a scalar or one temperature for each row.
+        """
+        X = np.ascontiguousarray(np.atleast_2d(X), dtype=np.float64)
+        T = np.atleast_1d(np.asarray(T, dtype=np.float64))
+        if T.shape[0] != X.shape[0]:
+            if T.shape[0] != 1:
+                raise ValueError(
+                    "T has {} values, expected 1 or {}".format(T.shape[0], X.shape[0])
+                )
+            T = np.full(X.shape[0], T[0])
+        return _helper_getGammaBatch(X, T, self.r, self.q, self.e, self.amk)
+
+
+@njit(
+    "UniTuple(float64[:,:], 2)(float64, float64[:,:], float64[:,:])", cache=True,
+)
+def _helper_getTauBeta(T: float, amk, e):
+    m, n = e.shape
+    tau = np.exp(-amk / T)
+    beta = np.zeros((n, m), dtype=np.float64)
+    for _i in range(n):
+        for _k in range(m):
+            for _m in range(m):
+                beta[_i, _k] += e[_m, _i] * tau[_m, _k]
+    return tau, beta
 
 
 @njit(
-    "float64[:](float64[:], float64, int64, int64, float64[:,:], int64[:,:], float64[:], float64[:])",
+    "float64[:](float64[:], float64[:], float64[:], float64[:,:], float64[:,:], float64[:,:])",
     cache=True,
 )
-def _helper_getGamma(x, T: float, n, m, amk, vk, Rk, Qk):
+def _helper_getGamma(x, r, q, e, tau, beta):
+    n = len(r)
+    m = len(tau)
 
-    r = np.zeros(n, dtype=np.float64)
-    q = np.zeros(n, dtype=np.float64)
-    e = np.zeros((m, n), dtype=np.float64)
-    beta = np.zeros((n, m), dtype=np.float64)
     theta = np.zeros(m, dtype=np.float64)
     s = np.zeros(m, dtype=np.float64)
-    L = np.zeros(n, dtype=np.float64)
-    J = np.zeros(n, dtype=np.float64)
-    ln_gamma_C = np.zeros(n, dtype=np.float64)
-    ln_gamma_R = np.zeros(n, dtype=np.float64)
+    ln_gamma = np.zeros(n, dtype=np.float64)
 
-    tau = np.exp(-amk / T)
-
-    for i in range(n):
-        r[i] = np.sum(vk[i] * Rk)
-        q[i] = np.sum(vk[i] * Qk)
+    sum_xq = 0.0
+    sum_xr = 0.0
+    for _i in range(n):
+        sum_xq += x[_i] * q[_i]
+        sum_xr += x[_i] * r[_i]
 
-    # r, q
     for _k in range(m):
+        sup_s = 0.0
         for _i in range(n):
-            e[_k][_i] = vk[_i][_k] * Qk[_k] / q[_i]
+            sup_s += x[_i] * q[_i] * e[_k, _i]
+        theta[_k] = sup_s / sum_xq
+
+    for _k in range(m):
+        for _m in range(m):
+            s[_k] += theta[_m] * tau[_m, _k]
 
-    # beta
     for _i in range(n):
+        J = r[_i] / sum_xr
+        L = q[_i] / sum_xq
+        ln_gamma_C = 1.0 - J + np.log(J) - 5.0 * q[_i] * (1.0 - J / L + np.log(J / L))
+
+        _s = 0.0
         for _k in range(m):
-            for _m in range(m):
-                beta[_i][_k] += e[_m][_i] * tau[_m][_k]
+            _s += theta[_k] * beta[_i, _k] / s[_k] - e[_k, _i] * np.log(
+                beta[_i, _k] / s[_k]
+            )
+        ln_gamma[_i] = ln_gamma_C + q[_i] * (1.0 - _s)
+
+    return np.exp(ln_gamma)
+
+
+@njit(
+    "Tuple((float64[:], float64[:,:], float64[:]))(float64[:], float64, float64[:], float64[:], float64[:,:], float64[:,:], float64[:,:], float64[:,:])",
+    cache=True,
+)
+def _helper_getLnGammaDerivatives(x, T: float, r, q, e, amk, tau, beta):
+    n = len(r)
+    m = len(tau)
+
+    theta = np.zeros(m, dtype=np.float64)
+    s = np.zeros(m, dtype=np.float64)
+    dtau = tau * amk / (T * T)
+    dbeta = np.zeros((n, m), dtype=np.float64)
+    ds = np.zeros(m, dtype=np.float64)
+    lngamma = np.zeros(n, dtype=np.float64)
+    dlngamma_dx = np.zeros((n, n), dtype=np.float64)
+    dlngamma_dT = np.zeros(n, dtype=np.float64)
+
+    sum_xq = 0.0
+    sum_xr = 0.0
+    for _i in range(n):
+        sum_xq += x[_i] * q[_i]
+        sum_xr += x[_i] * r[_i]
 
     for _k in range(m):
         sup_s = 0.0
         for _i in range(n):
-            sup_s += x[_i] * q[_i] * e[_k][_i]
-        theta[_k] = sup_s / np.sum(x * q)
+            sup_s += x[_i] * q[_i] * e[_k, _i]
+        theta[_k] = sup_s / sum_xq
 
     for _k in range(m):
         for _m in range(m):
-            s[_k] += theta[_m] * tau[_m][_k]
+            s[_k] += theta[_m] * tau[_m, _k]
+            ds[_k] += theta[_m] * dtau[_m, _k]
+        for _i in range(n):
+            for _m in range(m):
+                dbeta[_i, _k] += e[_m, _i] * dtau[_m, _k]
 
     for _i in range(n):
-        J[_i] = r[_i] / np.sum(r * x)
-        L[_i] = q[_i] / np.sum(q * x)
-        ln_gamma_C[_i] = (
-            1.0
-            - J[_i]
-            + np.log(J[_i])
-            - 5.0 * q[_i] * (1.0 - J[_i] / L[_i] + np.log(J[_i] / L[_i]))
-        )
+        J = r[_i] / sum_xr
+        L = q[_i] / sum_xq
+        ln_gamma_C = 1.0 - J + np.log(J) - 5.0 * q[_i] * (1.0 - J / L + np.log(J / L))
 
         _s = 0.0
+        _ds = 0.0
         for _k in range(m):
-            _s += theta[_k] * beta[_i][_k] / s[_k] - e[_k][_i] * np.log(
-                beta[_i][_k] / s[_k]
+            _s += theta[_k] * beta[_i, _k] / s[_k] - e[_k, _i] * np.log(
+                beta[_i, _k] / s[_k]
             )
-        ln_gamma_R[_i] = q[_i] * (1.0 - _s)
+            _ds += theta[_k] * (
+                dbeta[_i, _k] / s[_k] - beta[_i, _k] * ds[_k] / (s[_k] * s[_k])
+            ) - e[_k, _i] * (dbeta[_i, _k] / beta[_i, _k] - ds[_k] / s[_k])
+        lngamma[_i] = ln_gamma_C + q[_i] * (1.0 - _s)
+        dlngamma_dT[_i] = -q[_i] * _ds
+
+        for _j in range(n):
+            # d theta_k / d x_j = q_j (e_kj - theta_k) / sum_xq
+            # d s_k / d x_j = q_j (beta_jk - s_k) / sum_xq
+            dr = r[_j] / sum_xr
+            dq = q[_j] / sum_xq
+            dC = (J - 1.0) * dr - 5.0 * q[_i] * (1.0 - J / L) * (dq - dr)
+            _s = 0.0
+            for _k in range(m):
+                dtheta = dq * (e[_k, _j] - theta[_k])
+                dsk = dq * (beta[_j, _k] - s[_k])
+                _s += (
+                    dtheta * beta[_i, _k] / s[_k]
+                    - theta[_k] * beta[_i, _k] * dsk / (s[_k] * s[_k])
+                    + e[_k, _i] * dsk / s[_k]
+                )
+            dlngamma_dx[_i, _j] = dC - q[_i] * _s
+
+    return lngamma, dlngamma_dx, dlngamma_dT
 
-    gamma = np.exp(ln_gamma_C + ln_gamma_R)
+
+@njit(
+    "float64[:,:](float64[:,:], float64[:], float64[:], float64[:], float64[:,:], float64[:,:])",
+    cache=True,
+)
+def _helper_getGammaBatch(X, T, r, q, e, amk):
+    npoints = X.shape[0]
+    gamma = np.empty_like(X)
+    tau, beta = _helper_getTauBeta(T[0], amk, e)
+    for p in range(npoints):
+        if p > 0 and T[p] != T[p - 1]:
+            tau, beta = _helper_getTauBeta(T[p], amk, e)
+        gamma[p] = _helper_getGamma(X[p], r, q, e, tau, beta)
     return gamma
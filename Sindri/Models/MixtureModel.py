@@ -27,7 +27,12 @@ class MixtureModel:
         self.P_vle: float = 1e5
         self.y_vle: List[float] = []
         self.vle_method = "phi-phi"
+        self.vle_solver = "successive substitution"
+        # acceleration of the substitution loops of the system, by solver
+        self.acceleration = {}
         self.binaryDiagram_type = "isothermal"  # or isobaric
+        # size of the pure-component parameter cache of the system, 0 to disable it
+        self.parameter_cache_size: int = 0
 
         self.substances_in_the_system: List[SubstanceProp] = []
         self.EOSObservers = []
@@ -44,6 +49,14 @@ class MixtureModel:
         self.vle_method = method
         self.system.setVLEmethod(method)
 
+    def setVLESolver(self, solver: str):
+        self.vle_solver = solver
+        self.system.setVLESolver(solver)
+
+    def setAcceleration(self, method: str, solvers=None):
+        self.system.setAcceleration(method, solvers)
+        self.acceleration = dict(self.system.acceleration)
+
     def setProc(self, p: float, t: float):
         self.P = p
         self.T = t
@@ -91,12 +104,34 @@ class MixtureModel:
         self.y = y
 
     def setBinaryInteractionsParameters(self, k: List[List[float]]):
-        self.k = k
-        self.setupSystem()
+        self.k = np.array(k, dtype=np.float64)
+        if self.system is None:
+            self.setupSystem()
+        else:
+            self.system.set_k(self.k)
+
+    def setParameterCacheSize(self, maxsize: int):
+        """
+        Enables the pure-component parameter cache of the system, holding at most
+        maxsize vectors, or disables it if maxsize is 0. The setting is kept when the
+        system is recreated, which starts with an empty cache.
+        """
+        self.parameter_cache_size = maxsize
+        if self.system is not None:
+            self._setupParameterCache()
 
     def setupSystem(self):
         self.system = createEOSMix(self.substances_in_the_system, self.eosname, self.k)
         self.setVLEmethod(self.vle_method)
+        self.setVLESolver(self.vle_solver)
+        self.system.acceleration.update(self.acceleration)
+        self._setupParameterCache()
+
+    def _setupParameterCache(self):
+        if self.parameter_cache_size > 0:
+            self.system.enableParameterCache(self.parameter_cache_size)
+        else:
+            self.system.disableParameterCache()
 
     def setVLEPT(self, p: float, t: float):
         self.P_vle, self.T_vle = p, t
@@ -157,6 +192,9 @@ class MixtureModel:
     def getVLEMolarFractions(self) -> List[float]:
         return self.y_vle
 
+    def getParameterCacheInfo(self) -> dict:
+        return self.system.getParameterCacheInfo()
+
     def getBinaryDiagramType(self) -> str:
         return self.binaryDiagram_type
 
@@ -0,0 +1,162 @@
+"""
+Compilation of the numba kernels of the calculation core into the numba cache.
+
+The kernels are compiled for their declared signatures when their modules are
+imported, and with cache=True the machine code is saved next to the sources (or in
+NUMBA_CACHE_DIR). Warming up imports every module that has kernels, so the cache
+can be built once, e.g. when building an image, and shipped with it:
+
+    python NumbaWarmup.py --cache-dir /opt/sindri/numba_cache
+
+The workers then need the same NUMBA_CACHE_DIR, the same source files (the cache
+is keyed by their path and modification time) and a compatible CPU. --check reports
+each kernel in a fresh interpreter and fails if any of them had to be compiled.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from importlib import import_module
+
+from numba.core.dispatcher import Dispatcher
+
+# modules with numba kernels, besides the equations of state
+kernel_modules = [
+    "polyEqSolver",
+    "compounds",
+    "RachfordRice",
+    "EOSMixture",
+    "Models.LiquidModel",
+    "MixtureRules.ClassicMixtureRule",
+    "EOSParametersBehavior.alphaFunctions",
+]
+
+
+def getKernels() -> dict:
+    """
+    Imports kernel_modules and all the equations of state of EOSMixFactory.
+
+    Returns
+    -------
+    kernels : dict
+        numba dispatchers by "module.function".
+    """
+    from Factories.EOSMixFactory import getEOSMixClass, getEOSMixOptions
+
+    modules = [import_module(name) for name in kernel_modules]
+    modules += [
+        sys.modules[getEOSMixClass(name).__module__] for name in getEOSMixOptions()
+    ]
+    kernels = {}
+    for module in modules:
+        for attr, value in vars(module).items():
+            # skip the kernels imported from other modules
+            if isinstance(value, Dispatcher) and value.__module__ == module.__name__:
+                kernels["{}.{}".format(module.__name__, attr)] = value
+    return kernels
+
+
+def getKernelStatus(kernel: Dispatcher) -> str:
+    """
+    "warm" if all the signatures of kernel were loaded from the cache, "cold" if any
+    was compiled by this process and "lazy" if it has no declared signature, so it's
+    only compiled when called.
+    """
+    if not kernel.signatures:
+        return "lazy"
+    if sum(kernel._cache_misses.values()) or len(kernel._cache_hits) < len(
+        kernel.signatures
+    ):
+        return "cold"
+    return "warm"
+
+
+def kernelReport() -> dict:
+    """
+    Status of each kernel in this process (see getKernelStatus), by name.
+    """
+    return {name: getKernelStatus(k) for name, k in sorted(getKernels().items())}
+
+
+def _runFresh(cache_dir: str = None) -> dict:
+    # the report and the import time of a new interpreter
+    here = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (here, os.path.dirname(here), env.get("PYTHONPATH")) if p
+    )
+    if cache_dir is not None:
+        env["NUMBA_CACHE_DIR"] = os.path.abspath(cache_dir)
+    code = (
+        "import json, time\n"
+        "t = time.perf_counter()\n"
+        "from NumbaWarmup import kernelReport\n"
+        "report = kernelReport()\n"
+        "t = time.perf_counter() - t\n"
+        "print(json.dumps({'time': t, 'kernels': report}))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        cwd=here,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(out.splitlines()[-1])
+
+
+def warmup(cache_dir: str = None) -> (dict, dict):
+    """
+    Compiles the kernels into the cache (cache_dir, or the numba default) in a new
+    interpreter, then loads them in another one.
+
+    Returns
+    -------
+    cold, warm : dict
+        "time", the seconds to import and compile or load the kernels, and
+        "kernels", the status of each one, of both runs.
+    """
+    cold = _runFresh(cache_dir)
+    warm = _runFresh(cache_dir)
+    return cold, warm
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compiles the numba kernels into the numba cache."
+    )
+    parser.add_argument("--cache-dir", help="NUMBA_CACHE_DIR to write or check")
+    parser.add_argument(
+        "--check", action="store_true", help="only report, fail on cold kernels"
+    )
+    parser.add_argument("--verbose", action="store_true", help="list every kernel")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        runs = [("check", _runFresh(args.cache_dir))]
+    else:
+        cold, warm = warmup(args.cache_dir)
+        runs = [("first run", cold), ("second run", warm)]
+
+    for label, run in runs:
+        counts = {}
+        for status in run["kernels"].values():
+            counts[status] = counts.get(status, 0) + 1
+        print(
+            "{}: {:.2f} s, {}".format(
+                label,
+                run["time"],
+                ", ".join("{} {}".format(v, k) for k, v in sorted(counts.items())),
+            )
+        )
+    last = runs[-1][1]["kernels"]
+    for name, status in last.items():
+        if args.verbose or status != "warm":
+            print("    {:<60s} {}".format(name, status))
+    return 1 if any(status == "cold" for status in last.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
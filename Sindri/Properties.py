@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import numpy as np
+
 from constants import DBL_EPSILON
 
 
@@ -39,6 +41,18 @@ class DeltaProp(object):
         return abs((x - y) / x)
 
 
+class DerivativeProps(object):
+    """
+    Properties of a phase that depend on second derivatives of the equation of state.
+    """
+
+    def __init__(self, cp: float, cv: float, w: float, mujt: float):
+        self.Cp = cp  # J/(mol K)
+        self.Cv = cv  # J/(mol K)
+        self.SoundSpeed = w  # m/s
+        self.JouleThomson = mujt  # K/Pa
+
+
 class VaporPressure(object):
     """
     Class containing information about the vapor pressure of a single substance system.
@@ -79,6 +93,29 @@ class VaporPressure(object):
         return (_x - _y) / _x
 
 
+class PhaseEnvelope(object):
+    """
+    Saturation boundary of a mixture of fixed composition, as traced by
+    EOSMixture.getPhaseEnvelope. The points go from the dew branch at low pressure,
+    through the critical point, down the bubble branch.
+    """
+
+    def __init__(self, T, P, K, bubble, critical):
+        self.T = T  # K
+        self.P = P  # Pa
+        self.K = K  # K factors y / x, one row per point
+        self.bubble = bubble  # True on the bubble branch, False on the dew branch
+        self.critical = critical  # (T, P) estimate, None if it wasn't crossed
+
+    def getCricondenbar(self) -> (float, float):
+        i = int(np.argmax(self.P))
+        return self.T[i], self.P[i]
+
+    def getCricondentherm(self) -> (float, float):
+        i = int(np.argmax(self.T))
+        return self.T[i], self.P[i]
+
+
 class Props(object):
     def __init__(self):
         self.P = 0
@@ -90,6 +127,7 @@ class Props(object):
         self.Fugacity = 0
         self.Props = 0
         self.IGProps = 0
+        self.DerivativeProps = 0
         self.log = ""
 
     def setRho(self, v: float):
@@ -0,0 +1,477 @@
+"""
+Precomputed property tables of a mixture with fixed composition.
+
+The properties are evaluated once on a (P, T) grid with the equation of state and
+answered afterwards by bicubic spline interpolation, which is orders of magnitude
+cheaper than EOSMixture.getAllProps.
+"""
+
+import bisect
+
+import numpy as np
+from scipy.interpolate import RectBivariateSpline
+
+from EOSMixture import EOSMixture
+from compounds import MixtureProp
+from constants import R_IG
+
+PROPERTIES = ("Z", "V", "rho", "H", "S", "G", "U", "A", "Fugacity")
+PHASES = ("liquid", "vapor")
+_INTERPOLATED = ("Z", "H", "S", "G", "U", "A")
+TWO_PHASE = "two-phase"
+
+
+def _getMolarMass(eos: EOSMixture, y) -> float:
+    """
+    Molar mass of the mixture in kg/mol, nan when a substance doesn't have one.
+    """
+    molwt = MixtureProp(eos.substances, y).getMolWt()
+    return molwt * 1e-3 if molwt else np.nan
+
+
+def _evaluateStates(eos: EOSMixture, y, P, T, Tref: float, Pref: float):
+    """
+    Evaluates the liquid and vapor root properties at the states (P[i], T[i]).
+
+    Returns
+    -------
+    ret : dict
+        ret[phase][prop] is an array with the same length as P. The caloric properties
+        are nan when the substances don't have ideal gas Cp parameters.
+    """
+    zliq, zvap = eos.getZfromPT_batch(P, T, y)
+    molar_mass = _getMolarMass(eos, y)
+    hasCp = MixtureProp(eos.substances, y).hasCp()
+
+    ret = {}
+    for phase, Z in zip(PHASES, (zliq, zvap)):
+        V = Z * R_IG * T / P
+        ret[phase] = {
+            "Z": Z,
+            "V": V,
+            "rho": molar_mass / V,
+            "Fugacity": np.array(
+                [eos.getFugacity(y, P[i], T[i], V[i], Z[i]) for i in range(len(P))]
+            ),
+        }
+        for prop in ("H", "S", "G", "U", "A"):
+            ret[phase][prop] = np.full(len(P), np.nan)
+
+    if hasCp:
+        for i in range(len(P)):
+            pliq, pvap = eos.getCpHSGUA(y, Tref, T[i], Pref, P[i])
+            for phase, props in zip(PHASES, (pliq, pvap)):
+                for prop in ("H", "S", "G", "U", "A"):
+                    ret[phase][prop][i] = getattr(props, prop)
+
+    return ret
+
+
+def _saturationPressure(eos: EOSMixture, z, T: float, bubble: bool):
+    """
+    Bubble or dew point pressure of the composition z, or nan when the solver doesn't
+    converge or falls in the trivial solution (no phase boundary at this temperature).
+    """
+    solver = eos.getBubblePointPressure if bubble else eos.getDewPointPressure
+    try:
+        w, p, phivap, philiq, k, ite = solver(z, T)
+    except (ValueError, ZeroDivisionError, FloatingPointError):
+        return np.nan
+    if not np.isfinite(p) or p <= 0.0:
+        return np.nan
+    if len(z) > 1 and np.max(np.abs(w - z)) < 1e-4:
+        return np.nan
+    x, y = (z, w) if bubble else (w, z)
+    zliq = eos.getZLiqVap(p, T, x)[0]
+    zvap = eos.getZLiqVap(p, T, y)[1]
+    if not abs(zvap - zliq) > 1e-6:
+        return np.nan
+    return p
+
+
+def _interpolateBoundary(values, j: int, w: float) -> float:
+    """
+    Linear interpolation of a phase boundary between the grid temperatures j and j + 1.
+    When it's known at only one of them, that value is used.
+    """
+    a, b = values[j], values[j + 1]
+    if a == a and b == b:
+        return a + w * (b - a)
+    if a == a:
+        return a
+    return b
+
+
+def _padPhaseRoots(values, P, Pbubble, Pdew, single, liquid: bool):
+    """
+    Replaces, in place, the nodes of a phase root table where the cubic has a single
+    root belonging to the other phase by linear extrapolation along P. The root jumps
+    between branches there, and the jump would otherwise spoil the spline over the
+    neighbouring cells, up to the phase boundary.
+
+    values is the (len(P), len(T)) table and single flags the nodes with one root.
+    """
+    for j in range(values.shape[1]):
+        if liquid:
+            pad = single[:, j] & (P < Pbubble[j])
+            if not np.any(pad):
+                continue
+            i0 = np.nonzero(pad)[0][-1] + 1
+            if i0 + 1 >= len(P):
+                continue
+            slope = (values[i0 + 1, j] - values[i0, j]) / (P[i0 + 1] - P[i0])
+            values[:i0, j] = values[i0, j] + slope * (P[:i0] - P[i0])
+        else:
+            pad = single[:, j] & (P > Pdew[j])
+            if not np.any(pad):
+                continue
+            i1 = np.nonzero(pad)[0][0]
+            if i1 < 2:
+                continue
+            slope = (values[i1 - 1, j] - values[i1 - 2, j]) / (P[i1 - 1] - P[i1 - 2])
+            values[i1:, j] = values[i1 - 1, j] + slope * (P[i1:] - P[i1 - 1])
+
+
+class PropertyTable:
+    """
+    Thermodynamic properties of a mixture of fixed composition on a (P, T) grid.
+
+    Tables are created with PropertyTable.generate, and can be saved to and loaded from
+    a npz file. Each phase root has its own table, and the phase boundaries from the
+    bubble and dew point solvers are used to choose the stable phase in a lookup.
+
+    Parameters
+    ----------
+    P : ndarray
+        Increasing grid pressures, in Pa.
+    T : ndarray
+        Increasing grid temperatures, in K.
+    y : ndarray
+        Molar fractions of the mixture.
+    data : dict
+        data[phase][prop] is a (len(P), len(T)) matrix of the property of that phase
+        root, for phase in PHASES and prop in PROPERTIES.
+    Pbubble, Pdew : ndarray
+        Bubble and dew pressures at each grid temperature, in Pa. nan where there's no
+        phase boundary.
+    Tref, Pref : float
+        Reference state of the caloric properties.
+    eosname : str
+        Name of the equation of state used to create the table.
+    errors : dict
+        errors[phase][prop] is the largest absolute interpolation error found by
+        estimateErrors, if the table was checked.
+    molar_mass : float
+        Molar mass of the mixture, in kg/mol, used to derive rho from V. nan when
+        unknown.
+    """
+
+    def __init__(
+        self,
+        P,
+        T,
+        y,
+        data,
+        Pbubble,
+        Pdew,
+        Tref: float,
+        Pref: float,
+        eosname: str = "",
+        errors=None,
+        molar_mass: float = np.nan,
+    ):
+        self.P = np.asarray(P, dtype=np.float64)
+        self.T = np.asarray(T, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        self.data = data
+        self.Pbubble = np.asarray(Pbubble, dtype=np.float64)
+        self.Pdew = np.asarray(Pdew, dtype=np.float64)
+        self.Tref = Tref
+        self.Pref = Pref
+        self.eosname = eosname
+        self.errors = errors if errors is not None else {}
+        self.molarMass = float(molar_mass)
+
+        if len(self.P) < 4 or len(self.T) < 4:
+            raise ValueError("The grid needs at least 4 points in P and in T")
+
+        self._Tlist = self.T.tolist()
+
+        # V, rho and the fugacity vary as 1/P or P, so Z and the fugacity
+        # coefficient are interpolated instead and the others are derived from them
+        PP = self.P[:, np.newaxis]
+        self._splines = {}
+        for phase in PHASES:
+            tables = {prop: self.data[phase][prop] for prop in _INTERPOLATED}
+            tables["phi"] = self.data[phase]["Fugacity"] / PP
+            for prop, values in tables.items():
+                if np.all(np.isfinite(values)):
+                    self._splines[(phase, prop)] = RectBivariateSpline(
+                        self.P, self.T, values
+                    )
+
+    @classmethod
+    def generate(
+        cls,
+        eos: EOSMixture,
+        y,
+        P,
+        T,
+        Tref: float = 300.0,
+        Pref: float = 1e5,
+        estimate_errors: bool = True,
+    ):
+        """
+        Evaluates the equation of state on the grid P x T.
+
+        Parameters
+        ----------
+        eos : EOSMixture
+            The mixture model.
+        y : array_like
+            Molar fractions of the mixture.
+        P : array_like
+            Increasing grid pressures, in Pa. At least 4 points.
+        T : array_like
+            Increasing grid temperatures, in K. At least 4 points.
+        Tref, Pref : float
+            Reference state of the caloric properties, in K and Pa.
+        estimate_errors : bool
+            If True, checks the interpolation against the equation of state at the
+            center of every grid cell (see estimateErrors).
+
+        Returns
+        -------
+        table : PropertyTable
+        """
+        y = np.atleast_1d(np.asarray(y, dtype=np.float64))
+        P = np.asarray(P, dtype=np.float64)
+        T = np.asarray(T, dtype=np.float64)
+        if np.any(np.diff(P) <= 0) or np.any(np.diff(T) <= 0):
+            raise ValueError("Grid pressures and temperatures must be increasing")
+
+        PP, TT = np.meshgrid(P, T, indexing="ij")
+        states = _evaluateStates(eos, y, PP.ravel(), TT.ravel(), Tref, Pref)
+        data = {
+            phase: {prop: states[phase][prop].reshape(PP.shape) for prop in PROPERTIES}
+            for phase in PHASES
+        }
+        for phase in PHASES:
+            if not np.all(np.isfinite(data[phase]["Z"])):
+                raise ValueError(
+                    "The equation of state has no root in part of the grid, "
+                    "restrict the pressure and temperature ranges"
+                )
+
+        Pbubble = np.array([_saturationPressure(eos, y, t, True) for t in T])
+        Pdew = np.array([_saturationPressure(eos, y, t, False) for t in T])
+
+        single = data["liquid"]["Z"] == data["vapor"]["Z"]
+        for phase in PHASES:
+            for prop in PROPERTIES:
+                _padPhaseRoots(
+                    data[phase][prop], P, Pbubble, Pdew, single, phase == "liquid"
+                )
+
+        table = cls(
+            P,
+            T,
+            y,
+            data,
+            Pbubble,
+            Pdew,
+            Tref,
+            Pref,
+            eos.eosname,
+            molar_mass=_getMolarMass(eos, y),
+        )
+        if estimate_errors:
+            table.estimateErrors(eos)
+        return table
+
+    def getPhase(self, P: float, T: float) -> str:
+        """
+        Stable phase at (P, T): "liquid", "vapor" or "two-phase".
+
+        Between grid temperatures the phase boundaries are interpolated linearly, and
+        near the mixture critical point, where only one of them is known, the other
+        phase is assumed on its far side. Where the solvers found no boundary at all,
+        the root with the lowest fugacity is taken.
+        """
+        self._checkBounds(P, T)
+        j = min(max(bisect.bisect_right(self._Tlist, T) - 1, 0), len(self.T) - 2)
+        w = (T - self.T[j]) / (self.T[j + 1] - self.T[j])
+        pb = _interpolateBoundary(self.Pbubble, j, w)
+        pd = _interpolateBoundary(self.Pdew, j, w)
+
+        if pb == pb and P >= pb:
+            return "liquid"
+        if pd == pd and P <= pd:
+            return "vapor"
+        if pb == pb and pd == pd:
+            return TWO_PHASE
+        if pb == pb:
+            return "vapor"
+        if pd == pd:
+            return "liquid"
+
+        phil = self._splines[("liquid", "phi")].ev(P, T)
+        phiv = self._splines[("vapor", "phi")].ev(P, T)
+        return "liquid" if phil < phiv else "vapor"
+
+    def lookup(self, prop: str, P: float, T: float, phase: str = None) -> float:
+        """
+        Interpolated property at (P, T).
+
+        Parameters
+        ----------
+        prop : str
+            One of PROPERTIES.
+        P, T : float
+            Pressure in Pa and temperature in K, inside the grid.
+        phase : str
+            "liquid" or "vapor" to read a given root. By default, the stable phase is
+            used, and a ValueError is raised inside the two-phase region. The
+            metastable roots read there are partly extrapolated, and less accurate.
+
+        Returns
+        -------
+        value : float
+            nan when the property isn't available (e.g. caloric properties without Cp).
+        """
+        if phase is None:
+            phase = self.getPhase(P, T)
+            if phase == TWO_PHASE:
+                raise ValueError(
+                    "({} Pa, {} K) is inside the two-phase region, choose a "
+                    "phase".format(P, T)
+                )
+        else:
+            self._checkPhase(phase)
+            self._checkBounds(P, T)
+
+        if prop not in PROPERTIES:
+            raise ValueError("Unknown property: {}".format(prop))
+        return float(self._interpolate(phase, prop, P, T))
+
+    def lookupAll(self, P: float, T: float, phase: str = None) -> dict:
+        """
+        All interpolated properties at (P, T), as a dict. See lookup.
+        """
+        if phase is None:
+            phase = self.getPhase(P, T)
+            if phase == TWO_PHASE:
+                raise ValueError(
+                    "({} Pa, {} K) is inside the two-phase region, choose a "
+                    "phase".format(P, T)
+                )
+        return {prop: self.lookup(prop, P, T, phase) for prop in PROPERTIES}
+
+    def estimateErrors(self, eos: EOSMixture) -> dict:
+        """
+        Compares the interpolation with the equation of state at the center of every
+        grid cell, and stores the largest absolute error of each property of each phase
+        in self.errors, in the units of the property. Only the cells where the phase is
+        stable are considered. The errors grow near the mixture critical point, where
+        the grid should be refined.
+
+        Returns
+        -------
+        errors : dict
+            errors[phase][prop], nan where there was nothing to compare.
+        """
+        Pc = 0.5 * (self.P[1:] + self.P[:-1])
+        Tc = 0.5 * (self.T[1:] + self.T[:-1])
+        PP, TT = np.meshgrid(Pc, Tc, indexing="ij")
+        P, T = PP.ravel(), TT.ravel()
+        exact = _evaluateStates(eos, self.y, P, T, self.Tref, self.Pref)
+        phases = np.array([self.getPhase(p, t) for p, t in zip(P, T)])
+
+        self.errors = {}
+        for phase in PHASES:
+            self.errors[phase] = {}
+            mask = phases == phase
+            for prop in PROPERTIES:
+                if not np.any(mask):
+                    self.errors[phase][prop] = np.nan
+                    continue
+                ref = exact[phase][prop][mask]
+                approx = self._interpolate(phase, prop, P[mask], T[mask])
+                self.errors[phase][prop] = float(np.max(np.abs(approx - ref)))
+        return self.errors
+
+    def save(self, filename: str):
+        """
+        Saves the table to a compressed npz file.
+        """
+        arrays = {
+            "P": self.P,
+            "T": self.T,
+            "y": self.y,
+            "Pbubble": self.Pbubble,
+            "Pdew": self.Pdew,
+            "Tref": np.float64(self.Tref),
+            "Pref": np.float64(self.Pref),
+            "eosname": np.array(self.eosname),
+            "molar_mass": np.float64(self.molarMass),
+        }
+        for phase in PHASES:
+            for prop in PROPERTIES:
+                arrays["{}_{}".format(phase, prop)] = self.data[phase][prop]
+                arrays["error_{}_{}".format(phase, prop)] = np.float64(
+                    self.errors.get(phase, {}).get(prop, np.nan)
+                )
+        np.savez_compressed(filename, **arrays)
+
+    @classmethod
+    def load(cls, filename: str):
+        """
+        Loads a table saved with save. The equation of state isn't needed.
+        """
+        with np.load(filename) as f:
+            data = {
+                phase: {prop: f["{}_{}".format(phase, prop)] for prop in PROPERTIES}
+                for phase in PHASES
+            }
+            errors = {
+                phase: {
+                    prop: float(f["error_{}_{}".format(phase, prop)])
+                    for prop in PROPERTIES
+                }
+                for phase in PHASES
+            }
+            return cls(
+                f["P"],
+                f["T"],
+                f["y"],
+                data,
+                f["Pbubble"],
+                f["Pdew"],
+                float(f["Tref"]),
+                float(f["Pref"]),
+                str(f["eosname"]),
+                errors,
+                float(f["molar_mass"]),
+            )
+
+    def _interpolate(self, phase: str, prop: str, P, T):
+        if prop in ("V", "rho"):
+            V = self._splines[(phase, "Z")].ev(P, T) * R_IG * T / P
+            return V if prop == "V" else self.molarMass / V
+        if prop == "Fugacity":
+            return self._splines[(phase, "phi")].ev(P, T) * P
+        spline = self._splines.get((phase, prop))
+        if spline is None:
+            return np.full(np.shape(P), np.nan)[()]
+        return spline.ev(P, T)
+
+    def _checkBounds(self, P: float, T: float):
+        if not (self.P[0] <= P <= self.P[-1] and self.T[0] <= T <= self.T[-1]):
+            raise ValueError(
+                "({} Pa, {} K) is outside the table, which covers {}-{} Pa and "
+                "{}-{} K".format(P, T, self.P[0], self.P[-1], self.T[0], self.T[-1])
+            )
+
+    def _checkPhase(self, phase: str):
+        if phase not in PHASES:
+            raise ValueError("phase must be one of {}".format(PHASES))
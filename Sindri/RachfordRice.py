@@ -0,0 +1,88 @@
+import numpy as np
+from numba import njit, float64, int64
+from numba.types import UniTuple
+
+
+@njit(UniTuple(float64, 2)(float64[:]), cache=True)
+def rachford_rice_window(k):
+    """
+    Vapor fractions between which all the phase mole fractions are positive.
+
+    The bounds are the asymptotes 1 / (1 - Kmax) < 0 and 1 / (1 - Kmin) > 1 of the
+    Rachford-Rice function, so a negative flash solution (v < 0 or v > 1) is inside
+    the window. A bound is -inf or inf if no K factor is above or below 1.
+    """
+    kmin = np.inf
+    kmax = -np.inf
+    for i in range(k.shape[0]):
+        kmin = min(kmin, k[i])
+        kmax = max(kmax, k[i])
+    vmin = 1.0 / (1.0 - kmax) if kmax > 1.0 else -np.inf
+    vmax = 1.0 / (1.0 - kmin) if kmin < 1.0 else np.inf
+    return vmin, vmax
+
+
+@njit(float64(float64, float64[:], float64[:], float64, int64), cache=True)
+def solve_rachford_rice(v, k, z, tol, kmax):
+    """
+    Solves the Rachford-Rice equation
+        sum(z_i (K_i - 1) / (1 + v (K_i - 1))) = 0
+    for the vapor fraction v, negative flash included.
+
+    The function decreases monotonically between its asymptotes (see
+    rachford_rice_window), so the root stays bracketed. Each iteration takes a Newton
+    step from the initial guess v and falls back to bisection when the step leaves
+    the bracket. Nothing is allocated inside the loop.
+
+    Parameters
+    ----------
+    v : float
+        initial guess, replaced by the middle of the bracket if it's outside it.
+    k : array of floats
+        K factors.
+    z : array of floats
+        feed composition.
+    tol : float
+        tolerance on the change of v.
+    kmax : int
+        maximum number of iterations.
+
+    Returns
+    -------
+    v : float
+        vapor fraction. If all K factors are below (above) 1 there's no root, and
+        0 (1) is returned.
+    """
+    n = k.shape[0]
+    lo, hi = rachford_rice_window(k)
+    if lo == -np.inf:
+        return 0.0
+    if hi == np.inf:
+        return 1.0
+
+    if not lo < v < hi:
+        v = 0.5 * (lo + hi)
+
+    for ite in range(kmax):
+        f = 0.0
+        dfdv = 0.0
+        for i in range(n):
+            km1 = k[i] - 1.0
+            t = km1 / (1.0 + v * km1)
+            f += z[i] * t
+            dfdv -= z[i] * t * t
+
+        if f > 0.0:
+            lo = v
+        elif f < 0.0:
+            hi = v
+        else:
+            return v
+
+        v_new = v - f / dfdv
+        if not lo < v_new < hi:
+            v_new = 0.5 * (lo + hi)
+        if np.abs(v_new - v) < tol:
+            return v_new
+        v = v_new
+    return v
@@ -0,0 +1,36 @@
+import time
+
+
+class SolverStats:
+    """
+    Iterations and wall time of the last call to an iterative solver.
+    """
+
+    def __init__(self, solver: str = ""):
+        self.solver = solver
+        self.iterations = 0
+        # iterations that took a Newton step, the others are substitution steps
+        self.newton_iterations = 0
+        # extrapolated (GDEM) or mixed (Anderson) substitution steps
+        self.accelerated_iterations = 0
+        self.converged = False
+        self.time = 0.0
+        self._start = time.perf_counter()
+
+    def finish(self, iterations: int, converged: bool):
+        self.iterations = iterations
+        self.converged = converged
+        self.time = time.perf_counter() - self._start
+
+    def __repr__(self):
+        return (
+            "{}: {} iterations ({} Newton, {} accelerated), {:.3g} ms, "
+            "converged: {}".format(
+                self.solver,
+                self.iterations,
+                self.newton_iterations,
+                self.accelerated_iterations,
+                self.time * 1e3,
+                self.converged,
+            )
+        )
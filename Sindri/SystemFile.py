@@ -0,0 +1,85 @@
+"""
+Reading and writing of the mixture system files (.sndr).
+
+The format is a two-line header and a blank line, the number of components, one
+line per component with the quoted name and formula and the molar fraction, and
+the matrix of binary interaction parameters.
+"""
+import datetime
+import shlex
+from typing import List
+
+import numpy as np
+
+import _devinfo
+
+
+def writeSystemFile(filename: str, names: List[str], formulas: List[str], y, k) -> None:
+    n = len(names)
+    now = datetime.datetime.now()
+    dateandtime = now.strftime("%H:%M %d-%m-%Y")
+
+    file_content = ""
+    # Header (two lines)
+    file_content += _devinfo.__SOFTWARE_NAME__ + " MIXTURE SYSTEM\n"
+    file_content += dateandtime + "\n"
+    file_content += "\n"
+
+    # number of components
+    file_content += str(n) + "\n"
+    file_content += "\n"
+
+    # Name, formula and molar fraction
+    for i in range(n):
+        file_content += '"{0:s}"\t"{1:s}"\t{2:0.17f}\n'.format(
+            names[i], formulas[i], y[i]
+        )
+
+    file_content += "\n"
+
+    # binary interaction parameters
+    for i in range(n):
+        for j in range(n - 1):
+            file_content += "{0:0.17f}\t".format(k[i][j])
+        file_content += "{0:0.17f}\n".format(k[i][n - 1])
+
+    with open(filename, "w") as f:
+        f.write(file_content)
+
+
+def readSystemFile(filename: str):
+    """
+    Returns
+    -------
+    names, formulas : list of str
+        of the components.
+    y : array of floats
+        molar fractions.
+    k : 2d array of floats
+        binary interaction parameters.
+    """
+    with open(filename, "r") as file:
+        skiplines = 3
+        for i in range(skiplines):
+            file.readline()
+        content = [line.rstrip("\n") for line in file if line != "\n"]
+
+    n = int(content[0])
+    y = np.empty(n, dtype=np.float64)
+    k = np.empty([n, n], dtype=np.float64)
+    names, formulas = [], []
+
+    index = 1
+    for i in range(n):
+        subs = shlex.split(content[index + i])
+        names.append(subs[0])
+        formulas.append(subs[1])
+        y[i] = float(subs[2])
+
+    index += n
+    for i in range(n):
+        ks = shlex.split(content[index + i])
+        for j in range(n):
+            k[i][j] = float(ks[j])
+
+    return names, formulas, y, k
@@ -1,7 +1,7 @@
-from numba import njit, float64, int64
+from numba import njit, float64
 
-import VLEBinaryDiagrams
 from VLEEOSIterfaces import *
+from RachfordRice import solve_rachford_rice
 from constants import DBL_EPSILON
 from units import conv_unit
 import os
@@ -356,7 +356,7 @@ class VLE(object):
             k = philiq / phivap
 
             vold = v
-            v = _RachfordRice(v, k, z, tol=1e-8, kmax=500)
+            v = solve_rachford_rice(v, k, z, tol=1e-8, kmax=500)
             x = z / (1.0 + v * (k - 1.0))
             y = k * x
             err = np.abs(v - vold)
@@ -526,6 +526,9 @@ class VLE(object):
             self.eos,
         )
 
+        # matplotlib is only loaded for plotting
+        import VLEBinaryDiagrams
+
         vleplot = VLEBinaryDiagrams.VLEBinaryMixturePlot(
             "isobaric", T, x, y, Tunit, title, plottype
         )
@@ -584,6 +587,9 @@ class VLE(object):
             self.eos,
         )
 
+        # matplotlib is only loaded for plotting
+        import VLEBinaryDiagrams
+
         vleplot = VLEBinaryDiagrams.VLEBinaryMixturePlot(
             "isothermal", P, x, y, Punit, title, plottype
         )
@@ -592,24 +598,6 @@ class VLE(object):
         vleplot.plot()
 
 
-@njit(float64(float64, float64[:], float64[:], float64, int64), cache=True)
-def _RachfordRice(v, k, z, tol, kmax):
-
-    v0 = v
-    v1 = 999.0
-    err = 1000.0
-
-    iter = 0
-    while err > tol or iter > kmax:
-        iter += 1
-        f = np.sum(z * (k - 1.0) / (1.0 + v0 * (k - 1.0)))
-        dfdv = -np.sum(z * (k - 1.0) ** 2 / (1.0 + v0 * (k - 1.0)) ** 2)
-        v1 = v0 - f / dfdv
-        err = np.abs(v0 - v1)
-        v0 = v1
-    return v1
-
-
 @njit(float64(float64[:], float64, float64[:], float64[:], float64[:]), cache=True)
 def _helper_getPb_guess(x, T, Pcs, Tcs, omegas):
     x = np.atleast_1d(x)
@@ -36,78 +36,23 @@ class SubstanceProp(object):
     Class that holds all information from database about the substance.
     """
 
-    def __init__(self, name: str, formula: str):
-
-        db.init()
-
-        table_name = "v_all_properties_including_correlations"
-        query = (
-            "SELECT * FROM "
-            + table_name
-            + " WHERE Formula LIKE '%"
-            + formula
-            + "%'"
-            + " AND Name LIKE '%"
-            + name
-            + "%'"
-        )
-        db.cursor.execute(query)
-        results = db.cursor.fetchall()[0]
-
-        self.Formula = self._ifString(results[0])
-        self.Name = self._ifString(results[1])
-        self.CAS = self._ifString(results[2])
-
-        self.MolWt = self._ifNumber(results[3])
-        self.Tfp = self._ifNumber(results[4])
-        self.Tb = self._ifNumber(results[5])
+    _mutable_attributes = ("state",)
 
-        self.Tc = self._ifNumber(results[6])
-        self.Pc = self._ifNumber(results[7]) * 1e5
-        self.Vc = self._ifNumber(results[8]) / 100 ** 3
-        self.Zc = self._ifNumber(results[9])
-        self.omega = self._ifNumber(results[10])
+    def __init__(self, name: str, formula: str):
+        """
+        Properties of the substance of the database with this name (or alias) and
+        formula, copied from the process-wide SubstanceRegistry. See
+        SubstanceRegistry.find.
+        """
+        substance = get_substance_registry().find(name, formula)
+        self.__dict__.update(substance.__dict__)
 
-        self.state = FluidState.Unknown
-
-        try:
-            tcps = results[11].split("-")
-            tcpmin, tcpmax = tcps[0], tcps[1]
-        except:
-            tcpmin, tcpmax = 0.0, 0.0
-
-        self.Tcpmin, self.Tcpmax = self._ifNumber(tcpmin), self._ifNumber(tcpmax)
-
-        self.a0 = self._ifNumber(results[12])
-        self.a1 = self._ifNumber(results[13])
-        self.a2 = self._ifNumber(results[14])
-        self.a3 = self._ifNumber(results[15])
-        self.a4 = self._ifNumber(results[16])
-
-        self.CpIG, self.CpLiq = self._ifNumber(results[17]), self._ifNumber(results[18])
-
-        self.Ant_A = self._ifNumber(results[19])
-        self.Ant_B = self._ifNumber(results[20])
-        self.Ant_C = self._ifNumber(results[21])
-
-        self.Pvmin = self._ifNumber(results[22]) * 1e5
-        self.Tvmin = self._ifNumber(results[23])
-        self.Pvmax = self._ifNumber(results[24]) * 1e5
-        self.Tvmax = self._ifNumber(results[25])
-
-        self._no_cp_err = "Substance {} doesn't have Cp parameters".format(self.Name)
-
-        self.substance_id = int(
-            db.cursor.execute(
-                "SELECT substance_id from substance "
-                + " WHERE formula LIKE '%"
-                + formula
-                + "%'"
-                + " AND name LIKE '%"
-                + name
-                + "%'"
-            ).fetchone()[0]
-        )
+    def __setattr__(self, name, value):
+        # instances are shared by the registry, so only the fluid state of
+        # getFluidState can change
+        if name not in self._mutable_attributes:
+            raise AttributeError("SubstanceProp attributes are read-only")
+        object.__setattr__(self, name, value)
 
     def getSubstanceID(self):
         return self.substance_id
@@ -304,17 +249,197 @@ class SubstanceProp(object):
             return True
         return False
 
-    def _ifString(self, s: str, ret="") -> str:
-        if isinstance(s, str) and len(s) > 0:
-            return s
-        return ret
 
-    def _ifNumber(self, n, ret=0) -> float:
-        try:
-            float(n) * 1.0 + 1.0
-            return float(n)
-        except:
-            return ret
+# attributes of SubstanceProp kept as columns of SubstanceRegistry.numbers, and the
+# factor that converts each one from the units of the database
+_number_columns = [
+    ("MolWt", 1.0),
+    ("Tfp", 1.0),
+    ("Tb", 1.0),
+    ("Tc", 1.0),
+    ("Pc", 1e5),
+    ("Vc", 1e-6),
+    ("Zc", 1.0),
+    ("omega", 1.0),
+    ("Tcpmin", 1.0),
+    ("Tcpmax", 1.0),
+    ("a0", 1.0),
+    ("a1", 1.0),
+    ("a2", 1.0),
+    ("a3", 1.0),
+    ("a4", 1.0),
+    ("CpIG", 1.0),
+    ("CpLiq", 1.0),
+    ("Ant_A", 1.0),
+    ("Ant_B", 1.0),
+    ("Ant_C", 1.0),
+    ("Pvmin", 1e5),
+    ("Tvmin", 1.0),
+    ("Pvmax", 1e5),
+    ("Tvmax", 1.0),
+]
+
+
+class SubstanceRegistry(object):
+    """
+    All the substances of the database, with their first Cp and Antoine
+    correlations, read with a few queries and indexed by id, CAS, name and formula
+    and alias.
+
+    The numeric properties are the columns of numbers (see _number_columns), in SI
+    units and 0 when missing, one row per substance in substance_id order. The
+    SubstanceProp of a row is built on its first request and shared afterwards.
+    """
+
+    def __init__(self, cursor):
+        rows = cursor.execute(
+            """SELECT s.substance_id, s.formula, s.name, s.cas,
+            s.molar_weigth, s.tfp_k, s.tb_k, s.tc_k, s.pc_bar, s.vc_cm3_per_mol,
+            s.zc, s.omega,
+            c.cp_tmin, c.cp_tmax, c.cp_a0, c.cp_a1, c.cp_a2, c.cp_a3, c.cp_a4,
+            c.cpig, c.cpliq,
+            a.antoine_a, a.antoine_b, a.antoine_c, a.pvpmin_bar, a.tmin_k,
+            a.pvpmax_bar, a.tmax_k,
+            c.cp_id IS NOT NULL AND a.antoine_id IS NOT NULL
+            FROM substance s
+            LEFT JOIN cp_correlations c ON c.cp_id = (
+                SELECT min(cp_id) FROM cp_correlations
+                WHERE substance_id = s.substance_id)
+            LEFT JOIN antoine_correlations a ON a.antoine_id = (
+                SELECT min(antoine_id) FROM antoine_correlations
+                WHERE substance_id = s.substance_id)
+            ORDER BY s.substance_id"""
+        ).fetchall()
+
+        n = len(rows)
+        self.ids = np.array([r[0] for r in rows], dtype=np.int64)
+        self.formulas = [_toString(r[1]) for r in rows]
+        self.names = [_toString(r[2]) for r in rows]
+        self.cas = [_toString(r[3]) for r in rows]
+        self.numbers = np.zeros((n, len(_number_columns)), dtype=np.float64)
+        for i, r in enumerate(rows):
+            values = [_toNumber(v) for v in r[4:28]]
+            if r[12] is None or r[13] is None:
+                # the Cp range is missing unless both ends are known
+                values[8], values[9] = 0.0, 0.0
+            self.numbers[i] = values
+        self.numbers *= np.array([factor for _, factor in _number_columns])
+        # substances of the former view v_all_properties_including_correlations
+        self.complete = np.array([bool(r[28]) for r in rows], dtype=np.bool_)
+
+        self._by_id = {int(sid): i for i, sid in enumerate(self.ids)}
+        self._by_cas = {}
+        self._by_name_formula = {}
+        for i in range(n):
+            if self.cas[i]:
+                self._by_cas.setdefault(self.cas[i], i)
+            key = (self.names[i].lower(), self.formulas[i].lower())
+            self._by_name_formula.setdefault(key, i)
+        self._by_alias_formula = {}
+        for sid, alias in cursor.execute(
+            "SELECT substance_id, alias FROM substance_name_aliases"
+        ).fetchall():
+            if int(sid) in self._by_id:
+                i = self._by_id[int(sid)]
+                key = (_toString(alias).lower(), self.formulas[i].lower())
+                self._by_alias_formula.setdefault(key, i)
+        self._substances = [None] * n
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def get(self, substance_id: int) -> SubstanceProp:
+        if int(substance_id) not in self._by_id:
+            raise ValueError("No substance with id {}".format(substance_id))
+        return self._getRow(self._by_id[int(substance_id)])
+
+    def getByCAS(self, cas: str) -> SubstanceProp:
+        if cas not in self._by_cas:
+            raise ValueError("No substance with CAS {}".format(cas))
+        return self._getRow(self._by_cas[cas])
+
+    def find(self, name: str, formula: str) -> SubstanceProp:
+        """
+        Substance by its name or one of its aliases and its formula, ignoring case.
+
+        Without an exact match, the first substance (with Cp and Antoine
+        correlations, if any matches) whose name and formula contain the given ones
+        is returned, as the former LIKE queries did.
+        """
+        key = (name.lower(), formula.lower())
+        i = self._by_name_formula.get(key, self._by_alias_formula.get(key))
+        if i is None:
+            i = self._findSubstring(*key)
+        if i is None:
+            raise ValueError("Substance not found: {} ({})".format(name, formula))
+        return self._getRow(i)
+
+    def _findSubstring(self, name: str, formula: str):
+        first = None
+        for i in range(len(self.ids)):
+            if name in self.names[i].lower() and formula in self.formulas[i].lower():
+                if self.complete[i]:
+                    return i
+                if first is None:
+                    first = i
+        return first
+
+    def _getRow(self, i: int) -> SubstanceProp:
+        if self._substances[i] is None:
+            substance = object.__new__(SubstanceProp)
+            attributes = dict(
+                zip([col for col, _ in _number_columns], self.numbers[i].tolist())
+            )
+            attributes.update(
+                Formula=self.formulas[i],
+                Name=self.names[i],
+                CAS=self.cas[i],
+                state=FluidState.Unknown,
+                substance_id=int(self.ids[i]),
+                _no_cp_err="Substance {} doesn't have Cp parameters".format(
+                    self.names[i]
+                ),
+            )
+            substance.__dict__.update(attributes)
+            self._substances[i] = substance
+        return self._substances[i]
+
+
+def _toString(s) -> str:
+    if isinstance(s, str) and len(s) > 0:
+        return s
+    return ""
+
+
+def _toNumber(n) -> float:
+    try:
+        return float(n)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+_substance_registry = None
+
+
+def get_substance_registry() -> SubstanceRegistry:
+    """
+    Process-wide SubstanceRegistry, read from the database on the first call.
+    """
+    global _substance_registry
+    if _substance_registry is None:
+        if getattr(db, "cursor", None) is None:
+            db.init()
+        _substance_registry = SubstanceRegistry(db.cursor)
+    return _substance_registry
+
+
+def clear_substance_registry():
+    """
+    Drops the SubstanceRegistry, so it's read again. Call after editing the
+    substances or their correlations and aliases.
+    """
+    global _substance_registry
+    _substance_registry = None
 
 
 class MixtureProp(object):
@@ -3,7 +3,13 @@ import os.path
 from PySide2 import QtWidgets, QtGui, QtCore
 
 import db
-from DatabaseInterface.databaseSearchFunctions import getQueryBySearchNameFormulaOrCas
+from DatabaseInterface.databaseSearchFunctions import (
+    createSearchIndex,
+    getQueryBySearchNameFormulaOrCas,
+    hasSearchIndex,
+)
+from Models.LiquidModel import clear_unifac_cache
+from compounds import clear_substance_registry
 from db_addSubstanceProperties import Form_AddSubstanceProperties
 from db_editSubstanceProperties import Form_EditSubstanceProperties
 from ui.db_ui import Ui_databaseWindow
@@ -97,6 +103,7 @@ class databaseWindow(QtWidgets.QWidget, Ui_databaseWindow):
     def load_db(self):
         # Abrir banco de dados
         if os.path.isfile(self.dbfile):
+            self.search_indexed = hasSearchIndex(db.cursor)
             self.show_full_db()
         else:
             error_dialog = QtWidgets.QErrorMessage()
@@ -129,8 +136,10 @@ class databaseWindow(QtWidgets.QWidget, Ui_databaseWindow):
             self.show_full_db()
         else:
             try:
-                query = getQueryBySearchNameFormulaOrCas(substance_string_name)
-                db.cursor.execute(query)
+                query, params = getQueryBySearchNameFormulaOrCas(
+                    substance_string_name, indexed=self.search_indexed
+                )
+                db.cursor.execute(query, params)
                 results = db.cursor.fetchall()
                 self.update_table_db(results)
             except:
@@ -160,6 +169,9 @@ class databaseWindow(QtWidgets.QWidget, Ui_databaseWindow):
                 db.db.close()
                 copyfile(db.database_file + ".orig", db.database_file)
                 db.init()
+                self.search_indexed = createSearchIndex(db.cursor)
+                clear_unifac_cache()
+                clear_substance_registry()
                 self.search_substance()
                 self.database_changed = False
             except:
@@ -234,6 +246,7 @@ class databaseWindow(QtWidgets.QWidget, Ui_databaseWindow):
                         substance_id
                     )
                     db.cursor.execute(query)
+                    clear_substance_registry()
                     self.search_substance()
                 except Exception as e:
                     print(str(e))
@@ -259,6 +272,8 @@ class databaseWindow(QtWidgets.QWidget, Ui_databaseWindow):
                 pass
         else:
             db.db.rollback()
+            clear_unifac_cache()
+            clear_substance_registry()
             self.show_full_db()
 
     def clear_search(self):
@@ -279,6 +294,8 @@ class databaseWindow(QtWidgets.QWidget, Ui_databaseWindow):
                 db.db.commit()
             elif choice == QtWidgets.QMessageBox.No:
                 db.db.rollback()
+                clear_unifac_cache()
+                clear_substance_registry()
         self.database_changed = False
         self.le_db_search.clear()
         self.show_full_db()
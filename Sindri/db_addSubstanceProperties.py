@@ -1,6 +1,7 @@
 from PySide2 import QtCore, QtWidgets, QtGui
 
 import db
+from compounds import clear_substance_registry
 from ui.db_substanceProperties_ui import Ui_Form_db_substanceProperties
 from validators import getDoubleValidatorRegex
 
@@ -198,6 +199,7 @@ class Form_AddSubstanceProperties(QtWidgets.QWidget, Ui_Form_db_substancePropert
                 ),
             )
 
+            clear_substance_registry()
             self.substance_added = True
 
         except Exception as e:
@@ -3,7 +3,8 @@ from PySide2 import QtCore, QtWidgets, QtGui
 import db
 from Controllers.AddUNIFACsubgroupController import AddUNIFACsubgroupController
 from Controllers.AddAliasController import AddAliasController
-from Models.LiquidModel import has_unifac_in_db
+from compounds import clear_substance_registry
+from Models.LiquidModel import clear_unifac_cache, has_unifac_in_db
 from ui.db_substanceProperties_ui import Ui_Form_db_substanceProperties
 from validators import getDoubleValidatorRegex
 
@@ -285,6 +286,7 @@ class Form_EditSubstanceProperties(QtWidgets.QWidget, Ui_Form_db_substanceProper
                     self.updateSubstanceValues()
                     self.updateCpCorrelationsValues()
                     self.updateAntoineCorrelationsValues()
+                    clear_substance_registry()
                     self.close()
                 except:
                     msg = QtWidgets.QMessageBox.about(
@@ -482,6 +484,7 @@ class Form_EditSubstanceProperties(QtWidgets.QWidget, Ui_Form_db_substanceProper
             )
             db.cursor.execute(query)
             # db.db.commit() # todo implement rollback?
+            clear_unifac_cache()
             self.changes_made = True
             self.loadUNIFACsubgroups()
         except Exception as e:
@@ -520,6 +523,7 @@ class Form_EditSubstanceProperties(QtWidgets.QWidget, Ui_Form_db_substanceProper
             query = """ DELETE FROM substance_name_aliases
                         WHERE substance_id=? AND alias=?"""
             db.cursor.execute(query, (self.substance_id_int, alias))
+            clear_substance_registry()
             self.changes_made = True
             self.loadAliases()
         except Exception as e:
@@ -3,9 +3,11 @@ import sys
 from PySide2 import QtWidgets, QtGui
 
 import db
+from DatabaseInterface.databaseSearchFunctions import createSearchIndex
 from mainwindow import mainwindow
 
 db.init()
+createSearchIndex(db.cursor)
 app = QtWidgets.QApplication(sys.argv)
 app.setStyle("fusion")
 try:
@@ -10,12 +10,14 @@ from Models.PureSubstanceModel import PureSubstanceModel
 from aboutWindow import Window_About
 from databaseWindow import databaseWindow
 from ui.mainwindow_ui import Ui_MainWindow
-import resources.icons_rc
 
 
 class mainwindow(QtWidgets.QMainWindow, Ui_MainWindow):
     def __init__(self):
         super(mainwindow, self).__init__()
+        # the compiled Qt resources (icons and images) are only needed by the windows
+        import resources.icons_rc
+
         self.setupUi(self)
         self.dbw = databaseWindow()
         self.btn_PureSubstanceCalculations.clicked.connect(
@@ -1,4 +1,6 @@
-from numba import jit, float64
+import numpy as np
+from numba import jit, njit, float64, int64
+from numba.types import Tuple
 
 from constants import DBL_EPSILON
 
@@ -42,8 +44,6 @@ def solve_quadratic(a, b, c):
         return
 
 
-# @jit((float64, float64, float64, float64, Omitted(float64)), nopython=True, cache=True)
-@jit(nopython=True, cache=True)
 def solve_cubic(a, b, c, d, x0=1.0):
     """
     Solves the real roots of a cubic equation.
@@ -67,7 +67,12 @@ def solve_cubic(a, b, c, d, x0=1.0):
         returns None.
 
     """
+    return _solve_cubic(float(a), float(b), float(c), float(d), float(x0))
 
+
+# a single compiled signature, whatever the types of the arguments of solve_cubic
+@jit((float64, float64, float64, float64, float64), nopython=True, cache=True)
+def _solve_cubic(a, b, c, d, x0):
     if abs(a) < DBL_EPSILON:  # quadratic
         ret = solve_quadratic(b, c, d)
         return ret
@@ -93,6 +98,84 @@ def solve_cubic(a, b, c, d, x0=1.0):
     return ret
 
 
+@njit(float64(float64, float64, float64, float64), cache=True)
+def _polish_cubic_root(a2, a1, a0, x):
+    # two Newton steps on x^3 + a2*x^2 + a1*x + a0, to remove the cancellation
+    # errors of the closed form
+    for _ in range(2):
+        f = a0 + x * (a1 + x * (a2 + x))
+        df = a1 + x * (2.0 * a2 + 3.0 * x)
+        if df == 0.0:
+            break
+        x -= f / df
+    return x
+
+
+@njit(Tuple((float64, float64, float64, int64))(float64, float64, float64), cache=True)
+def solve_cubic_monic(a2, a1, a0):
+    """
+    Solves the real roots of a monic cubic equation in closed form.
+
+    Solves the real roots of the equation
+        x^3 + a2*x^2 + a1*x + a0 = 0
+    with the trigonometric method when there are three real roots and Cardano's
+    formula otherwise, polishing the roots with Newton's method. Nothing is allocated,
+    so it can be called from other compiled loops.
+
+    Parameters
+    ----------
+    a2 : float
+    a1 : float
+    a0 : float
+
+    Returns
+    -------
+    x1, x2, x3 : float
+        real roots in ascending order. When there's only one real root, x2 and x3 are
+        nan.
+    nroots : int
+        number of real roots, 1 or 3 (repeated roots are counted with multiplicity).
+
+    """
+    Q = (a2 * a2 - 3.0 * a1) / 9.0
+    R = (2.0 * a2 * a2 * a2 - 9.0 * a2 * a1 + 27.0 * a0) / 54.0
+    shift = a2 / 3.0
+    Q3 = Q * Q * Q
+
+    if R * R < Q3:
+        # three distinct real roots
+        sqrtQ = np.sqrt(Q)
+        theta = np.arccos(min(max(R / np.sqrt(Q3), -1.0), 1.0))
+        x1 = -2.0 * sqrtQ * np.cos(theta / 3.0) - shift
+        x2 = -2.0 * sqrtQ * np.cos((theta + 2.0 * np.pi) / 3.0) - shift
+        x3 = -2.0 * sqrtQ * np.cos((theta - 2.0 * np.pi) / 3.0) - shift
+        x1 = _polish_cubic_root(a2, a1, a0, x1)
+        x2 = _polish_cubic_root(a2, a1, a0, x2)
+        x3 = _polish_cubic_root(a2, a1, a0, x3)
+        # sort the three values
+        if x1 > x2:
+            x1, x2 = x2, x1
+        if x2 > x3:
+            x2, x3 = x3, x2
+        if x1 > x2:
+            x1, x2 = x2, x1
+        return x1, x2, x3, 3
+
+    sign_R = 1.0 if R >= 0.0 else -1.0
+    A = -sign_R * np.cbrt(abs(R) + np.sqrt(R * R - Q3))
+    B = Q / A if A != 0.0 else 0.0
+    x1 = A + B - shift
+    if abs(A - B) <= 1e3 * DBL_EPSILON * max(abs(A), 1.0):
+        # double root
+        x2 = -0.5 * (A + B) - shift
+        x1 = _polish_cubic_root(a2, a1, a0, x1)
+        if x1 > x2:
+            x1, x2 = x2, x1
+        return x1, x2, x2, 3
+    x1 = _polish_cubic_root(a2, a1, a0, x1)
+    return x1, np.nan, np.nan, 1
+
+
 # @jit((float64, float64, float64, float64), nopython=True, cache=True)
 # def solve_cubic(a, b, c, d):
 #     if
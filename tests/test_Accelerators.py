@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from Sindri.Accelerators import (
+    AndersonAccelerator,
+    GDEMAccelerator,
+    createAccelerator,
+)
+
+# linear fixed-point map with a slow dominant mode, x* = (1, 2)
+A = np.array([[0.95, 0.0], [0.0, 0.3]])
+x_star = np.array([1.0, 2.0])
+
+
+def g(x):
+    return x_star + A @ (x - x_star)
+
+
+def _iterations(accelerator, tol=1e-10, kmax=1000):
+    x = np.zeros(2)
+    for ite in range(1, kmax + 1):
+        x_new = accelerator.update(x, g(x))
+        if np.max(np.abs(x_new - x)) < tol:
+            return ite, x_new
+        x = x_new
+    return kmax, x
+
+
+def test_accelerators_converge_faster_than_substitution():
+    plain_ite, _ = _iterations(createAccelerator("none"))
+    for accelerator in (GDEMAccelerator(), AndersonAccelerator()):
+        ite, x = _iterations(accelerator)
+        np.testing.assert_allclose(x, x_star)
+        assert ite < plain_ite / 4
+        assert accelerator.accelerated_steps > 0
+
+
+def test_unknown_accelerator():
+    with pytest.raises(ValueError):
+        createAccelerator("Aitken")
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from Sindri.Batch import (
+    getColumns,
+    normalizeComposition,
+    readCases,
+    runBatch,
+    writeResults,
+)
+from Sindri.Factories.EOSMixFactory import createEOSMix
+from Sindri.SystemFile import readSystemFile, writeSystemFile
+from Sindri.compounds import SubstanceProp
+
+methane = SubstanceProp("methane", "CH4")
+pentane = SubstanceProp("pentane", "C5H12")
+k = np.array([[0.0, 0.02], [0.02, 0.0]])
+eosname = "Peng and Robinson (1976)"
+
+
+def test_system_file_round_trip(tmp_path):
+    filename = str(tmp_path / "system.sndr")
+    writeSystemFile(filename, ["methane", "pentane"], ["CH4", "C5H12"], [0.4, 0.6], k)
+    names, formulas, y, k_read = readSystemFile(filename)
+    assert names == ["methane", "pentane"]
+    assert formulas == ["CH4", "C5H12"]
+    np.testing.assert_allclose(y, [0.4, 0.6])
+    np.testing.assert_allclose(k_read, k)
+
+
+def test_batch_in_a_process_pool(tmp_path):
+    cases_file = tmp_path / "cases.csv"
+    cases_file.write_text(
+        "job,P,T,z_1,z_2\n"
+        "state,5e6,250,0.3,0.7\n"
+        "flash,2e6,300,,\n"
+        "bubbleP,,300,0.3,0.7\n"
+        "dewT,1e6,,0.3,0.7\n"
+        "flash,1e3,600,,\n"
+    )
+    cases = readCases(str(cases_file), [0.5, 0.5])
+    assert cases[1][0] == "flash" and np.isnan(cases[2][1])
+    np.testing.assert_allclose(cases[1][3], [0.5, 0.5])
+
+    results = list(
+        runBatch([methane, pentane], k, eosname, cases, processes=2, chunksize=2)
+    )
+    assert [r["case"] for r in results] == list(range(5))
+    assert all(set(r) == set(getColumns(2)) for r in results)
+    assert [bool(r["error"]) for r in results] == [False] * 4 + [True]
+
+    eos = createEOSMix([methane, pentane], eosname, k)
+    z = np.array([0.3, 0.7])
+    zliq = eos.getZLiqVap(5e6, 250, z)[0]
+    np.testing.assert_allclose(results[0]["Z_liq"], zliq)
+    x, y, v = eos.getFlash(np.array([0.5, 0.5]), 2e6, 300)[:3]
+    np.testing.assert_allclose(results[1]["v"], v)
+    np.testing.assert_allclose(results[1]["y_1"], y[0])
+    np.testing.assert_allclose(results[2]["P"], eos.getBubblePointPressure(z, 300)[1])
+    np.testing.assert_allclose(results[3]["T"], eos.getDewPointTemperature(z, 1e6)[1])
+
+    serial = runBatch([methane, pentane], k, eosname, cases, processes=1)
+    filename = str(tmp_path / "results.npz")
+    assert writeResults(serial, filename, 2) == 1
+    table = np.load(filename)
+    assert list(table["job"]) == ["state", "flash", "bubbleP", "dewT", "flash"]
+    np.testing.assert_allclose(table["P"][2], results[2]["P"])
+
+    filename = str(tmp_path / "results.csv")
+    assert writeResults(results, filename, 2) == 1
+    lines = open(filename).read().splitlines()
+    assert lines[0].split(",") == getColumns(2)
+    assert len(lines) == 6
+
+
+def test_cases_are_checked_when_read(tmp_path):
+    cases_file = tmp_path / "cases.csv"
+    cases_file.write_text("job,P,T,z_1,z_2\nflash,2e6,300,0.4,0.6000001\n")
+    z = readCases(str(cases_file), [0.5, 0.5])[0][3]
+    assert np.sum(z) == 1.0
+    np.testing.assert_allclose(z, [0.4, 0.6], rtol=1e-6)
+    assert np.sum(normalizeComposition([0.7, 0.2, 0.1])) == 1.0
+
+    for line, message in [
+        ("bubbleP,1e6,,0.3,0.7", "bubbleP needs T"),
+        ("dewT,,300,0.3,0.7", "dewT needs P"),
+        ("flash,2e6,,,", "flash needs T"),
+        ("state,2e6,300,0.3,0.6", "composition sums"),
+        ("lle,2e6,300,,", "unknown batch job"),
+    ]:
+        cases_file.write_text("job,P,T,z_1,z_2\n" + line + "\n")
+        with pytest.raises(ValueError, match="Line 2: " + message):
+            readCases(str(cases_file), [0.5, 0.5])
+
+    # failures without a message are still reported
+    case = ("flash", 2e6, 300.0, np.array([0.3, 0.6]))
+    result = next(runBatch([methane, pentane], k, eosname, [case], processes=1))
+    assert result["error"] == "AssertionError"
@@ -1,6 +1,6 @@
 import numpy as np
 
-from Sindri.Factories.EOSMixFactory import createEOSMix
+from Sindri.Factories.EOSMixFactory import createEOSMix, getEOSMixOptions
 from Sindri.compounds import SubstanceProp, MixtureProp
 from Sindri.constants import R_IG
 from Sindri.eos import EOS
@@ -66,3 +66,91 @@ def test_first_pure_substance_PR1976():
     # assert A
     np.testing.assert_allclose(calc_allProps[i].Props.A, v_allProps[i].Props.A, 1e-5)
     np.testing.assert_allclose(calc_allProps[j].Props.A, v_allProps[j].Props.A, 1e-5)
+
+
+def test_analytic_departure_props_match_quadrature_for_all_eos():
+    subs = [methane, water, hexane]
+    y = np.array([0.3, 0.2, 0.5])
+    k = np.zeros((3, 3))
+
+    for eosname in getEOSMixOptions():
+        eos = createEOSMix(subs, eosname, k)
+        for p, t in [(1e5, 300.0), (5e6, 400.0)]:
+            zs = eos.getZfromPT(p, t, y)
+            for z in (np.min(zs), np.max(zs)):
+                v = z * R_IG * t / p
+                analytic = eos.getDepartureProps(y, p, t, v, z)
+                numerical = eos.getDeparturePropsNumerical(y, p, t, v, z)
+                for prop in ("H", "S", "G", "U", "A"):
+                    np.testing.assert_allclose(
+                        getattr(analytic, prop),
+                        getattr(numerical, prop),
+                        rtol=1e-5,
+                        atol=1e-6,
+                        err_msg="{} {}".format(eosname, prop),
+                    )
+
+
+def test_cp_departure_and_dZdT_match_finite_differences_for_all_eos():
+    subs = [methane, water, hexane]
+    y = np.array([0.3, 0.2, 0.5])
+    k = np.zeros((3, 3))
+    p, t, h = 1e5, 300.0, 1e-3
+
+    for eosname in getEOSMixOptions():
+        eos = createEOSMix(subs, eosname, k)
+        zs, zs_plus, zs_minus = (
+            eos.getZfromPT(p, t, y),
+            eos.getZfromPT(p, t + h, y),
+            eos.getZfromPT(p, t - h, y),
+        )
+        dzdt = eos.getdZdT(p, t, y)
+        for i, f in enumerate((np.min, np.max)):
+            np.testing.assert_allclose(
+                dzdt[i], (f(zs_plus) - f(zs_minus)) / (2.0 * h), rtol=1e-4
+            )
+
+            z, zp, zm = f(zs), f(zs_plus), f(zs_minus)
+            hp = eos.getDepartureProps(y, p, t + h, zp * R_IG * (t + h) / p, zp).H
+            hm = eos.getDepartureProps(y, p, t - h, zm * R_IG * (t - h) / p, zm).H
+            cp = eos.getDepartureProps(y, p, t, z * R_IG * t / p, z).Cp
+            np.testing.assert_allclose(
+                cp, (hp - hm) / (2.0 * h), rtol=1e-8, err_msg=eosname
+            )
+
+
+def test_derivative_props_approach_ideal_gas_at_low_pressure():
+    eos = createEOSMix([methane], eosname)
+    p, t = 1e2, 300.0
+    z = np.max(eos.getZfromPT(p, t, [1.0]))
+    props = eos.getDerivativeProps([1.0], p, t, z)
+    cp_ig = methane.getCp(t)
+
+    np.testing.assert_allclose(props.Cp, cp_ig, rtol=1e-4)
+    np.testing.assert_allclose(props.Cv, cp_ig - R_IG, rtol=1e-4)
+    w_ig = np.sqrt(cp_ig / (cp_ig - R_IG) * R_IG * t / (methane.MolWt * 1e-3))
+    np.testing.assert_allclose(props.SoundSpeed, w_ig, rtol=1e-4)
+
+
+def test_all_props_compute_the_departures_once():
+    eos = createEOSMix([methane, hexane], eosname, k2)
+    y, p, t = [0.4, 0.6], 2e5, 320.0
+    calls = []
+    departures = eos._getDepartureProps
+
+    def counted(*args):
+        calls.append(args)
+        return departures(*args)
+
+    eos._getDepartureProps = counted
+    liq, vap = eos.getAllProps(y, 298.15, t, 1e5, p)
+    # the liquid and vapor roots, at the state and at the reference
+    assert len(calls) == 4
+
+    for props in (liq, vap):
+        expected = eos.getDerivativeProps(y, p, t, props.Z)
+        for name in ("Cp", "Cv", "SoundSpeed", "JouleThomson"):
+            np.testing.assert_allclose(
+                getattr(props.DerivativeProps, name), getattr(expected, name)
+            )
+        np.testing.assert_allclose(props.Props.Cp, expected.Cp)
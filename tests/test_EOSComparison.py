@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from Sindri.EOSComparison import compareEOS, writeCSV
+from Sindri.Factories.EOSMixFactory import createEOSMix
+from Sindri.compounds import SubstanceProp
+
+methane = SubstanceProp("methane", "CH4")
+pentane = SubstanceProp("pentane", "C5H12")
+eosnames = ["Peng and Robinson (1976)", "Soave (1972)"]
+
+
+def test_state_in_a_process_pool():
+    table = compareEOS(
+        [methane, pentane], "state", eosnames, processes=2, P=1e5, T=300, y=[0.5, 0.5]
+    )
+    assert list(table["eos"]) == eosnames
+    for i, name in enumerate(eosnames):
+        eos = createEOSMix([methane, pentane], name)
+        zliq, zvap = eos.getZLiqVap(1e5, 300, np.array([0.5, 0.5]))[:2]
+        np.testing.assert_allclose(table["Z_vap"][i], zvap)
+        np.testing.assert_allclose(table["Z_liq"][i], zliq)
+
+
+def test_saturation_matches_the_serial_run(tmp_path):
+    kwargs = dict(z=[0.3, 0.7], values=[250.0, 300.0, 350.0])
+    serial = compareEOS([methane, pentane], "bubbleP", eosnames, processes=1, **kwargs)
+    pool = compareEOS([methane, pentane], "bubbleP", eosnames, processes=2, **kwargs)
+
+    assert len(pool["eos"]) == 6
+    assert list(pool["T"]) == [250.0, 300.0, 350.0] * 2
+    np.testing.assert_allclose(pool["P"], serial["P"])
+    assert np.all(pool["error"] == "")
+
+    eos = createEOSMix([methane, pentane], eosnames[1])
+    P = eos.getBubblePointPressure(np.array([0.3, 0.7]), 300.0)[1]
+    np.testing.assert_allclose(pool["P"][4], P, rtol=1e-6)
+
+    writeCSV(pool, tmp_path / "comparison.csv")
+    lines = (tmp_path / "comparison.csv").read_text().splitlines()
+    assert lines[0].split(",")[:3] == ["eos", "T", "P"]
+    assert len(lines) == 7
+
+
+def test_unknown_eos():
+    with pytest.raises(ValueError):
+        compareEOS(
+            [methane, pentane], "state", ["van der Waals"], P=1e5, T=300, y=[1, 0]
+        )
+
+
+def test_failures_get_their_own_rows():
+    table = compareEOS([methane, pentane], "isothermal", eosnames[:1], T=300.0)
+    failed = table["error"] != ""
+    # methane is supercritical, the bubble point curve ends near x1 = 0.85
+    assert np.any(failed) and np.all(table["x"][failed] > 0.75)
+    assert np.all(np.isnan(table["P"][failed]))
+    assert np.all(np.isfinite(table["P"][~failed]))
+    assert np.all(np.diff(table["x"]) > 0)
+
+    # an equation of state that fails doesn't stop the others
+    table = compareEOS(
+        [methane, pentane], "state", eosnames, processes=1, P=1e5, T=300, y=[1, 0, 0]
+    )
+    assert list(table["eos"]) == eosnames
+    assert np.all(table["error"] != "") and np.all(np.isnan(table["Z_liq"]))
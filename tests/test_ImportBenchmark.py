@@ -0,0 +1,31 @@
+from Sindri.Factories.EOSMixFactory import getEOSMixClass, getEOSMixOptions
+from Sindri.ImportBenchmark import measureImport
+
+
+def test_core_imports_without_gui_modules():
+    result = measureImport()
+    assert result["loaded"] == []
+    assert result["time"] > 0
+
+
+def test_creating_a_mixture_loads_only_its_equation():
+    result = measureImport(
+        [
+            "import sys",
+            "import db",
+            "db.init()",
+            "from Factories.EOSMixFactory import createEOSMix",
+            "from compounds import SubstanceProp",
+            "createEOSMix([SubstanceProp('methane', 'CH4')], 'Soave (1972)')",
+            "eos = [m for m in sys.modules if m.startswith('CubicEquationsOfState.')]",
+            "assert sorted(eos) == ['CubicEquationsOfState.Soave1972', "
+            "'CubicEquationsOfState.Wilson1964'], eos",
+        ]
+    )
+    assert result["loaded"] == []
+
+
+def test_every_option_is_registered():
+    for name in getEOSMixOptions():
+        assert getEOSMixClass(name) is not None
+    assert getEOSMixClass("van der Waals") is None
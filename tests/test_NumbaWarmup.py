@@ -0,0 +1,19 @@
+from Sindri.NumbaWarmup import getKernels, getKernelStatus, kernelReport
+from Sindri.polyEqSolver import _solve_cubic, solve_cubic
+
+
+def test_every_kernel_has_a_declared_signature():
+    kernels = getKernels()
+    assert "RachfordRice.solve_rachford_rice" in kernels
+    assert "polyEqSolver._solve_cubic" in kernels
+    assert "EOSParametersBehavior.alphaFunctions.soave_alpha_vector" in kernels
+    report = kernelReport()
+    assert set(report) == set(kernels)
+    assert set(report.values()) <= {"warm", "cold"}
+
+
+def test_solve_cubic_compiles_once():
+    assert solve_cubic(1, 2, 3, -1) == solve_cubic(1.0, 2.0, 3.0, -1.0, x0=1.0)
+    assert solve_cubic(0, 1, 2, -3) == [1.0, -3.0]
+    assert len(_solve_cubic.signatures) == 1
+    assert getKernelStatus(_solve_cubic) in ("warm", "cold")
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from Sindri.EOSParametersBehavior.ParameterCache import ParameterCache
+from Sindri.Factories.EOSMixFactory import createEOSMix
+from Sindri.Models.MixtureModel import MixtureModel
+from Sindri.compounds import SubstanceProp
+
+methane = SubstanceProp("methane", "CH4")
+ethane = SubstanceProp("ethane", "C2H6")
+pentane = SubstanceProp("pentane", "C5H12")
+
+subs = [methane, ethane, pentane]
+x = [0.2, 0.3, 0.5]
+
+
+@pytest.mark.parametrize(
+    "eosname",
+    ["Peng and Robinson (1976)", "Schmidt and Wenzel (1979)", "Twu, et al. (1995)"],
+)
+def test_cached_bubble_point_matches_uncached(eosname):
+    eos = createEOSMix(subs, eosname)
+    expected = eos.getBubblePointTemperature(x, 1e6)
+
+    eos.enableParameterCache()
+    ret = eos.getBubblePointTemperature(x, 1e6)
+
+    np.testing.assert_array_equal(ret[0], expected[0])
+    assert ret[1] == expected[1]
+    info = eos.getParameterCacheInfo()
+    assert info["hits"] > info["misses"] > 0
+
+
+def test_cache_is_size_bounded():
+    eos = createEOSMix(subs, "Peng and Robinson (1976)")
+    eos.enableParameterCache(maxsize=2)
+    for T in (200.0, 250.0, 300.0, 300.0):
+        eos.thetaiBehavior.getThetaVector(T, eos.substances)
+
+    assert eos.getParameterCacheInfo() == {
+        "hits": 1,
+        "misses": 3,
+        "size": 2,
+        "maxsize": 2,
+    }
+
+
+def test_disable_restores_behaviors():
+    eos = createEOSMix(subs, "Peng and Robinson (1976)")
+    bib, thetaib = eos.biBehavior, eos.thetaiBehavior
+    eos.enableParameterCache()
+    eos.enableParameterCache()
+    eos.disableParameterCache()
+
+    assert eos.biBehavior is bib
+    assert eos.thetaiBehavior is thetaib
+    assert eos.getParameterCacheInfo() is None
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        ParameterCache(0)
+
+
+def test_mixture_model_keeps_cache_when_k_changes():
+    model = MixtureModel()
+    model.addSubstanceToSystem(methane)
+    model.addSubstanceToSystem(ethane)
+    model.setParameterCacheSize(16)
+    model.system.getZfromPT(1e6, 200.0, [0.5, 0.5])
+    assert model.getParameterCacheInfo()["size"] > 0
+
+    system = model.system
+    model.setBinaryInteractionsParameters([[0.0, 0.01], [0.01, 0.0]])
+    assert model.system is system
+    assert model.getParameterCacheInfo()["size"] > 0
+
+    model.setEOS("Twu, et al. (1995)")
+    assert model.getParameterCacheInfo()["size"] == 0
+    assert model.getParameterCacheInfo()["maxsize"] == 16
+
+    model.setParameterCacheSize(0)
+    assert model.getParameterCacheInfo() is None
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from Sindri.Factories.EOSMixFactory import createEOSMix, getEOSMixOptions
+from Sindri.compounds import SubstanceProp
+
+methane = SubstanceProp("methane", "CH4")
+water = SubstanceProp("water", "H2O")
+methanol = SubstanceProp("methanol", "CH4O")
+hexane = SubstanceProp("hexane", "C6H14")
+benzene = SubstanceProp("benzene", "C6H6")
+
+subs = [methane, water, methanol, hexane, benzene]
+temperatures = np.array([150.0, 300.0, 450.0, 700.0])
+
+
+def _scalar_matrix(func, n):
+    return np.array([[func(i, t, subs) for i in range(n)] for t in temperatures])
+
+
+def test_theta_and_b_vectors_match_scalar_methods():
+    n = len(subs)
+    for eosname in getEOSMixOptions():
+        eos = createEOSMix(subs, eosname)
+
+        theta = eos.thetaiBehavior.getThetaVector(temperatures, subs)
+        b = eos.biBehavior.getBVector(temperatures, subs)
+
+        assert theta.shape == (len(temperatures), n)
+        assert b.shape == (len(temperatures), n)
+        np.testing.assert_allclose(
+            theta, _scalar_matrix(eos.thetaiBehavior.getThetai, n), rtol=1e-12
+        )
+        np.testing.assert_allclose(
+            b, _scalar_matrix(eos.biBehavior.getBi, n), rtol=1e-12
+        )
+
+
+def test_theta_vector_accepts_scalar_temperature():
+    eos = createEOSMix(subs, "Peng and Robinson (1976)")
+    theta = eos.thetaiBehavior.getThetaVector(300.0, subs)
+    assert theta.shape == (1, len(subs))
+
+
+def test_analytic_dtheta_dT_matches_central_differences():
+    h = 1e-3
+    for eosname in getEOSMixOptions():
+        eos = createEOSMix(subs, eosname)
+        thetaib = eos.thetaiBehavior
+
+        dtheta = thetaib.getdThetadTVector(temperatures, subs)
+        dtheta_fd = (
+            thetaib.getThetaVector(temperatures + h, subs)
+            - thetaib.getThetaVector(temperatures - h, subs)
+        ) / (2.0 * h)
+
+        assert dtheta.shape == (len(temperatures), len(subs))
+        np.testing.assert_allclose(
+            dtheta, dtheta_fd, rtol=1e-6, atol=1e-9, err_msg=eosname
+        )
+
+
+def test_analytic_d2theta_dT2_matches_central_differences():
+    h = 1e-3
+    for eosname in getEOSMixOptions():
+        eos = createEOSMix(subs, eosname)
+        thetaib = eos.thetaiBehavior
+
+        d2theta = thetaib.getd2ThetadT2Vector(temperatures, subs)
+        d2theta_fd = (
+            thetaib.getdThetadTVector(temperatures + h, subs)
+            - thetaib.getdThetadTVector(temperatures - h, subs)
+        ) / (2.0 * h)
+
+        assert d2theta.shape == (len(temperatures), len(subs))
+        np.testing.assert_allclose(
+            d2theta, d2theta_fd, rtol=1e-6, atol=1e-12, err_msg=eosname
+        )
+
+
+def test_component_constants_are_packed_once(monkeypatch):
+    eos = createEOSMix(subs, "Peng and Robinson (1976)")
+    thetaib = eos.thetaiBehavior
+    expected = thetaib.getThetaVector(temperatures, subs)
+    dexpected = thetaib.getdThetadTVector(temperatures, subs)
+
+    def fail(*args):
+        raise AssertionError("per-component method called again")
+
+    monkeypatch.setattr(thetaib, "a", fail)
+    monkeypatch.setattr(thetaib, "m", fail)
+    np.testing.assert_array_equal(thetaib.getThetaVector(temperatures, subs), expected)
+    np.testing.assert_array_equal(
+        thetaib.getdThetadTVector(temperatures, subs), dexpected
+    )
+    # another list of substances is packed again
+    with pytest.raises(AssertionError):
+        thetaib.getThetaVector(temperatures, subs[:2])
@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+
+from Sindri.Factories.EOSMixFactory import createEOSMix
+from Sindri.PropertyTable import PROPERTIES, PropertyTable
+from Sindri.compounds import SubstanceProp
+
+methane = SubstanceProp("methane", "CH4")
+ethane = SubstanceProp("ethane", "C2H6")
+
+y = [0.5, 0.5]
+Tref = 300.0
+Pref = 1e5
+
+
+@pytest.fixture(scope="module")
+def eos():
+    return createEOSMix([methane, ethane], "Peng and Robinson (1976)")
+
+
+@pytest.fixture(scope="module")
+def table(eos):
+    P = np.linspace(1e5, 5e6, 15)
+    T = np.linspace(180.0, 240.0, 13)
+    return PropertyTable.generate(eos, y, P, T, Tref, Pref)
+
+
+def test_lookup_matches_getAllProps_in_single_phase_regions(eos, table):
+    for P, T, phase in [(4.5e6, 185.0, "liquid"), (3e5, 235.0, "vapor")]:
+        assert table.getPhase(P, T) == phase
+        liq, vap = eos.getAllProps(y, Tref, T, Pref, P)
+        expected = liq if phase == "liquid" else vap
+
+        np.testing.assert_allclose(table.lookup("Z", P, T), expected.Z, rtol=1e-3)
+        np.testing.assert_allclose(table.lookup("V", P, T), expected.V, rtol=1e-3)
+        np.testing.assert_allclose(
+            table.lookup("Fugacity", P, T), expected.Fugacity, rtol=1e-3
+        )
+        np.testing.assert_allclose(
+            table.lookup("H", P, T), expected.Props.H, atol=table.errors[phase]["H"]
+        )
+
+
+def test_two_phase_region_needs_explicit_phase(eos, table):
+    P, T = 2e6, 210.0
+    assert table.getPhase(P, T) == "two-phase"
+    with pytest.raises(ValueError):
+        table.lookup("Z", P, T)
+
+    # the metastable roots are partly extrapolated inside the two-phase region
+    zliq, zvap, nroots = eos.getZLiqVap(P, T, y)
+    np.testing.assert_allclose(table.lookup("Z", P, T, "liquid"), zliq, rtol=5e-2)
+    np.testing.assert_allclose(table.lookup("Z", P, T, "vapor"), zvap, rtol=5e-2)
+
+
+def test_lookup_outside_grid_raises(table):
+    with pytest.raises(ValueError):
+        table.lookup("Z", 1e7, 200.0)
+    with pytest.raises(ValueError):
+        table.lookup("Z", 1e6, 100.0, "vapor")
+
+
+def test_save_and_load(table, tmp_path):
+    filename = str(tmp_path / "table.npz")
+    table.save(filename)
+    loaded = PropertyTable.load(filename)
+
+    assert loaded.eosname == table.eosname
+    np.testing.assert_array_equal(loaded.Pbubble, table.Pbubble)
+    np.testing.assert_array_equal(loaded.Pdew, table.Pdew)
+    for prop in PROPERTIES:
+        for P, T in [(4.5e6, 185.0), (3e5, 235.0)]:
+            assert loaded.lookup(prop, P, T) == table.lookup(prop, P, T)
+    assert loaded.errors == table.errors
+    assert loaded.molarMass == table.molarMass
+
+
+def test_density_uses_the_stored_molar_mass(table):
+    molar_mass = 0.5 * (methane.MolWt + ethane.MolWt) * 1e-3
+    np.testing.assert_allclose(table.molarMass, molar_mass, rtol=1e-12)
+
+    # the corner cells may be padding, they don't matter
+    data = {phase: dict(props) for phase, props in table.data.items()}
+    data["vapor"]["rho"] = data["vapor"]["rho"].copy()
+    data["vapor"]["rho"][0, 0] = np.nan
+    copy = PropertyTable(
+        table.P,
+        table.T,
+        table.y,
+        data,
+        table.Pbubble,
+        table.Pdew,
+        table.Tref,
+        table.Pref,
+        molar_mass=table.molarMass,
+    )
+    P, T = 3e5, 235.0
+    V = copy.lookup("V", P, T)
+    np.testing.assert_allclose(copy.lookup("rho", P, T), molar_mass / V, rtol=1e-12)
+    assert copy.lookup("rho", P, T) == table.lookup("rho", P, T)
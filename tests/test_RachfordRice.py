@@ -0,0 +1,46 @@
+import numpy as np
+
+from Sindri.RachfordRice import rachford_rice_window, solve_rachford_rice
+
+
+def _rr(v, k, z):
+    return np.sum(z * (k - 1.0) / (1.0 + v * (k - 1.0)))
+
+
+def test_two_phase_root():
+    k = np.array([3.0, 1.2, 0.1])
+    z = np.array([0.3, 0.3, 0.4])
+    v = solve_rachford_rice(0.5, k, z, 1e-12, 100)
+    assert 0.0 < v < 1.0
+    np.testing.assert_allclose(_rr(v, k, z), 0.0, atol=1e-12)
+
+
+def test_negative_flash_stays_in_the_window():
+    k = np.array([1.5, 0.9, 0.2])
+    z = np.array([0.1, 0.2, 0.7])
+    lo, hi = rachford_rice_window(k)
+    np.testing.assert_allclose([lo, hi], [-2.0, 1.25])
+
+    # a bad initial guess, beyond the asymptote
+    v = solve_rachford_rice(10.0, k, z, 1e-12, 100)
+    assert lo < v < 0.0
+    np.testing.assert_allclose(_rr(v, k, z), 0.0, atol=1e-12)
+
+
+def test_no_root_and_iteration_limit():
+    z = np.array([0.5, 0.5])
+    assert solve_rachford_rice(0.5, np.array([0.5, 0.8]), z, 1e-12, 100) == 0.0
+    assert solve_rachford_rice(0.5, np.array([1.5, 2.0]), z, 1e-12, 100) == 1.0
+
+    # returns after kmax iterations instead of looping forever
+    v = solve_rachford_rice(0.5, np.array([3.0, 0.1]), z, 0.0, 5)
+    assert -0.5 < v < 1.0 / 0.9
+
+
+def test_many_components():
+    rng = np.random.default_rng(0)
+    k = np.exp(rng.uniform(-3.0, 3.0, 200))
+    z = rng.uniform(0.0, 1.0, 200)
+    z /= np.sum(z)
+    v = solve_rachford_rice(0.5, k, z, 1e-13, 100)
+    np.testing.assert_allclose(_rr(v, k, z), 0.0, atol=1e-10)
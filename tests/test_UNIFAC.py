@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+
+from Sindri.Models.LiquidModel import (
+    UNIFAC,
+    clear_unifac_cache,
+    get_unifac_tables,
+    has_unifac_in_db,
+)
+from Sindri.Factories.EOSMixFactory import createEOSMix
+from Sindri.compounds import SubstanceProp
+from Sindri.constants import R_IG
+
+ethane_id = SubstanceProp("ethane", "C2H6").getSubstanceID()
+ethanol_id = SubstanceProp("ethanol", "C2H6O").getSubstanceID()
+
+
+def test_has_unifac_in_db_checks_every_substance():
+    assert has_unifac_in_db([ethane_id, ethanol_id])
+    assert not has_unifac_in_db([ethane_id, 99999])
+    assert not has_unifac_in_db([99999, ethane_id])
+
+
+def test_unifac_structures():
+    unifac = UNIFAC([ethane_id, ethanol_id])
+
+    # CH3, CH2 and OH subgroups; CH3 and CH2 share the main group CH2
+    np.testing.assert_array_equal(unifac.vk, [[2, 0, 0], [1, 1, 1]])
+    np.testing.assert_array_equal(unifac.k, [1, 1, 5])
+    np.testing.assert_allclose(unifac.Rk, [0.9011, 0.6744, 1.0])
+    np.testing.assert_allclose(unifac.Qk, [0.848, 0.54, 1.2])
+    assert unifac.amk[0, 1] == unifac.amk[1, 0] == 0.0
+    assert unifac.amk[0, 2] == unifac.amk[1, 2] != 0.0
+    assert unifac.amk[2, 0] == unifac.amk[2, 1] != 0.0
+
+
+def test_unifac_gamma_limits():
+    unifac = UNIFAC([ethane_id, ethanol_id])
+
+    np.testing.assert_allclose(unifac.getGamma(np.array([1.0, 0.0]), 300.0)[0], 1.0)
+    np.testing.assert_allclose(unifac.getGamma(np.array([0.0, 1.0]), 300.0)[1], 1.0)
+    assert np.all(unifac.getGamma(np.array([0.5, 0.5]), 300.0) > 1.0)
+
+
+def test_unifac_tables_are_loaded_once():
+    tables = get_unifac_tables()
+    assert get_unifac_tables() is tables
+    assert tables.A.shape == (len(tables.maingroups), len(tables.maingroups))
+    assert np.all(tables.maingroup_index >= 0)
+
+    clear_unifac_cache()
+    assert get_unifac_tables() is not tables
+
+
+def test_unifac_gamma_batch():
+    unifac = UNIFAC([ethane_id, ethanol_id])
+    X = np.array([[0.1, 0.9], [0.5, 0.5], [0.8, 0.2]])
+    T = np.array([300.0, 300.0, 350.0])
+
+    gamma = unifac.getGammaBatch(X, T)
+    for i in range(len(X)):
+        np.testing.assert_allclose(gamma[i], unifac.getGamma(X[i], T[i]), rtol=1e-14)
+    np.testing.assert_allclose(
+        unifac.getGammaBatch(X, 300.0)[2], unifac.getGamma(X[2], 300.0), rtol=1e-14
+    )
+    with pytest.raises(ValueError):
+        unifac.getGammaBatch(X, T[:2])
+
+
+def test_unifac_derivatives_match_finite_differences():
+    unifac = UNIFAC([ethane_id, ethanol_id])
+    x = np.array([0.3, 0.7])
+    T = 320.0
+
+    lngamma, dlngamma_dx, dlngamma_dT = unifac.getLnGammaDerivatives(x, T)
+    np.testing.assert_allclose(lngamma, np.log(unifac.getGamma(x, T)), rtol=1e-14)
+
+    h = 1e-6
+    for j in range(2):
+        dx = h * np.eye(2)[j]
+        fd = (
+            np.log(unifac.getGamma(x + dx, T)) - np.log(unifac.getGamma(x - dx, T))
+        ) / (2 * h)
+        np.testing.assert_allclose(dlngamma_dx[:, j], fd, rtol=1e-6)
+
+    h = 1e-3
+    fd = (np.log(unifac.getGamma(x, T + h)) - np.log(unifac.getGamma(x, T - h))) / (
+        2 * h
+    )
+    np.testing.assert_allclose(dlngamma_dT, fd, rtol=1e-6)
+
+    he = unifac.getExcessEnthalpy(x, T)
+    np.testing.assert_allclose(he, -R_IG * T * T * np.sum(x * fd), rtol=1e-6)
+
+
+def test_dew_point_pressure_UNIFAC_satisfies_gamma_phi_equilibrium():
+    methanol = SubstanceProp("methanol", "CH4O")
+    water = SubstanceProp("water", "H2O")
+    eos = createEOSMix([methanol, water], "Peng and Robinson (1976)")
+    eos.setVLEmethod("UNIFAC")
+    y = np.array([0.5, 0.5])
+    T = 322.91
+
+    x, pd, phivap, gamma, k, ite = eos.getDewPointPressure(y, T)
+    np.testing.assert_allclose(np.sum(x), 1.0, rtol=1e-12)
+    np.testing.assert_allclose(gamma, eos.unifac_model.getGamma(x, T), rtol=1e-12)
+    np.testing.assert_allclose(
+        y * eos.getCapPhi(y, pd, T) * pd, x * gamma * eos.getPsat(T), rtol=1e-9
+    )
@@ -1,6 +1,15 @@
+import pickle
+
 import numpy as np
+import pytest
 
-from Sindri.compounds import SubstanceProp, MixtureProp
+from Sindri.compounds import (
+    FluidState,
+    MixtureProp,
+    SubstanceProp,
+    SubstanceRegistry,
+    get_substance_registry,
+)
 
 
 def test_creation_substance():
@@ -106,3 +115,39 @@ def test_getMolWt():
     two = MixtureProp([one, one], [0.3, 0.7])
     mw = two.getMolWt()
     np.testing.assert_allclose(mw, 16.043, 1e-3)
+
+
+def test_registry_lookups():
+    registry = get_substance_registry()
+    methane = registry.find("methane", "CH4")
+    assert registry.find("Methane", "ch4") is methane
+    assert registry.get(methane.getSubstanceID()) is methane
+    assert registry.getByCAS(methane.CAS) is methane
+    # alias, and the substring match of the former queries
+    assert registry.find("chloroform", "CHCl3").Name == "trichloromethane (chloroform)"
+    assert registry.find("ethane", "C2H4").Name == "1,2-dibromoethane"
+    # exact matches win over substrings
+    assert registry.find("xenon", "Xe").Name == "xenon"
+    with pytest.raises(ValueError):
+        registry.find("unobtainium", "Uo")
+    with pytest.raises(ValueError):
+        registry.get(-1)
+
+
+def test_registry_columns_match_the_substances():
+    registry = get_substance_registry()
+    assert isinstance(registry, SubstanceRegistry)
+    i = list(registry.ids).index(SubstanceProp("water", "H2O").getSubstanceID())
+    water = SubstanceProp("water", "H2O")
+    np.testing.assert_allclose(registry.numbers[i, 3:5], [water.Tc, water.Pc])
+    np.testing.assert_allclose(water.Pc, 220.55e5, 1e-3)
+
+
+def test_substance_is_read_only():
+    methane = SubstanceProp("methane", "CH4")
+    with pytest.raises(AttributeError):
+        methane.Tc = 100.0
+    methane.state = FluidState.Gas
+    assert SubstanceProp("methane", "CH4").state == FluidState.Unknown
+    copy = pickle.loads(pickle.dumps(methane))
+    assert copy.Tc == methane.Tc and copy.state == FluidState.Gas
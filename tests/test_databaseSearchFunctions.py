@@ -0,0 +1,78 @@
+import shutil
+import sqlite3
+
+from Sindri.DatabaseInterface.databaseSearchFunctions import (
+    createSearchIndex,
+    getQueryBySearchNameFormulaOrCas,
+    hasSearchIndex,
+)
+
+
+def search(cursor, s, limit=200, indexed=True):
+    query, params = getQueryBySearchNameFormulaOrCas(s, limit, indexed)
+    cursor.execute(query, params)
+    return cursor.fetchall()
+
+
+def test_search_index(tmp_path):
+    filename = str(tmp_path / "database.db")
+    shutil.copyfile("db/database.db", filename)
+    cursor = sqlite3.connect(filename).cursor()
+    assert not hasSearchIndex(cursor)
+    assert createSearchIndex(cursor)
+    assert hasSearchIndex(cursor)
+
+    results = search(cursor, "methane")
+    assert results[0][:3] == ("CH4", "methane", "74-82-8")
+    assert all("methane" in r[1] for r in results)
+    assert search(cursor, "74-82-8")[0][1] == "methane"
+    assert search(cursor, "ch4")[0][1] == "methane"
+    assert search(cursor, "H2O")[0][1] == "water"
+    assert len(search(cursor, "ane", limit=5)) == 5
+
+    # shorter than a trigram: the start of the name, formula, CAS or an alias
+    assert all(r[1].startswith("me") for r in search(cursor, "me"))
+
+    # the string is a parameter, not SQL
+    assert search(cursor, "' OR 1=1 --") == []
+    assert search(cursor, '"x') == []
+    assert search(cursor, "%") == []
+
+    # the triggers keep the index up to date
+    cursor.execute("UPDATE substance SET name = 'zzmethane' WHERE cas = '74-82-8'")
+    cursor.execute(
+        "INSERT INTO substance_name_aliases"
+        " SELECT substance_id, 'swamp gas' FROM substance WHERE cas = '74-82-8'"
+    )
+    assert search(cursor, "zzmeth")[0][1] == "zzmethane"
+    assert search(cursor, "swamp")[0][1] == "zzmethane"
+    assert search(cursor, "sw")[0][1] == "zzmethane"
+    cursor.execute("DELETE FROM substance WHERE cas = '74-82-8'")
+    assert search(cursor, "zzmeth") == []
+
+    cursor.execute("SELECT count(*) FROM substance")
+    n = cursor.fetchone()[0]
+    createSearchIndex(cursor, rebuild=True)
+    cursor.execute("SELECT count(*) FROM substance_search")
+    assert cursor.fetchone()[0] == n
+
+
+def test_search_index_keeps_pending_edits_and_like_fallback(tmp_path):
+    filename = str(tmp_path / "database.db")
+    shutil.copyfile("db/database.db", filename)
+    connection = sqlite3.connect(filename)
+    cursor = connection.cursor()
+
+    # without the index, LIKE finds the same substances
+    indexed = [r[1] for r in search(cursor, "meth", indexed=False)]
+    assert createSearchIndex(cursor)
+    assert sorted(indexed) == sorted(r[1] for r in search(cursor, "meth"))
+    assert search(cursor, "methane", indexed=False)[0][1] == "methane"
+    assert search(cursor, "%", indexed=False) == []
+
+    # an existing index isn't committed again, so edits can still be discarded
+    cursor.execute("UPDATE substance SET name = 'zzmethane' WHERE cas = '74-82-8'")
+    assert createSearchIndex(cursor)
+    assert connection.in_transaction
+    connection.rollback()
+    assert search(cursor, "74-82-8")[0][1] == "methane"
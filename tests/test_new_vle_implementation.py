@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from Sindri.Factories.EOSMixFactory import createEOSMix
 from Sindri.compounds import SubstanceProp
@@ -591,3 +592,345 @@ def test_first_pure_substance_Coquelet2004():
     np.testing.assert_allclose(zvap, 0.758728, 1e-4)
     np.testing.assert_allclose(fvap, 4.04742471e05, 1e-5)
     np.testing.assert_allclose(fliq, 2.72110834e04, 1e-5)
+
+
+def test_lnphi_vector_matches_phi_i_for_all_eos():
+    from Sindri.Factories.EOSMixFactory import getEOSMixOptions
+
+    subs = [benzene, isobutanol, cyclopentane]
+    y = [0.2, 0.3, 0.5]
+    k = [[0.0, 0.01, 0.02], [0.01, 0.0, 0.03], [0.02, 0.03, 0.0]]
+    p = 0.5e6
+    t = 315
+
+    for name in getEOSMixOptions():
+        eos = createEOSMix(subs, name, k)
+        zs = eos.getZfromPT(p, t, y)
+        for z in (np.min(zs), np.max(zs)):
+            expected = [np.log(eos.getPhi_i(i, y, p, t, z)) for i in range(len(y))]
+            lnphi = eos.getLnPhiVector(y, p, t, z)
+            np.testing.assert_allclose(lnphi, expected, rtol=1e-10, atol=1e-12)
+
+
+def test_getZfromPT_batch_matches_getZLiqVap_for_all_eos():
+    from Sindri.Factories.EOSMixFactory import getEOSMixOptions
+
+    subs = [benzene, isobutanol, cyclopentane]
+    k = [[0.0, 0.01, 0.02], [0.01, 0.0, 0.03], [0.02, 0.03, 0.0]]
+    rng = np.random.default_rng(0)
+    n_points = 50
+    p = rng.uniform(1e4, 5e6, n_points)
+    t = rng.uniform(250.0, 600.0, n_points)
+    Y = rng.dirichlet(np.ones(len(subs)), n_points)
+
+    for name in getEOSMixOptions():
+        eos = createEOSMix(subs, name, k)
+        zliq, zvap = eos.getZfromPT_batch(p, t, Y)
+        expected = np.array(
+            [eos.getZLiqVap(p[i], t[i], Y[i])[:2] for i in range(n_points)]
+        )
+        np.testing.assert_allclose(zliq, expected[:, 0], rtol=1e-10)
+        np.testing.assert_allclose(zvap, expected[:, 1], rtol=1e-10)
+
+    # scalar pressure and temperature are broadcast against the compositions
+    zliq, zvap = eos.getZfromPT_batch(0.5e6, 315.0, Y)
+    expected = eos.getZLiqVap(0.5e6, 315.0, Y[0])
+    np.testing.assert_allclose([zliq[0], zvap[0]], expected[:2], rtol=1e-10)
+
+    # other lengths are not guessed
+    with pytest.raises(ValueError):
+        eos.getZfromPT_batch(p[:3], t, Y)
+    with pytest.raises(ValueError):
+        eos.getZfromPT_batch(p, t, Y[:2])
+
+
+def test_set_k_and_clone_with_match_a_new_system():
+    subs = [methane, pentane]
+    y = [0.4, 0.6]
+    k = [[0.0, 0.02], [0.02, 0.0]]
+    expected = createEOSMix(subs, eosname, k).getBubblePointPressure(y, 300.0)[1]
+
+    eos = createEOSMix(subs, eosname)
+    clone = eos.clone_with(k=k)
+    assert clone.getBubblePointPressure(y, 300.0)[1] == expected
+    assert np.all(eos.k == 0.0)
+    assert clone.substances is eos.substances
+
+    eos.set_k(k)
+    assert eos.getBubblePointPressure(y, 300.0)[1] == expected
+    with pytest.raises(ValueError):
+        eos.set_k([[0.0]])
+
+
+def test_changing_a_clone_leaves_the_original_alone():
+    eos = createEOSMix([methane, pentane], eosname)
+    eos.genDataFailures.append((0.5, "failed"))
+    eos.getBubblePointPressure([0.4, 0.6], 300.0)
+    clone = eos.clone_with()
+    assert clone.genDataFailures == [] and clone.getSolverStats() is None
+
+    clone.setAcceleration("Anderson")
+    clone.getBubblePointPressure([0.4, 0.6], 300.0)
+    clone.genDataFailures.append((0.2, "failed"))
+    assert set(eos.acceleration.values()) == {"none"}
+    assert eos.genDataFailures == [(0.5, "failed")]
+    assert eos.getSolverStats() is not clone.getSolverStats()
+
+
+def test_getLnPhiDerivatives_match_finite_differences():
+    subs = [methane, pentane]
+    y = np.array([0.3, 0.7])
+    for name in ["Peng and Robinson (1976)", "Ahlers-Gmehling (2001)"]:
+        eos = createEOSMix(subs, name, [[0.0, 0.02], [0.02, 0.0]])
+        for p, t in [(1e6, 300.0), (2e5, 400.0)]:
+            for phase in (0, 1):
+
+                def lnphi(p, t):
+                    z = eos.getZLiqVap(p, t, y)[phase]
+                    return eos.getLnPhiVector(y, p, t, z)
+
+                z = eos.getZLiqVap(p, t, y)[phase]
+                ret, dlnphidP, dlnphidT = eos.getLnPhiDerivatives(y, p, t, z)
+                np.testing.assert_allclose(ret, lnphi(p, t), rtol=1e-12)
+                hp, ht = p * 1e-6, 1e-4
+                fdp = (lnphi(p + hp, t) - lnphi(p - hp, t)) / (2 * hp)
+                fdt = (lnphi(p, t + ht) - lnphi(p, t - ht)) / (2 * ht)
+                np.testing.assert_allclose(dlnphidP, fdp, rtol=1e-6, atol=1e-14)
+                np.testing.assert_allclose(dlnphidT, fdt, rtol=1e-6, atol=1e-10)
+
+
+def test_getdLnPhidN_matches_finite_differences():
+    subs = [methane, pentane, hexane]
+    y = np.array([0.2, 0.3, 0.5])
+    k = [[0.0, 0.02, 0.01], [0.02, 0.0, 0.0], [0.01, 0.0, 0.0]]
+    # analytic second derivatives of the mixing rules, and by differences
+    for name in ["Peng and Robinson (1976)", "Ahlers-Gmehling (2001)"]:
+        eos = createEOSMix(subs, name, k)
+        for phase in (0, 1):
+            p, t = 2e6, 350.0
+            z = eos.getZLiqVap(p, t, y)[phase]
+            ret = eos.getdLnPhidN(y, p, t, z)
+            h = 1e-6
+            expected = np.empty((3, 3))
+            for j in range(3):
+                lnphi = []
+                for step in (h, -h):
+                    m = y.copy()
+                    m[j] += step
+                    w = m / np.sum(m)
+                    zw = eos.getZLiqVap(p, t, w)[phase]
+                    lnphi.append(eos.getLnPhiVector(w, p, t, zw))
+                expected[:, j] = (lnphi[0] - lnphi[1]) / (2 * h)
+            np.testing.assert_allclose(ret, expected, rtol=1e-6, atol=1e-8)
+            # Gibbs-Duhem
+            np.testing.assert_allclose(ret @ y, 0.0, atol=1e-10)
+
+
+def test_newton_saturation_solvers_match_successive_substitution():
+    subs = [methane, pentane, hexane]
+    z = [0.2, 0.3, 0.5]
+    eos = createEOSMix(subs, eosname)
+
+    for kind, var in [
+        ("BubblePointPressure", 300.0),
+        ("DewPointPressure", 300.0),
+        ("BubblePointTemperature", 1e6),
+        ("DewPointTemperature", 1e6),
+    ]:
+        expected = getattr(eos, "get" + kind + "_phi_phi")(z, var)
+        ret = getattr(eos, "get" + kind + "_newton")(z, var)
+        np.testing.assert_allclose(ret[1], expected[1], rtol=1e-9)
+        np.testing.assert_allclose(ret[0], expected[0], atol=1e-8)
+        np.testing.assert_allclose(ret[4], expected[4], rtol=1e-7)
+        stats = eos.getSolverStats()
+        assert stats.converged
+        assert stats.iterations == ret[5]
+        assert stats.time > 0.0
+
+
+def test_newton_solver_near_the_critical_region():
+    eos = createEOSMix([methane, pentane, hexane], eosname)
+    z = [0.4, 0.3, 0.3]
+    expected = eos.getBubblePointPressure_phi_phi(z, 380.0)
+
+    eos.setVLESolver("newton")
+    ret = eos.getBubblePointPressure(z, 380.0)
+    np.testing.assert_allclose(ret[1], expected[1], rtol=1e-9)
+    assert eos.getSolverStats().iterations < expected[5]
+
+    # successive substitution falls into the trivial solution K = 1 here
+    ret = eos.getBubblePointPressure(z, 400.0)
+    assert np.max(np.abs(np.log(ret[4]))) > 0.1
+
+    with pytest.raises(ValueError):
+        eos.setVLESolver("bisection")
+
+
+@pytest.mark.parametrize("method", ["GDEM", "Anderson"])
+def test_accelerated_substitution_matches_plain_substitution(method):
+    subs = [methane, pentane, hexane]
+    z = np.array([0.3, 0.3, 0.4])
+    eos = createEOSMix(subs, eosname)
+    plain = {
+        "bubbleP": eos.getBubblePointPressure(z, 380.0)[1],
+        "dewP": eos.getDewPointPressure(z, 380.0)[1],
+        "bubbleT": eos.getBubblePointTemperature(z, 3e6)[1],
+        "dewT": eos.getDewPointTemperature(z, 3e6)[1],
+    }
+    flash = eos.getFlash(z, 3e6, 400.0)
+    flash_ite = eos.getSolverStats().iterations
+    bubble_ite = eos.getBubblePointPressure(z, 380.0)[-1]
+
+    eos.setAcceleration(method)
+    np.testing.assert_allclose(
+        eos.getBubblePointPressure(z, 380.0)[1], plain["bubbleP"]
+    )
+    stats = eos.getSolverStats()
+    assert stats.converged and stats.accelerated_iterations > 0
+    assert stats.iterations < bubble_ite
+    np.testing.assert_allclose(eos.getDewPointPressure(z, 380.0)[1], plain["dewP"])
+    np.testing.assert_allclose(
+        eos.getBubblePointTemperature(z, 3e6)[1], plain["bubbleT"]
+    )
+    np.testing.assert_allclose(eos.getDewPointTemperature(z, 3e6)[1], plain["dewT"])
+    np.testing.assert_allclose(eos.getFlash(z, 3e6, 400.0)[2], flash[2])
+    assert eos.getSolverStats().iterations < flash_ite
+
+
+def test_acceleration_is_set_per_solver():
+    eos = createEOSMix([methane, pentane], eosname)
+    eos.setAcceleration("GDEM", ["flash"])
+    assert eos.acceleration["flash"] == "GDEM"
+    assert eos.acceleration["bubbleP"] == "none"
+
+    with pytest.raises(ValueError):
+        eos.setAcceleration("Aitken")
+    with pytest.raises(ValueError):
+        eos.setAcceleration("GDEM", ["bubble"])
+
+
+def test_stability_analysis_agrees_with_saturation_pressures():
+    eos = createEOSMix([methane, pentane, hexane], eosname)
+    z = np.array([0.3, 0.3, 0.4])
+    T = 400.0
+    pb = eos.getBubblePointPressure(z, T)[1]
+    pd = eos.getDewPointPressure(z, T)[1]
+
+    for P in (0.5 * pd, 1.2 * pb):
+        stable, k, tm = eos.getStabilityAnalysis(z, P, T)
+        assert stable and k is None
+        with pytest.raises(ValueError):
+            eos.getFlash(z, P, T)
+
+    P = 3e6
+    stable, k, tm = eos.getStabilityAnalysis(z, P, T)
+    assert not stable and tm < 0.0
+    x, y, v, phivap, philiq, k, ite = eos.getFlash(z, P, T)
+    assert 0.0 < v < 1.0
+    np.testing.assert_allclose(x * philiq, y * phivap, rtol=1e-6)
+
+
+def test_phase_envelope_points_are_saturation_points():
+    eos = createEOSMix([methane, pentane, hexane], eosname)
+    eos.setVLESolver("newton")
+    z = np.array([0.5, 0.3, 0.2])
+    env = eos.getPhaseEnvelope(z)
+
+    assert not env.bubble[0] and env.bubble[-1]
+    assert env.critical is not None
+    Tc, Pc = env.critical
+    assert env.getCricondenbar()[1] >= Pc
+    assert env.getCricondentherm()[0] >= Tc
+    np.testing.assert_allclose(env.P[0], 1e5)
+
+    # away from the critical point, where the saturation solvers struggle, and from
+    # the retrograde dew points
+    for i in np.nonzero(env.bubble & (env.P < 0.5 * Pc))[0][::5]:
+        P = eos.getBubblePointPressure(z, env.T[i])[1]
+        np.testing.assert_allclose(P, env.P[i], rtol=1e-8)
+    for i in np.nonzero(~env.bubble & (env.P < 0.5 * Pc))[0][::5]:
+        ret = eos.getDewPointTemperature(z, env.P[i])
+        np.testing.assert_allclose(ret[1], env.T[i], rtol=1e-8)
+        np.testing.assert_allclose(ret[4], env.K[i], rtol=1e-6)
+
+
+def test_bubble_point_warm_start():
+    eos = createEOSMix([methane, pentane], eosname)
+    x1 = np.array([0.3, 0.7])
+    x2 = np.array([0.32, 0.68])
+    ref = eos.getBubblePointTemperature(x1, 2e6)
+    cold = eos.getBubblePointTemperature(x2, 2e6)
+    warm = eos.getBubblePointTemperature(x2, 2e6, guess=(ref[4], ref[1]))
+    np.testing.assert_allclose(warm[1], cold[1], rtol=1e-10)
+    assert warm[-1] < cold[-1]
+
+
+def test_dew_point_warm_start():
+    eos = createEOSMix([methane, pentane], eosname)
+    y1 = np.array([0.8, 0.2])
+    y2 = np.array([0.801, 0.199])
+    for solver in ("successive substitution", "newton"):
+        eos.setVLESolver(solver)
+        for kind, var in [("DewPointPressure", 300.0), ("DewPointTemperature", 1e6)]:
+            get = getattr(eos, "get" + kind)
+            ref = get(y1, var)
+            cold = get(y2, var)
+            warm = get(y2, var, guess=(ref[4], ref[1]))
+            np.testing.assert_allclose(warm[1], cold[1], rtol=1e-10)
+            assert warm[-1] <= cold[-1]
+
+
+def test_newton_solver_rejects_identical_phases():
+    eos = createEOSMix([methane, pentane], eosname)
+    with pytest.raises(ValueError, match="identical"):
+        # methane is supercritical
+        eos.getBubblePointPressure_newton(np.array([1.0, 0.0]), 300.0)
+
+
+def test_binary_gen_data_reports_failures_instead_of_copying():
+    eos = createEOSMix([methane, pentane], eosname)
+    eos.setVLESolver("newton")
+    x, y, P, phiv, phil, kvec = eos.isothermalBinaryMixtureGenData(300.0)
+
+    # methane is supercritical, the bubble point curve ends near x1 = 0.85
+    assert eos.genDataFailures
+    assert all(xf > 0.8 for xf, msg in eos.genDataFailures)
+    assert len(np.unique(x)) == len(x) == len(y) == len(P)
+    # points were added near the critical point
+    assert np.sum((x > 0.8) & (x < 0.85)) > 3
+    # the data uses a looser tolerance, that matters close to the critical point
+    for i in np.nonzero(x < 0.8)[0][::5]:
+        ret = eos.getBubblePointPressure(np.array([x[i], 1.0 - x[i]]), 300.0)
+        np.testing.assert_allclose(ret[1], P[i], rtol=1e-4)
+
+    # an explicit grid isn't refined
+    x, y, P, phiv, phil, kvec = eos.isothermalBinaryMixtureGenData(
+        300.0, x=[0.1, 0.2, 0.3]
+    )
+    np.testing.assert_array_equal(x, [0.1, 0.2, 0.3])
+    assert not eos.genDataFailures
+
+
+def test_binary_plots_use_the_refined_data(monkeypatch):
+    import sys
+
+    eos = createEOSMix([methane, pentane], eosname)
+    eos.setVLESolver("newton")
+    x = eos.isothermalBinaryMixtureGenData(300.0)[0]
+    failures = eos.genDataFailures
+
+    plots = []
+
+    class Plot:
+        def __init__(self, diagtype, var, x, y, varunit, title, plottype="both"):
+            plots.append(x)
+
+        def plot(self):
+            pass
+
+    diagrams = type(sys)("VLEBinaryDiagrams")
+    diagrams.VLEBinaryMixturePlot = Plot
+    monkeypatch.setitem(sys.modules, "VLEBinaryDiagrams", diagrams)
+    eos.isothermalBinaryMixturePlot(300.0)
+    np.testing.assert_array_equal(plots[0], x)
+    assert eos.genDataFailures == failures
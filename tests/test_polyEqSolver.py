@@ -23,3 +23,36 @@ class TestCubicSolver:
         expected = np.array([1, 4, -3])
         returned = solve_cubic(*parameters)
         np.testing.assert_almost_equal(expected, returned)
+
+
+class TestMonicCubicSolver:
+    def test_three_real_roots(self):
+        # 2x^3 - 4x^2 - 22x + 24 = 0 divided by 2
+        x1, x2, x3, nroots = solve_cubic_monic(-2.0, -11.0, 12.0)
+        assert nroots == 3
+        np.testing.assert_allclose([x1, x2, x3], [-3.0, 1.0, 4.0], atol=1e-12)
+
+    def test_one_real_root(self):
+        x1, x2, x3, nroots = solve_cubic_monic(0.0, 0.0, -1.0)
+        assert nroots == 1
+        np.testing.assert_allclose(x1, 1.0, atol=1e-12)
+        assert np.isnan(x2) and np.isnan(x3)
+
+    def test_double_root(self):
+        # (x - 1)(x - 2)^2
+        x1, x2, x3, nroots = solve_cubic_monic(-5.0, 8.0, -4.0)
+        assert nroots == 3
+        np.testing.assert_allclose([x1, x2, x3], [1.0, 2.0, 2.0], atol=1e-7)
+
+    def test_matches_newton_solver(self):
+        rng = np.random.default_rng(42)
+        for _ in range(100):
+            roots = np.sort(rng.uniform(-2.0, 2.0, 3))
+            a2 = -np.sum(roots)
+            a1 = roots[0] * roots[1] + roots[0] * roots[2] + roots[1] * roots[2]
+            a0 = -np.prod(roots)
+            x1, x2, x3, nroots = solve_cubic_monic(a2, a1, a0)
+            assert nroots == 3
+            np.testing.assert_allclose(
+                [x1, x2, x3], np.sort(solve_cubic(1.0, a2, a1, a0)), atol=1e-6
+            )